@@ -969,178 +969,16 @@ Generado por: CONSORCIO DEJ
 # =====================
 # FUNCIONES DE CÁLCULO
 # =====================
-def calcular_propiedades_concreto(fc):
-    Ec = 15000 * sqrt(fc)
-    ecu = 0.003
-    fr = 2 * sqrt(fc)
-    if fc <= 280:
-        beta1 = 0.85
-    else:
-        beta1 = 0.85 - 0.05 * ((fc - 280) / 70)
-        beta1 = max(beta1, 0.65)
-    return {'Ec': Ec, 'ecu': ecu, 'fr': fr, 'beta1': beta1}
-
-def calcular_propiedades_acero(fy):
-    Es = 2000000
-    ey = fy / Es
-    return {'Es': Es, 'ey': ey}
-
-def calcular_predimensionamiento(L_viga, num_pisos, num_vanos, CM, CV, fc, fy):
-    h_losa = max(L_viga / 25, 0.17)
-    d_viga = L_viga * 100 / 10
-    b_viga = max(0.3 * d_viga, 25)
-    P_servicio = num_pisos * (CM + 0.25*CV) * (L_viga*num_vanos)**2
-    P_mayorada = num_pisos * (1.2*CM + 1.6*CV) * (L_viga*num_vanos)**2
-    A_col_servicio = P_servicio / (0.45*fc)
-    A_col_resistencia = P_mayorada / (0.65*0.8*fc)
-    A_columna = max(A_col_servicio, A_col_resistencia)
-    lado_columna = sqrt(A_columna)
-    return {'h_losa': h_losa, 'd_viga': d_viga, 'b_viga': b_viga, 'lado_columna': lado_columna, 'A_columna': A_columna}
-
-def calcular_diseno_flexion(fc, fy, b, d, Mu):
-    """
-    Calcula el diseño por flexión según ACI 318-2025
-    """
-    # Calcular β1
-    if fc <= 280:
-        beta1 = 0.85
-    else:
-        beta1 = 0.85 - 0.05 * ((fc - 280) / 70)
-        beta1 = max(beta1, 0.65)
-    
-    # Cuantía balanceada
-    rho_b = 0.85 * beta1 * (fc / fy) * (6000 / (6000 + fy))
-    
-    # Cuantía mínima
-    rho_min = max(0.8 * sqrt(fc) / fy, 14 / fy)
-    
-    # Cuantía máxima
-    rho_max = 0.75 * rho_b
-    
-    # Asumir cuantía inicial (entre mínima y máxima)
-    rho = (rho_min + rho_max) / 2
-    
-    # Calcular área de acero
-    As = rho * b * d
-    
-    # Calcular profundidad del bloque equivalente
-    a = As * fy / (0.85 * fc * b)
-    
-    # Calcular momento resistente
-    Mn = As * fy * (d - a/2)
-    phi = 0.9
-    phiMn = phi * Mn
-    
-    return {
-        'beta1': beta1,
-        'rho_b': rho_b,
-        'rho_min': rho_min,
-        'rho_max': rho_max,
-        'rho': rho,
-        'As': As,
-        'a': a,
-        'Mn': Mn,
-        'phiMn': phiMn,
-        'verificacion': phiMn >= Mu
-    }
-
-def calcular_diseno_cortante(fc, fy, bw, d, Vu):
-    """
-    Calcula el diseño por cortante según ACI 318-2025
-    """
-    # Resistencia del concreto
-    Vc = 0.53 * sqrt(fc) * bw * d
-    
-    # Factor phi para cortante
-    phi = 0.75
-    
-    # Verificar si se necesita refuerzo
-    if Vu <= phi * Vc:
-        Vs_requerido = 0
-        Av_s_requerido = 0
-        s_max = d/2
-    else:
-        Vs_requerido = (Vu / phi) - Vc
-        # Calcular área de estribos requerida (asumiendo estribos #3)
-        Av = 0.71  # cm² para estribo #3
-        s_requerido = Av * fy * d / Vs_requerido
-        s_max = min(d/2, 60)  # cm
-        
-        if s_requerido > s_max:
-            # Usar estribos más grandes o más separados
-            Av_s_requerido = Vs_requerido / (fy * d)
-        else:
-            Av_s_requerido = Av / s_requerido
-    
-    return {
-        'Vc': Vc,
-        'Vs_requerido': Vs_requerido,
-        'Av_s_requerido': Av_s_requerido,
-        's_max': s_max,
-        'phi': phi,
-        'verificacion': Vu <= phi * (Vc + Vs_requerido) if Vs_requerido > 0 else Vu <= phi * Vc
-    }
-
-def calcular_diseno_columna(fc, fy, Ag, Ast, Pu):
-    """
-    Calcula el diseño de columna según ACI 318-2025
-    """
-    # Resistencia nominal
-    Pn = 0.80 * (0.85 * fc * (Ag - Ast) + fy * Ast)
-    
-    # Factor phi para columnas con estribos
-    phi = 0.65
-    
-    # Resistencia de diseño
-    phiPn = phi * Pn
-    
-    return {
-        'Pn': Pn,
-        'phiPn': phiPn,
-        'phi': phi,
-        'verificacion': Pu <= phiPn
-    }
-
-def calcular_analisis_sismico(zona_sismica, tipo_suelo, factor_importancia, peso_total):
-    """
-    Calcula análisis sísmico básico según E.030
-    """
-    # Factores según zona sísmica
-    factores_zona = {
-        "Z1": 0.10,
-        "Z2": 0.15, 
-        "Z3": 0.25,
-        "Z4": 0.35
-    }
-    
-    # Factores según tipo de suelo
-    factores_suelo = {
-        "S1": 0.8,
-        "S2": 1.0,
-        "S3": 1.2,
-        "S4": 1.4
-    }
-    
-    Z = factores_zona.get(zona_sismica, 0.25)
-    S = factores_suelo.get(tipo_suelo, 1.0)
-    U = factor_importancia
-    
-    # Coeficiente sísmico simplificado
-    C = 2.5  # Valor típico para estructuras regulares
-    R = 7.0  # Factor de reducción para pórticos
-    
-    # Cortante basal
-    V = (Z * U * C * S / R) * peso_total * 1000  # Convertir a kg
-    
-    return {
-        'Z': Z,
-        'S': S,
-        'U': U,
-        'C': C,
-        'R': R,
-        'V': V,
-        'cortante_basal_ton': V / 1000
-    }
+from calculos_estructurales import (
+    calcular_propiedades_concreto,
+    calcular_propiedades_acero,
+    calcular_predimensionamiento,
+    calcular_diseno_flexion,
+    calcular_diseno_cortante,
+    calcular_diseno_columna,
+    calcular_analisis_sismico,
+)
+from ayudas_diseno import curva_diseno
 
 # =====================
 # INTERFAZ STREAMLIT
@@ -2160,6 +1998,27 @@ Plan: Gratuito
             st.latex(r"\rho_{max} = 0.75\rho_b")
             st.latex(r"a = \frac{A_s f_y}{0.85f'_c b}")
             st.latex(r"\phi M_n = \phi A_s f_y \left(d - \frac{a}{2}\right)")
+            st.latex(r"R_u = \frac{M_u}{bd^2} = \phi \rho f_y \left(1 - 0.59\frac{\rho f_y}{f'_c}\right)")
+            
+            # Curva de diseño Ru–ρ desde las tablas precalculadas
+            curva = curva_diseno(f_c, f_y)
+            if PLOTLY_AVAILABLE:
+                fig = go.Figure()
+                fig.add_trace(go.Scatter(x=curva['rho'], y=curva['Ru'], mode='lines',
+                                         name=f"f'c = {f_c:.0f}, fy = {f_y:.0f}",
+                                         line=dict(color='#2E8B57', width=3)))
+                for clave, nombre, color in (('rho_min', 'ρmin', '#4169E1'),
+                                             ('rho_max', 'ρmax', '#DC143C'),
+                                             ('rho_b', 'ρb', '#FFD700')):
+                    fig.add_vline(x=float(curva[clave]), line_dash='dash', line_color=color,
+                                  annotation_text=nombre)
+                fig.update_layout(
+                    title="Curva de Diseño Ru vs ρ",
+                    xaxis_title="Cuantía ρ",
+                    yaxis_title="Ru (kg/cm²)",
+                    height=400
+                )
+                st.plotly_chart(fig, use_container_width=True)
         
         with tab3:
             st.subheader("🔧 Diseño por Cortante (ACI 318-2025 - Capítulo 22)")
@@ -37,127 +37,8 @@ except ImportError:
     REPORTLAB_AVAILABLE = False
     st.warning("⚠️ ReportLab no está instalado. La generación de PDFs no estará disponible.")
 
-# Función para calcular diseño del fuste del muro
-def calcular_diseno_fuste(resultados, datos_entrada):
-    """
-    Calcula el diseño y verificación del fuste del muro según PARTE 2.2.py
-    """
-    # Datos del fuste
-    h1 = datos_entrada['h1']
-    gamma_relleno = datos_entrada['gamma_relleno']
-    phi_relleno = datos_entrada['phi_relleno']
-    cohesion = datos_entrada['cohesion']
-    Df = datos_entrada['Df']
-    fc = datos_entrada['fc']
-    fy = datos_entrada['fy']
-    b = resultados['b']
-    
-    # 1. Cálculo del coeficiente pasivo
-    phi_rad = math.radians(phi_relleno)
-    kp = (1 + math.sin(phi_rad)) / (1 - math.sin(phi_rad))
-    
-    # 2. Empuje pasivo en el intradós
-    Ep = 0.5 * kp * (gamma_relleno/1000) * Df**2 + 2 * cohesion * Df * math.sqrt(kp)
-    Ep_kg_m = Ep * 1000  # Convertir a kg/m
-    
-    # 3. Altura de aplicación del empuje pasivo
-    yt = Df / 3
-    
-    # 4. Momentos volcadores y estabilizadores
-    # Empuje activo total
-    ka = resultados['ka']
-    Ea_relleno = 0.5 * ka * (gamma_relleno/1000) * h1**2
-    Ea_sobrecarga = ka * (datos_entrada['qsc']/1000) * h1
-    Ea_total = Ea_relleno + Ea_sobrecarga
-    
-    # Momentos volcadores
-    Mvol_relleno = Ea_relleno * h1 / 3
-    Mvol_sobrecarga = Ea_sobrecarga * h1 / 2
-    Mvol_total = Mvol_relleno + Mvol_sobrecarga
-    
-    # Momentos estabilizadores (simplificado)
-    W_muro = b * h1 * (datos_entrada['gamma_concreto']/1000)
-    W_zapata = resultados['Bz'] * resultados['hz'] * (datos_entrada['gamma_concreto']/1000)
-    W_relleno = resultados['t'] * h1 * (gamma_relleno/1000)
-    
-    # Brazos de momento
-    x_muro = resultados['r'] + b/2
-    x_zapata = resultados['Bz']/2
-    x_relleno = resultados['r'] + b + resultados['t']/2
-    
-    Mr_muro = W_muro * x_muro
-    Mr_zapata = W_zapata * x_zapata
-    Mr_relleno = W_relleno * x_relleno
-    Mr_pasivo = Ep * yt
-    Mesta_total = Mr_muro + Mr_zapata + Mr_relleno + Mr_pasivo
-    
-    # 5. Factores de seguridad
-    FSv = Mesta_total / Mvol_total
-    FSd = (math.tan(phi_rad) * (W_muro + W_zapata + W_relleno) + Ep) / Ea_total
-    
-    # 6. Ubicación de la resultante y excentricidad
-    W_total = W_muro + W_zapata + W_relleno
-    sum_momentos = Mr_muro + Mr_zapata + Mr_relleno
-    x_barra = sum_momentos / W_total
-    e = abs(x_barra - resultados['Bz']/2)
-    
-    # 7. Cálculo del peralte efectivo
-    # Momento de diseño
-    Mu = 1.4 * Mvol_total  # Factor de carga
-    
-    # Resistencia del concreto
-    fc_kg_cm2 = fc
-    fy_kg_cm2 = fy
-    
-    # Peralte efectivo requerido
-    dreq = math.sqrt(Mu * 100000 / (0.9 * 0.85 * fc_kg_cm2 * b * 100 * 0.59))
-    hreq = dreq + 9  # Recubrimiento + diámetro de barra
-    dreal = resultados['hz'] * 100 - 9  # Peralte real en cm
-    
-    # 8. Área de acero
-    As = Mu * 100000 / (0.9 * fy_kg_cm2 * dreal)
-    Asmin = 0.0033 * b * 100 * dreal  # Cuantía mínima
-    
-    # 9. Distribución del acero
-    # Usar barras de 5/8" (1.98 cm²)
-    area_barra = 1.98
-    num_barras = math.ceil(As / area_barra)
-    As_proporcionado = num_barras * area_barra
-    separacion = (b * 100 - 6) / (num_barras - 1)  # 3cm de recubrimiento
-    
-    # 10. Verificación de cuantías
-    rho_real = As_proporcionado / (b * 100 * dreal)
-    rho_min = 0.0033
-    rho_max = 0.0163
-    
-    # 11. Acero por retracción y temperatura
-    As_retraccion = 0.002 * b * 100 * resultados['hz'] * 100
-    num_barras_retraccion = math.ceil(As_retraccion / 1.27)  # Barras de 1/2"
-    As_retraccion_proporcionado = num_barras_retraccion * 1.27
-    
-    return {
-        'kp': kp,
-        'Ep_kg_m': Ep_kg_m,
-        'yt': yt,
-        'Mvol_total': Mvol_total,
-        'Mesta_total': Mesta_total,
-        'FSv': FSv,
-        'FSd': FSd,
-        'x_barra': x_barra,
-        'e': e,
-        'dreq': dreq,
-        'hreq': hreq,
-        'dreal': dreal,
-        'As': As,
-        'Asmin': Asmin,
-        'num_barras': num_barras,
-        'As_proporcionado': As_proporcionado,
-        'separacion': separacion,
-        'rho_real': rho_real,
-        'As_retraccion': As_retraccion,
-        'num_barras_retraccion': num_barras_retraccion,
-        'As_retraccion_proporcionado': As_retraccion_proporcionado
-    }
+# Diseño del fuste y estabilidad del muro (motor sin interfaz en muro_contencion.py)
+from muro_contencion import analizar_muro, calcular_diseno_fuste, coeficiente_sismico_zona
 
 # Función para generar PDF del reporte
 def generar_pdf_reportlab(resultados, datos_entrada, diseno_fuste, plan="premium"):
@@ -1123,103 +1004,35 @@ else:
                 fc = st.number_input("Resistencia del concreto (kg/cm²)", value=210, step=10)
                 fy = st.number_input("Resistencia del acero (kg/cm²)", value=4200, step=100)
             
+            st.subheader("Sismo")
+            modo_sismico = st.checkbox("Empuje sísmico (Mononobe-Okabe)", help="Coulomb con fricción muro-relleno y pendiente del relleno; kh = Z/2 según la zona sísmica E.030")
+            kh, kv, delta, beta = 0.0, 0.0, 0.0, 0.0
+            if modo_sismico:
+                col1, col2 = st.columns(2)
+                with col1:
+                    zona_sismica = st.selectbox("Zona sísmica", ["Z1", "Z2", "Z3", "Z4"], index=3)
+                    kh = coeficiente_sismico_zona(zona_sismica)
+                    kv = st.number_input("Coeficiente sísmico vertical kv", value=0.0, step=0.05)
+                    st.info(f"kh = Z/2 = {kh:.3f}")
+                with col2:
+                    delta = st.number_input("Fricción muro-relleno δ (°)", value=float(2 * phi_relleno / 3), step=1.0)
+                    beta = st.number_input("Pendiente del relleno β (°)", value=0.0, step=1.0)
+            
             if st.button("🔬 Ejecutar Análisis Completo", type="primary"):
-                # Cálculos completos basados en TAREA_DE_PROGRAMACION2.py
-                
-                # Coeficiente de empuje activo (fórmula correcta de Rankine)
-                phi_relleno_rad = math.radians(phi_relleno)
-                ka = math.tan(math.radians(45 - phi_relleno/2))**2
-                
-                # Altura equivalente por sobrecarga
-                hs = qsc / gamma_relleno
-                
-                # Factor kc para concreto
-                kc = 14.28  # Para fc = 210 kg/cm²
-                
-                # Dimensiones calculadas
-                Bz = (h1 + Df) * (1 + hs/(h1 + Df)) * math.sqrt(ka)
-                Bz = round(Bz, 2)
-                
-                hz = math.sqrt(((h1 + Df)**2 * (1 + hs/(h1 + Df))) / (9 * kc))
-                hz = round(hz * 100) / 100
-                hz = max(0.4, hz)
-                
-                b = math.sqrt(((h1 + hm)**2 * (1 + hs/(h1 + hm))) / (10 * kc))
-                b = round(b * 100) / 100
-                b = max(0.35, b)
-                
-                r = (2 * Bz - 3 * b) / 6
-                r = round(r * 100) / 100
-                r = max(0.7, r)
-                
-                t = Bz - r - b
-                t = round(t * 100) / 100
-                
-                # Cálculos de estabilidad completos (basados en AVANCE2.PY)
-                
-                # 1. Empujes activos
-                Ea_relleno = 0.5 * ka * (gamma_relleno/1000) * h1**2
-                Ea_sobrecarga = ka * (qsc/1000) * h1  # Convertir kg/m² a tn/m²
-                Ea_total = Ea_relleno + Ea_sobrecarga
-                
-                # 2. Empuje pasivo (si aplica)
-                phi_cimentacion_rad = math.radians(phi_cimentacion)
-                kp = math.tan(math.radians(45 + phi_cimentacion/2))**2
-                Ep = 0.5 * kp * (gamma_cimentacion/1000) * Df**2
-                
-                # 3. Pesos de cada elemento
-                W_muro = b * h1 * (gamma_concreto/1000)
-                W_zapata = Bz * hz * (gamma_concreto/1000)
-                W_relleno = t * h1 * (gamma_relleno/1000)
-                
-                # 4. Posiciones de los pesos (brazos de momento)
-                x_muro = r + b/2
-                x_zapata = Bz/2
-                x_relleno = r + b + t/2
-                
-                # 5. Momentos estabilizadores
-                Mr_muro = W_muro * x_muro
-                Mr_zapata = W_zapata * x_zapata
-                Mr_relleno = W_relleno * x_relleno
-                Mr_pasivo = Ep * Df/3
-                M_estabilizador = Mr_muro + Mr_zapata + Mr_relleno + Mr_pasivo
-                
-                # 6. Momentos volcadores
-                Mv_relleno = Ea_relleno * h1/3
-                Mv_sobrecarga = Ea_sobrecarga * h1/2
-                M_volcador = Mv_relleno + Mv_sobrecarga
-                
-                # 7. Factor de seguridad al volcamiento
-                FS_volcamiento = M_estabilizador / M_volcador
-                
-                # 8. Verificación al deslizamiento
-                mu = math.tan(phi_cimentacion_rad)  # Coeficiente de fricción
-                Fr_friccion = mu * (W_muro + W_zapata + W_relleno)
-                Fr_pasivo = Ep
-                Fr_total = Fr_friccion + Fr_pasivo
-                Fd_total = Ea_total
-                FS_deslizamiento = Fr_total / Fd_total
-                
-                # 9. Verificación de presiones sobre el suelo
-                W_total = W_muro + W_zapata + W_relleno
-                
-                # Posición de la resultante vertical
-                sum_momentos_verticales = Mr_muro + Mr_zapata + Mr_relleno
-                x_barra = sum_momentos_verticales / W_total
-                
-                # Excentricidad
-                e = abs(x_barra - Bz/2)
-                
-                # Presiones máxima y mínima
-                q_max = (W_total / Bz) * (1 + 6*e/Bz)
-                q_min = (W_total / Bz) * (1 - 6*e/Bz)
-                
-                # Verificar si hay tensiones
-                tension = q_min < 0
-                
-                # Convertir a kg/cm²
-                q_max_kg_cm2 = q_max * 0.1  # tn/m² a kg/cm²
-                q_min_kg_cm2 = q_min * 0.1
+                # Cálculos completos basados en TAREA_DE_PROGRAMACION2.py y AVANCE2.PY
+                # (motor vectorizado en muro_contencion.py; aquí se evalúa un solo caso)
+                muro = analizar_muro(h1, Df, hm, gamma_relleno, phi_relleno, gamma_cimentacion, phi_cimentacion,
+                                     cohesion, qsc, fc, fy, sigma_adm, gamma_concreto, kh=kh, kv=kv, delta=delta,
+                                     beta=beta)
+                (ka, kp, hs, Bz, hz, b, r, t, Ea_relleno, Ea_sobrecarga, Ea_total, Ep, W_muro, W_zapata, W_relleno,
+                 W_total, M_volcador, M_estabilizador, FS_volcamiento, FS_deslizamiento, q_max_kg_cm2, q_min_kg_cm2,
+                 e) = (float(muro[clave][0]) for clave in (
+                    'ka', 'kp', 'hs', 'Bz', 'hz', 'b', 'r', 't', 'Ea_relleno', 'Ea_sobrecarga', 'Ea_total', 'Ep',
+                    'W_muro', 'W_zapata', 'W_relleno', 'W_total', 'M_volcador', 'M_estabilizador', 'FS_volcamiento',
+                    'FS_deslizamiento', 'q_max_kg_cm2', 'q_min_kg_cm2', 'e'))
+                tension = bool(muro['tension'][0])
+                kae, Ea_sismico, M_sismico_fuste = (float(muro[clave][0]) for clave in ('kae', 'Ea_sismico',
+                                                                                         'M_sismico_fuste'))
                 
                 # Crear diccionario con datos de entrada para el diseño del fuste
                 datos_entrada = {
@@ -1235,7 +1048,8 @@ else:
                     'fc': fc,
                     'fy': fy,
                     'qsc': qsc,
-                    'hm': hm
+                    'hm': hm,
+                    'delta': delta
                 }
                 
                 # Calcular diseño del fuste
@@ -1267,7 +1081,9 @@ else:
                     'q_max_kg_cm2': q_max_kg_cm2,
                     'q_min_kg_cm2': q_min_kg_cm2,
                     'e': e,
-                    'tension': tension
+                    'tension': tension,
+                    'Ea_sismico': Ea_sismico,
+                    'M_sismico_fuste': M_sismico_fuste
                 }
                 
                 diseno_fuste = calcular_diseno_fuste(resultados_completos, datos_entrada)
@@ -1333,6 +1149,17 @@ else:
                     st.metric("Presión Máxima", f"{q_max_kg_cm2:.2f} kg/cm²")
                     st.metric("Excentricidad", f"{e:.3f} m")
                 
+                if modo_sismico:
+                    col1, col2, col3 = st.columns(3)
+                    with col1:
+                        st.metric("Coeficiente KAE", f"{kae:.3f}")
+                    with col2:
+                        st.metric("Incremento Dinámico", f"{Ea_sismico:.2f} tn/m", help="Aplicado a 0.6·h1")
+                    with col3:
+                        st.metric("Fuerza de Inercia", f"{float(muro['F_inercia'][0]):.2f} tn/m")
+                    if np.isnan(kae):
+                        st.error("⚠️ Sin equilibrio de Mononobe-Okabe: φ < β + atan(kh/(1-kv))")
+                
                 # Análisis de estabilidad completo
                 st.subheader("🔍 Análisis de Estabilidad Completo")
                 
@@ -0,0 +1,349 @@
+"""
+Análisis Pushover - CONSORCIO DEJ
+Análisis estático no lineal evento a evento con rótulas plásticas concentradas,
+curva de capacidad y punto de desempeño con el espectro E.030
+Unidades internas: kg, cm
+"""
+
+import numpy as np
+
+from calculos_estructurales import (
+    calcular_diseno_flexion,
+    calcular_diseno_columna,
+    calcular_propiedades_concreto,
+    calcular_analisis_sismico,
+)
+from modelo_portico import (
+    COLUMNA,
+    VIGA,
+    rigidez_elementos,
+    ensamblar_rigidez,
+    transformacion,
+    cargas_gravedad,
+    cargas_laterales,
+    fuerzas_elementos,
+    desplazamientos_piso,
+    gdl_techo,
+)
+
+G = 981.0  # cm/s²
+
+# Periodos Tp y TL por tipo de suelo (E.030-2018, Tabla N° 4)
+PERIODOS_SUELO = {
+    "S1": (0.4, 2.5),
+    "S2": (0.6, 2.0),
+    "S3": (1.0, 1.6),
+    "S4": (1.0, 1.6),
+}
+
+
+def momentos_plasticos_portico(portico, fc, fy, P_columnas=None, cuantia_columna=0.01, recubrimiento=6.0):
+    """
+    Momentos plásticos por elemento a partir del diseño de secciones de la app
+
+    Vigas: Mn de calcular_diseno_flexion con d = h - recubrimiento
+    Columnas: diagrama P-M simplificado con acero simétrico (cuantia_columna),
+    anclado en Pn de calcular_diseno_columna
+    P_columnas: Carga axial de compresión por elemento (kg), p. ej. de gravedad
+    Retorna un arreglo (n_el, 2) con Mp en cada extremo (kg·cm)
+    """
+    tipo = portico['tipo']
+    b = portico['b']
+    h = portico['h']
+    d = h - recubrimiento
+    Mp = np.zeros(len(tipo))
+
+    # 1. Vigas: se evalúa la función escalar una vez por sección distinta
+    es_viga = tipo == VIGA
+    secciones, inversa = np.unique(np.column_stack([b[es_viga], d[es_viga]]), axis=0, return_inverse=True)
+    Mn_seccion = np.array([calcular_diseno_flexion(fc, fy, bi, di, 0)['Mn'] for bi, di in secciones])
+    Mp[es_viga] = Mn_seccion[inversa.ravel()]
+
+    # 2. Columnas: acero simétrico en dos caras
+    es_col = tipo == COLUMNA
+    bc, hc, dc = b[es_col], h[es_col], d[es_col]
+    Ag = bc * hc
+    Ast = cuantia_columna * Ag
+    As = Ast / 2
+    P = np.zeros(es_col.sum()) if P_columnas is None else np.clip(np.asarray(P_columnas, dtype=float)[es_col], 0, None)
+    Pn = np.array([calcular_diseno_columna(fc, fy, ag, ast, 0)['Pn'] for ag, ast in zip(Ag, Ast)])
+    beta1 = calcular_propiedades_concreto(fc)['beta1']
+
+    # Flexión pura y punto balanceado
+    a0 = As * fy / (0.85 * fc * bc)
+    M0 = As * fy * (dc - a0 / 2)
+    cb = 6000 / (6000 + fy) * dc
+    ab = beta1 * cb
+    Pb = 0.85 * fc * bc * ab
+    Mb = Pb * (hc / 2 - ab / 2) + As * fy * (dc - recubrimiento)
+
+    # Tramo controlado por tracción (acero en compresión fluyendo) y tramo lineal hasta Pn
+    a = P / (0.85 * fc * bc)
+    M_traccion = np.maximum(P * (hc / 2 - a / 2) + As * fy * (dc - recubrimiento), M0)
+    M_compresion = Mb * np.clip((Pn - P) / (Pn - Pb), 0, 1)
+    Mp[es_col] = np.where(P <= Pb, M_traccion, M_compresion)
+
+    return np.repeat(Mp[:, None], 2, axis=1)
+
+
+def patron_cargas_laterales(portico, pesos_piso, exponente=1.0):
+    """
+    Distribución de fuerzas laterales en altura según E.030: Fi ∝ Pi·hi^k,
+    normalizada para que la suma (cortante basal) sea 1
+    """
+    pesos_piso = np.asarray(pesos_piso, dtype=float)
+    alturas = portico['coords'][:, 1].max() * np.arange(1, portico['num_pisos'] + 1) / portico['num_pisos']
+    f = pesos_piso * alturas**exponente
+    return f / f.sum()
+
+
+def _vector_liberacion(portico, e, k_e, r):
+    """Vector global (reducido) de la actualización de rango uno al liberar el GDL local r"""
+    T = transformacion(portico['cos'][e], portico['sin'][e])
+    v = T.T @ k_e[:, r]
+    u = np.zeros(portico['patron']['n'])
+    gdl = portico['gdl_red'][e]
+    libres = gdl >= 0
+    np.add.at(u, gdl[libres], v[libres])
+    return u
+
+
+def calcular_pushover(portico, Mp, patron, w_vigas=0.0, desplazamiento_max=None, max_eventos=None,
+                      max_actualizaciones=None, tolerancia_mecanismo=1e-4):
+    """
+    Análisis pushover evento a evento con rótulas elastoplásticas en los extremos
+
+    Cada rótula libera el giro de un extremo, lo que modifica la rigidez global
+    con una actualización de rango uno. La matriz inicial se invierte una sola vez
+    y las rótulas se incorporan mediante la identidad de Woodbury; si se acumulan
+    más de max_actualizaciones, se reensambla y refactoriza la matriz.
+
+    Mp: Momentos plásticos (kg·cm), forma (n_el,) o (n_el, 2)
+    patron: Fuerzas laterales por piso normalizadas (suma = 1)
+    w_vigas: Carga de gravedad en vigas (kg/m) aplicada antes del empuje
+    desplazamiento_max: Desplazamiento de techo límite (cm); por defecto 4% de la altura
+    """
+    n_el = len(portico['tipo'])
+    Mp = np.broadcast_to(np.asarray(Mp, dtype=float).reshape(n_el, -1), (n_el, 2)).copy()
+    altura = portico['coords'][:, 1].max()
+    if desplazamiento_max is None:
+        desplazamiento_max = 0.04 * altura
+    if max_eventos is None:
+        max_eventos = 2 * n_el + 1
+    n = portico['patron']['n']
+    if max_actualizaciones is None:
+        max_actualizaciones = max(n // 4, 20)
+    techo = gdl_techo(portico)
+
+    # 1. Estado inicial: rigidez elástica y cargas de gravedad
+    k_local = rigidez_elementos(portico)
+    K_inv = np.linalg.inv(ensamblar_rigidez(portico, k_local))
+    F_grav, f_emp = cargas_gravedad(portico, w_vigas)
+    u = K_inv @ F_grav
+    fuerzas = fuerzas_elementos(portico, u, k_local, f_emp)
+    M = fuerzas[:, [2, 5]].copy()
+    rotula = np.zeros((n_el, 2), dtype=bool)
+
+    P_lat = cargas_laterales(portico, patron)
+    U = np.zeros((n, 0))       # Vectores de actualización
+    Z = np.zeros((n, 0))       # K0⁻¹·U
+    C = np.zeros((0, 0))       # Matriz de capacitancia
+
+    V_total = 0.0
+    curva_V = [0.0]
+    curva_D = [u[techo]]
+    secuencia = []
+    mecanismo = False
+    rigidez_inicial = None
+
+    for paso in range(1, max_eventos + 1):
+        # 2. Respuesta incremental para la carga lateral unitaria
+        du = K_inv @ P_lat
+        if U.shape[1] > 0:
+            try:
+                du = du - Z @ np.linalg.solve(C, U.T @ du)
+            except np.linalg.LinAlgError:
+                mecanismo = True
+                break
+        df = fuerzas_elementos(portico, du, k_local)
+        dM = df[:, [2, 5]]
+
+        rigidez_techo = 1.0 / du[techo] if du[techo] > 0 else 0.0
+        flexibilidad = np.abs(du).max()
+        if rigidez_inicial is None:
+            rigidez_inicial = rigidez_techo
+            flexibilidad_inicial = flexibilidad
+        if rigidez_techo <= tolerancia_mecanismo * rigidez_inicial or flexibilidad * tolerancia_mecanismo > flexibilidad_inicial:
+            mecanismo = True
+            break
+
+        # 3. Factor de carga al siguiente evento
+        escala = np.abs(Mp).max() * 1e-12
+        activo = ~rotula & (np.abs(dM) > escala)
+        lam = np.full((n_el, 2), np.inf)
+        objetivo = np.sign(dM) * Mp
+        lam[activo] = (objetivo[activo] - M[activo]) / dM[activo]
+        lam[lam < 0] = 0.0
+        lam_evento = lam.min()
+        lam_limite = (desplazamiento_max - u[techo]) / du[techo]
+        if lam_limite <= lam_evento:
+            u = u + lam_limite * du
+            M = M + lam_limite * dM
+            V_total += lam_limite
+            curva_V.append(V_total)
+            curva_D.append(u[techo])
+            break
+
+        u = u + lam_evento * du
+        M = M + lam_evento * dM
+        V_total += lam_evento
+        curva_V.append(V_total)
+        curva_D.append(u[techo])
+
+        # 4. Formación de rótulas (todas las que alcanzan Mp en este evento)
+        nuevas = np.argwhere(lam <= lam_evento * (1 + 1e-9) + 1e-12)
+        for e, extremo in nuevas:
+            r = 2 if extremo == 0 else 5
+            k_e = k_local[e].copy()
+            if k_e[r, r] <= 0:
+                continue
+            u_vec = _vector_liberacion(portico, e, k_e, r)
+            z = K_inv @ u_vec
+            fila = U.T @ z
+            # det(K_nuevo)/det(K_actual) = 1 - uᵀ·K⁻¹·u / k_rr; si se anula, se forma un mecanismo
+            w = z - Z @ np.linalg.solve(C, fila) if U.shape[1] > 0 else z
+            if 1 - u_vec @ w / k_e[r, r] < tolerancia_mecanismo:
+                mecanismo = True
+            k_local[e] = k_e - np.outer(k_e[:, r], k_e[r, :]) / k_e[r, r]
+            # Capacitancia: S⁻¹ + Uᵀ·K0⁻¹·U con S = -1/k_rr
+            C = np.block([[C, fila[:, None]], [fila[None, :], np.array([[-k_e[r, r] + u_vec @ z]])]])
+            U = np.column_stack([U, u_vec])
+            Z = np.column_stack([Z, z])
+            rotula[e, extremo] = True
+            M[e, extremo] = np.sign(M[e, extremo]) * Mp[e, extremo]
+            secuencia.append({
+                'paso': paso,
+                'elemento': int(e),
+                'extremo': 'i' if extremo == 0 else 'j',
+                'tipo': 'columna' if portico['tipo'][e] == COLUMNA else 'viga',
+                'piso': int(portico['piso'][e]),
+                'V': V_total,
+                'desplazamiento': u[techo],
+            })
+            if mecanismo:
+                break
+        if mecanismo:
+            break
+
+        # 5. Refactorización parcial cuando se acumulan muchas actualizaciones
+        if U.shape[1] >= max_actualizaciones:
+            try:
+                K_inv = np.linalg.inv(ensamblar_rigidez(portico, k_local))
+            except np.linalg.LinAlgError:
+                mecanismo = True
+                break
+            U = np.zeros((n, 0))
+            Z = np.zeros((n, 0))
+            C = np.zeros((0, 0))
+
+    return {
+        'V': np.array(curva_V),
+        'desplazamiento': np.array(curva_D),
+        'secuencia': secuencia,
+        'rotulas': rotula,
+        'mecanismo': mecanismo,
+        'V_max': max(curva_V),
+        'desplazamientos_piso': desplazamientos_piso(portico, u),
+    }
+
+
+def espectro_e030(T, zona_sismica, tipo_suelo, factor_importancia, R=1.0):
+    """
+    Aceleración espectral Sa = Z·U·C·S/R·g (cm/s²) para periodos T (s)
+    Z y S se toman de calcular_analisis_sismico
+    """
+    sismo = calcular_analisis_sismico(zona_sismica, tipo_suelo, factor_importancia, 1.0)
+    Tp, TL = PERIODOS_SUELO.get(tipo_suelo, PERIODOS_SUELO["S2"])
+    T = np.asarray(T, dtype=float)
+    C = np.where(T < Tp, 2.5, np.where(T < TL, 2.5 * Tp / np.maximum(T, 1e-9),
+                                       2.5 * Tp * TL / np.maximum(T, 1e-9)**2))
+    return sismo['Z'] * sismo['U'] * C * sismo['S'] / R * G
+
+
+def calcular_punto_desempeno(portico, pushover, pesos_piso, forma_modal, zona_sismica, tipo_suelo, factor_importancia):
+    """
+    Punto de desempeño por el método N2 (sistema equivalente de 1 GDL,
+    idealización bilineal de igual energía y espectro elástico E.030)
+
+    pesos_piso: Peso sísmico de cada piso (kg)
+    forma_modal: Forma de desplazamientos por piso (se normaliza al techo)
+    """
+    m = np.asarray(pesos_piso, dtype=float) / G
+    phi = np.asarray(forma_modal, dtype=float)
+    phi = phi / phi[-1]
+    m_eq = np.sum(m * phi)
+    gamma = m_eq / np.sum(m * phi**2)
+
+    V = pushover['V']
+    D = pushover['desplazamiento'] - pushover['desplazamiento'][0]
+    F_eq = V / gamma
+    d_eq = D / gamma
+
+    # 1. Bilineal de igual energía
+    Fy = F_eq.max()
+    dm = d_eq[-1]
+    Em = np.sum((F_eq[1:] + F_eq[:-1]) / 2 * np.diff(d_eq))
+    dy = min(max(2 * (dm - Em / Fy), 1e-9), dm)
+    T_eq = 2 * np.pi * np.sqrt(m_eq * dy / Fy)
+
+    # 2. Demanda de desplazamiento
+    Tp, _ = PERIODOS_SUELO.get(tipo_suelo, PERIODOS_SUELO["S2"])
+    Sae = float(espectro_e030(T_eq, zona_sismica, tipo_suelo, factor_importancia))
+    d_et = Sae * (T_eq / (2 * np.pi))**2
+    q_u = Sae * m_eq / Fy
+    if T_eq < Tp and q_u > 1:
+        d_t = min(d_et / q_u * (1 + (q_u - 1) * Tp / T_eq), 3 * d_et)
+    else:
+        d_t = d_et
+
+    D_t = gamma * d_t
+    cumple = D_t <= D[-1]
+    V_t = float(np.interp(D_t, D, V)) if cumple else float(V[-1])
+
+    return {
+        'gamma': gamma,
+        'm_equivalente': m_eq,
+        'T_equivalente': T_eq,
+        'Fy_equivalente': Fy,
+        'dy_equivalente': dy,
+        'Sae': Sae,
+        'desplazamiento_objetivo': D_t,
+        'V_desempeno': V_t,
+        'ductilidad': d_t / dy,
+        'cumple': cumple,
+    }
+
+
+def analizar_pushover_portico(portico, fy, w_vigas, pesos_piso, zona_sismica, tipo_suelo, factor_importancia,
+                              **opciones):
+    """
+    Flujo completo: gravedad → momentos plásticos → pushover → punto de desempeño
+    """
+    # 1. Cargas axiales de gravedad para la interacción P-M de columnas
+    F_grav, f_emp = cargas_gravedad(portico, w_vigas)
+    k_local = rigidez_elementos(portico)
+    K = ensamblar_rigidez(portico, k_local)
+    u_grav = np.linalg.solve(K, F_grav)
+    P_grav = -fuerzas_elementos(portico, u_grav, k_local, f_emp)[:, 3]
+    Mp = momentos_plasticos_portico(portico, portico['fc'], fy, P_columnas=P_grav)
+
+    # 2. Pushover con patrón E.030
+    patron = patron_cargas_laterales(portico, pesos_piso)
+    resultado = calcular_pushover(portico, Mp, patron, w_vigas=w_vigas, **opciones)
+
+    # 3. Forma de desplazamientos elástica para el sistema equivalente
+    forma = desplazamientos_piso(portico, np.linalg.solve(K, cargas_laterales(portico, patron)))
+    resultado['Mp'] = Mp
+    resultado['desempeno'] = calcular_punto_desempeno(portico, resultado, pesos_piso, forma, zona_sismica,
+                                                      tipo_suelo, factor_importancia)
+    return resultado
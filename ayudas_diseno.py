@@ -0,0 +1,185 @@
+"""
+Ayudas de Diseño Precalculadas - CONSORCIO DEJ
+Tablas Ru = φ·ρ·fy·(1 - 0.59·ρ·fy/f'c) y límites (β1, ρb, ρmin, ρmax) sobre una malla
+densa de f'c, fy y ρ, guardadas en un .npz comprimido que se genera la primera vez que
+se usan; para consultar se descomprimen una sola vez a .npy abiertos con memmap
+Unidades: kg, cm (Ru en kg/cm², Mu en kg·cm)
+"""
+
+import os
+import shutil
+import tempfile
+from functools import lru_cache
+
+import numpy as np
+
+from flexion_vectorizada import calcular_cuantias
+
+RUTA_TABLAS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'ayudas_diseno.npz')
+
+# Malla: f'c cada 10 kg/cm², fy cada 100 kg/cm², ρ cada 0.0001
+FC_MALLA = np.arange(140.0, 700.0 + 1, 10.0)
+FY_MALLA = np.arange(2800.0, 6000.0 + 1, 100.0)
+RHO_MALLA = np.round(np.arange(0.0, 0.05 + 1e-9, 1e-4), 6)
+PHI_FLEXION = 0.9
+
+
+def generar_tablas(fc=FC_MALLA, fy=FY_MALLA, rho=RHO_MALLA, phi=PHI_FLEXION):
+    """Calcula las tablas completas: Ru (n_fc, n_fy, n_rho) y límites (n_fc, n_fy)"""
+    FC, FY = np.meshgrid(fc, fy, indexing='ij')
+    cuantias = calcular_cuantias(FC, FY)
+    Ru = phi * rho * FY[..., None] * (1 - 0.59 * rho * FY[..., None] / FC[..., None])
+    return {
+        'fc': fc,
+        'fy': fy,
+        'rho': rho,
+        'Ru': Ru.astype(np.float32),
+        'indice_pico': np.argmax(Ru, axis=2),
+        'beta1': cuantias['beta1'],
+        'rho_b': cuantias['rho_b'],
+        'rho_min': cuantias['rho_min'],
+        'rho_max': cuantias['rho_max'],
+    }
+
+
+def _directorio_cache(ruta):
+    return os.path.splitext(ruta)[0] + '_cache'
+
+
+def _extraer(ruta, directorio, firma):
+    """
+    Extrae el .npz a directorio/firma de forma atómica: los .npy y la marca (al final) se
+    escriben en un directorio temporal que luego se renombra; si otro proceso ya lo hizo,
+    se descarta el temporal. Nunca se sobrescribe un .npy que otro proceso tenga mapeado
+    """
+    destino = os.path.join(directorio, firma)
+    if os.path.exists(os.path.join(destino, '.origen')):
+        return destino
+    os.makedirs(directorio, exist_ok=True)
+    temporal = tempfile.mkdtemp(dir=directorio, prefix='.tmp_')
+    try:
+        with np.load(ruta) as datos:
+            for nombre in datos.files:
+                np.save(os.path.join(temporal, nombre + '.npy'), datos[nombre])
+        with open(os.path.join(temporal, '.origen'), 'w') as archivo:
+            archivo.write(firma)
+        os.replace(temporal, destino)
+    except OSError:
+        # Otro proceso renombró primero su extracción completa
+        if not os.path.exists(os.path.join(destino, '.origen')):
+            raise
+    finally:
+        shutil.rmtree(temporal, ignore_errors=True)
+    return destino
+
+
+@lru_cache(maxsize=4)
+def cargar_tablas(ruta=RUTA_TABLAS):
+    """
+    Tablas de diseño, generadas y guardadas en 'ruta' si no existen
+
+    El .npz comprimido no se puede mapear en memoria, así que la primera carga lo
+    extrae a archivos .npy sin comprimir que luego se abren con mmap_mode='r'
+    """
+    if not os.path.exists(ruta):
+        # Escritura atómica: otro proceso nunca ve un .npz a medio escribir
+        descriptor, temporal = tempfile.mkstemp(dir=os.path.dirname(ruta) or '.', suffix='.npz')
+        with os.fdopen(descriptor, 'wb') as archivo:
+            np.savez_compressed(archivo, **generar_tablas())
+        os.replace(temporal, ruta)
+
+    estado = os.stat(ruta)
+    destino = _extraer(ruta, _directorio_cache(ruta), f"{estado.st_mtime_ns}_{estado.st_size}")
+    with np.load(ruta) as datos:
+        nombres = datos.files
+    return {nombre: np.load(os.path.join(destino, nombre + '.npy'), mmap_mode='r') for nombre in nombres}
+
+
+def _posicion(malla, valores):
+    """Índice inferior y fracción para interpolación lineal sobre una malla uniforme"""
+    paso = malla[1] - malla[0]
+    t = np.clip((np.asarray(valores, dtype=float) - malla[0]) / paso, 0, len(malla) - 1)
+    i = np.minimum(np.floor(t).astype(int), len(malla) - 2)
+    return i, t - i
+
+
+def _esquinas(tablas, fc, fy):
+    """Índices y pesos bilineales de las cuatro esquinas (f'c, fy) de la malla"""
+    i, tx = _posicion(tablas['fc'], fc)
+    j, ty = _posicion(tablas['fy'], fy)
+    return [(i, j, (1 - tx) * (1 - ty)), (i + 1, j, tx * (1 - ty)),
+            (i, j + 1, (1 - tx) * ty), (i + 1, j + 1, tx * ty)]
+
+
+def limites_tabla(fc, fy, tablas=None):
+    """β1, ρb, ρmin y ρmax interpolados de las tablas"""
+    tablas = cargar_tablas() if tablas is None else tablas
+    esquinas = _esquinas(tablas, fc, fy)
+    return {clave: sum(w * np.asarray(tablas[clave])[i, j] for i, j, w in esquinas)
+            for clave in ('beta1', 'rho_b', 'rho_min', 'rho_max')}
+
+
+def Ru_desde_rho(fc, fy, rho, tablas=None):
+    """Ru (kg/cm²) interpolado trilinealmente en (f'c, fy, ρ)"""
+    tablas = cargar_tablas() if tablas is None else tablas
+    fc, fy, rho = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (fc, fy, rho)))
+    k, tz = _posicion(tablas['rho'], rho)
+    Ru = tablas['Ru']
+    return sum(w * ((1 - tz) * Ru[i, j, k] + tz * Ru[i, j, k + 1]) for i, j, w in _esquinas(tablas, fc, fy))
+
+
+def rho_desde_Ru(fc, fy, Ru, tablas=None):
+    """
+    ρ requerido para Ru por búsqueda binaria vectorizada sobre la rama ascendente
+    de la curva interpolada; NaN si Ru supera el máximo de la tabla
+    """
+    tablas = cargar_tablas() if tablas is None else tablas
+    fc, fy, Ru = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (fc, fy, Ru)))
+    esquinas = _esquinas(tablas, fc, fy)
+    tabla = tablas['Ru']
+    pico = np.min([np.asarray(tablas['indice_pico'])[i, j] for i, j, _ in esquinas], axis=0)
+
+    def curva(k):
+        return sum(w * tabla[i, j, k] for i, j, w in esquinas)
+
+    inferior = np.zeros(Ru.shape, dtype=int)
+    superior = pico.copy()
+    for _ in range(int(np.ceil(np.log2(len(tablas['rho'])))) + 1):
+        medio = (inferior + superior) // 2
+        arriba = curva(medio) >= Ru
+        superior = np.where(arriba, medio, superior)
+        inferior = np.where(arriba, inferior, medio)
+    k = np.maximum(superior - 1, 0)
+    R1, R2 = curva(k), curva(k + 1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = np.clip(np.where(R2 > R1, (Ru - R1) / (R2 - R1), 0.0), 0, 1)
+    rho_malla = tablas['rho']
+    rho = rho_malla[k] + t * (rho_malla[k + 1] - rho_malla[k])
+    return np.where(Ru <= curva(pico), rho, np.nan)
+
+
+def diseno_flexion_tabla(fc, fy, b, d, Mu, tablas=None):
+    """Diseño por flexión por consulta de tablas: Ru = Mu/(b·d²) → ρ → As (con ρmin y ρmax)"""
+    tablas = cargar_tablas() if tablas is None else tablas
+    Ru = np.asarray(Mu, dtype=float) / (np.asarray(b, dtype=float) * np.asarray(d, dtype=float)**2)
+    rho_requerido = rho_desde_Ru(fc, fy, Ru, tablas)
+    limites = limites_tabla(fc, fy, tablas)
+    rho = np.maximum(rho_requerido, limites['rho_min'])
+    return {
+        'Ru': Ru,
+        'rho_requerido': rho_requerido,
+        'rho': rho,
+        'As': rho * b * d,
+        'cumple_cuantia_max': rho <= limites['rho_max'],
+        **limites,
+    }
+
+
+def curva_diseno(fc, fy, tablas=None):
+    """Curva completa Ru–ρ (rama ascendente) y límites para graficar en la app"""
+    tablas = cargar_tablas() if tablas is None else tablas
+    rho = np.asarray(tablas['rho'])
+    esquinas = _esquinas(tablas, fc, fy)
+    Ru = sum(w * np.asarray(tablas['Ru'][i, j]) for i, j, w in esquinas)
+    pico = int(np.min([tablas['indice_pico'][i, j] for i, j, _ in esquinas]))
+    return {'rho': rho[:pico + 1], 'Ru': Ru[:pico + 1], **limites_tabla(fc, fy, tablas)}
@@ -0,0 +1,143 @@
+"""
+Confiabilidad de Muros de Contención - CONSORCIO DEJ
+Simulación de Monte Carlo de la estabilidad del muro con propiedades inciertas del
+suelo, sobrecarga y concreto (normales o lognormales, con correlación): probabilidad
+de falla por modo e índice de confiabilidad β, evaluando las muestras por bloques
+con memoria acotada y, opcionalmente, en varios procesos
+Unidades: las de muro_contencion (t, m; pesos específicos en kg/m³, ángulos en grados)
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
+
+import numpy as np
+
+from muro_contencion import analizar_muro, dimensionar_muro
+
+DISTRIBUCIONES = ('normal', 'lognormal')
+
+# Entradas de analizar_muro que pueden ser aleatorias
+VARIABLES_ALEATORIAS = ('h1', 'Df', 'gamma_relleno', 'phi_relleno', 'gamma_cimentacion', 'phi_cimentacion',
+                        'cohesion', 'qsc', 'fc', 'fy', 'gamma_concreto')
+
+MODOS_FALLA = ('volcamiento', 'deslizamiento', 'portante', 'fuste')
+
+
+def _matriz_correlacion(nombres, correlacion):
+    """Matriz de correlación a partir de pares {(a, b): ρ}; se verifica que sea definida positiva"""
+    R = np.eye(len(nombres))
+    for (a, b), rho in (correlacion or {}).items():
+        i, j = nombres.index(a), nombres.index(b)
+        R[i, j] = R[j, i] = rho
+    try:
+        return np.linalg.cholesky(R)
+    except np.linalg.LinAlgError:
+        raise ValueError("La matriz de correlación no es definida positiva")
+
+
+def _muestrear(generador, n, nombres, distribuciones, L):
+    """
+    Muestras correlacionadas: normales estándar correlacionadas con L y transformadas a cada
+    distribución (para las lognormales la correlación se impone a los logaritmos)
+    """
+    z = generador.standard_normal((n, len(nombres))) @ L.T
+    muestras = {}
+    for k, nombre in enumerate(nombres):
+        tipo, media, cov = distribuciones[nombre]
+        if tipo == 'lognormal':
+            sigma = np.sqrt(np.log1p(cov**2))
+            muestras[nombre] = np.exp(np.log(media) - sigma**2 / 2 + sigma * z[:, k])
+        else:
+            # Truncada en cero: todas las variables del muro son no negativas
+            muestras[nombre] = np.maximum(media * (1 + cov * z[:, k]), 0.0)
+    return muestras
+
+
+def _evaluar_bloque(configuracion, semilla, n):
+    """Sumas de un bloque de muestras (función de nivel de módulo para el grupo de procesos)"""
+    nombres = configuracion['nombres']
+    muestras = _muestrear(np.random.default_rng(semilla), n, nombres, configuracion['distribuciones'],
+                          configuracion['L'])
+    entradas = dict(configuracion['deterministicos'], **muestras)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        r = analizar_muro(**entradas, **configuracion['geometria'])
+    fallas = {
+        'volcamiento': r['FS_volcamiento'] < configuracion['FS_limite'],
+        'deslizamiento': r['FS_deslizamiento'] < configuracion['FS_limite'],
+        'portante': r['q_max_kg_cm2'] > configuracion['capacidad_ultima'],
+        'fuste': r['fuste']['dreal'] < r['fuste']['dreq'],
+    }
+    fallas['sistema'] = np.logical_or.reduce(list(fallas.values()))
+    sumas = {'fallas': {modo: int(mascara.sum()) for modo, mascara in fallas.items()}}
+    for clave in ('FS_volcamiento', 'FS_deslizamiento', 'q_max_kg_cm2'):
+        sumas[clave] = (float(r[clave].sum()), float((r[clave]**2).sum()))
+    return sumas
+
+
+def analizar_confiabilidad(variables, n_muestras=1_000_000, correlacion=None, semilla=0, tamano_bloque=100_000,
+                           procesos=1, FS_limite=1.0, factor_portante=3.0, **datos):
+    """
+    Probabilidad de falla por modo con muestras de las variables inciertas del muro
+
+    variables: {nombre: (distribución, media, coeficiente de variación)}, p. ej.
+    {'phi_relleno': ('lognormal', 30, 0.10)}; las demás entradas de analizar_muro van en datos
+    correlacion: {(nombre_a, nombre_b): ρ} en el espacio normal estándar
+    semilla: cada bloque usa su propia semilla derivada, así el resultado es el mismo con
+    cualquier número de procesos
+    Modos: volcamiento y deslizamiento (FS < FS_limite), portante (q_max > factor_portante·σadm),
+    fuste (peralte insuficiente) y sistema (cualquiera de ellos)
+    """
+    nombres = list(variables)
+    for nombre, (tipo, media, cov) in variables.items():
+        if nombre not in VARIABLES_ALEATORIAS:
+            raise ValueError(f"Variable aleatoria no reconocida: {nombre}")
+        if tipo not in DISTRIBUCIONES:
+            raise ValueError(f"Distribución no reconocida: {tipo}")
+
+    # 1. Geometría fija: la dada o el predimensionamiento con los valores medios
+    medias = dict(datos, **{nombre: media for nombre, (_, media, _) in variables.items()})
+    geometria = {clave: datos.pop(clave) for clave in ('Bz', 'hz', 'b', 'r', 't') if clave in datos}
+    if len(geometria) < 5:
+        empirico = dimensionar_muro(medias['h1'], medias['Df'], medias['hm'], medias['gamma_relleno'],
+                                    medias['phi_relleno'], medias['qsc'])
+        geometria = {clave: geometria.get(clave, float(empirico[clave][0])) for clave in ('Bz', 'hz', 'b', 'r', 't')}
+
+    configuracion = {
+        'nombres': nombres,
+        'distribuciones': variables,
+        'L': _matriz_correlacion(nombres, correlacion),
+        'deterministicos': datos,
+        'geometria': geometria,
+        'FS_limite': FS_limite,
+        'capacidad_ultima': factor_portante * datos.get('sigma_adm', 2.5),
+    }
+
+    # 2. Bloques con semillas independientes derivadas de la semilla del análisis
+    tamanos = [min(tamano_bloque, n_muestras - inicio) for inicio in range(0, n_muestras, tamano_bloque)]
+    semillas = np.random.SeedSequence(semilla).spawn(len(tamanos))
+    if procesos > 1:
+        with ProcessPoolExecutor(max_workers=procesos) as grupo:
+            bloques = list(grupo.map(_evaluar_bloque, [configuracion] * len(tamanos), semillas, tamanos))
+    else:
+        bloques = [_evaluar_bloque(configuracion, s, n) for s, n in zip(semillas, tamanos)]
+
+    # 3. Probabilidades, índices de confiabilidad y momentos de los factores de seguridad
+    fallas = {modo: sum(bloque['fallas'][modo] for bloque in bloques) for modo in MODOS_FALLA + ('sistema',)}
+    probabilidad = {modo: conteo / n_muestras for modo, conteo in fallas.items()}
+    normal = NormalDist()
+    resultado = {
+        'n_muestras': n_muestras,
+        'fallas': fallas,
+        'probabilidad_falla': probabilidad,
+        'error_estandar': {modo: np.sqrt(p * (1 - p) / n_muestras) for modo, p in probabilidad.items()},
+        'indice_confiabilidad': {modo: (-normal.inv_cdf(p) if 0 < p < 1 else (np.inf if p == 0 else -np.inf))
+                                 for modo, p in probabilidad.items()},
+        'geometria': geometria,
+    }
+    for clave in ('FS_volcamiento', 'FS_deslizamiento', 'q_max_kg_cm2'):
+        suma = sum(bloque[clave][0] for bloque in bloques)
+        suma_cuadrados = sum(bloque[clave][1] for bloque in bloques)
+        media = suma / n_muestras
+        resultado[f'{clave}_medio'] = media
+        resultado[f'{clave}_desviacion'] = np.sqrt(max(suma_cuadrados / n_muestras - media**2, 0.0))
+    return resultado
@@ -0,0 +1,171 @@
+"""
+Corte y Anclaje de Barras Longitudinales - CONSORCIO DEJ
+Puntos de corte teóricos y reales a partir de la envolvente M(x), con longitud de
+desarrollo y extensiones máx(d, 12db) (E.060 12.10), y elección de grupos de corte
+de menor peso para todas las vigas del edificio a la vez
+Unidades: kg, cm (x en m, momentos en kg·cm)
+"""
+
+import numpy as np
+
+from seleccion_barras import AREAS, DIAMETROS, PESOS
+
+
+def longitud_desarrollo(db, fc, fy, superior=False):
+    """
+    Longitud de desarrollo en tracción (cm), expresión simplificada E.060 12.2.2:
+    ld = fy·ψt·ψe·db / (8.2·√f'c) para barras ≤ 3/4" y /6.6 para mayores; mínimo 30 cm
+    """
+    db = np.asarray(db, dtype=float)
+    psi_t = np.where(superior, 1.3, 1.0)
+    divisor = np.where(db <= 1.91, 8.2, 6.6)
+    return np.maximum(fy * psi_t * db / (divisor * np.sqrt(fc)), 30.0)
+
+
+def momentos_resistentes_por_barra(fc, fy, b, d, n_barras, barra, phi=0.9):
+    """
+    φMn con j = 0..n_max barras de la misma designación (n_vigas, n_max + 1);
+    las columnas j > n_barras de cada viga se devuelven como infinito
+    """
+    n_max = int(np.max(n_barras))
+    j = np.arange(n_max + 1)[None, :]
+    As = j * AREAS[barra][:, None]
+    a = As * fy / (0.85 * fc * b[:, None])
+    phiMn = phi * As * fy * (d[:, None] - a / 2)
+    return np.where(j <= n_barras[:, None], phiMn, np.inf)
+
+
+def _primer_indice_mayor(M_creciente, umbral):
+    """
+    Primer índice de cada fila donde la envolvente monótona supera cada umbral:
+    un solo searchsorted sobre todas las filas desplazadas a rangos disjuntos
+    """
+    n, s = M_creciente.shape
+    finito = np.isfinite(umbral)
+    desplazamiento = 2 * (np.abs(M_creciente).max() + np.abs(np.where(finito, umbral, 0)).max()) + 1
+    filas = np.arange(n)[:, None] * desplazamiento
+    claves = (M_creciente + filas).ravel()
+    indice = np.searchsorted(claves, (np.where(finito, umbral, 0) + filas).ravel(), side='right')
+    indice = indice.reshape(umbral.shape) - np.arange(n)[:, None] * s
+    return np.where(finito, np.clip(indice, 0, s), s)
+
+
+def _puntos_teoricos(x, M, umbral):
+    """
+    Tramo [x_izq, x_der] donde M(x) supera cada umbral (una sola joroba por fila),
+    interpolando linealmente entre estaciones; NaN si el umbral nunca se supera
+    """
+    n, s = M.shape
+    filas = np.arange(n)[:, None]
+
+    def cruce(x_fila, M_fila):
+        acumulado = np.maximum.accumulate(M_fila, axis=1)
+        i = _primer_indice_mayor(acumulado, umbral)
+        existe = i < s
+        i = np.minimum(i, s - 1)
+        anterior = np.maximum(i - 1, 0)
+        M1, M2 = acumulado[filas, anterior], acumulado[filas, i]
+        x1, x2 = x_fila[filas, anterior], x_fila[filas, i]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t = np.where(M2 > M1, (umbral - M1) / (M2 - M1), 0.0)
+        return np.where(existe, x1 + np.clip(t, 0, 1) * (x2 - x1), np.nan)
+
+    x_izq = cruce(x, M)
+    x_der = cruce(x[:, ::-1], M[:, ::-1])
+    return x_izq, x_der
+
+
+def calcular_cortes(x, M, fc, fy, b, d, n_barras, barra, superior=False, min_continuas=2):
+    """
+    Puntos de corte teóricos y reales de cada barra y grupos de corte de menor peso
+
+    x: Estaciones (m), (n_estaciones,) o (n_vigas, n_estaciones); M: envolvente (kg·cm, magnitud)
+    de una sola joroba: momento positivo del tramo o negativo de un apoyo (usar cortar_negativos)
+    n_barras, barra: número de barras provistas e índice del catálogo (una designación por viga)
+    Se evalúan todas las combinaciones de barras continuas y hasta dos grupos de corte
+    """
+    M = np.atleast_2d(np.asarray(M, dtype=float))
+    x = np.broadcast_to(np.atleast_2d(np.asarray(x, dtype=float)), M.shape)
+    n_vigas = M.shape[0]
+    b, d, n_barras, barra = (np.broadcast_to(np.asarray(v), (n_vigas,)) for v in (b, d, n_barras, barra))
+    b, d = b.astype(float), d.astype(float)
+    n_barras, barra = n_barras.astype(int), barra.astype(int)
+    filas = np.arange(n_vigas)[:, None]
+    db = DIAMETROS[barra]
+    L = x[:, -1] - x[:, 0]
+
+    # 1. Punto teórico de la barra j: donde M supera la capacidad de las j - 1 barras anteriores
+    phiMn = momentos_resistentes_por_barra(fc, fy, b, d, n_barras, barra)
+    x_izq, x_der = _puntos_teoricos(x, M, phiMn[:, :-1])
+    cubre = M.max(axis=1) <= phiMn[filas[:, 0], n_barras] * (1 + 1e-9)
+
+    # 2. Punto real: extensión máx(d, 12db) y ld desde la sección de momento máximo
+    extension = np.maximum(d, 12 * db)[:, None] / 100
+    ld = longitud_desarrollo(db, fc, fy, superior)[:, None] / 100
+    x_pico = x[filas[:, 0], np.argmax(M, axis=1)][:, None]
+    x_izq_real = np.minimum(x_izq - extension, x_pico - ld)
+    x_der_real = np.maximum(x_der + extension, x_pico + ld)
+    x_izq_real = np.where(np.isnan(x_izq), x_pico - ld, x_izq_real)
+    x_der_real = np.where(np.isnan(x_der), x_pico + ld, x_der_real)
+    x_izq_real = np.clip(x_izq_real, x[:, :1], x[:, -1:])
+    x_der_real = np.clip(x_der_real, x[:, :1], x[:, -1:])
+    longitud = x_der_real - x_izq_real
+
+    # 3. Combinaciones: n_c barras continuas, barras n_c+1..k en el grupo 1 (largo de la barra n_c+1)
+    #    y k+1..n en el grupo 2 (largo de la barra k+1); todas las vigas y combinaciones a la vez
+    n_max = phiMn.shape[1] - 1
+    n_c = np.arange(n_max + 1)[None, :, None]
+    k = np.arange(n_max + 1)[None, None, :]
+    n = n_barras[:, None, None]
+    minimo = np.maximum(min_continuas, np.ceil(n / 3))
+    valida = (n_c >= np.minimum(minimo, n)) & (n_c <= k) & (k <= n)
+    largo = np.hstack([longitud, np.zeros((n_vigas, 1))])
+    largo_g1 = largo[filas[:, :, None], np.minimum(n_c, n_max)]
+    largo_g2 = largo[filas[:, :, None], np.minimum(k, n_max)]
+    metros = n_c * L[:, None, None] + (k - n_c) * largo_g1 + (n - k) * largo_g2
+    metros = np.where(valida, metros, np.inf)
+    mejor = np.argmin(metros.reshape(n_vigas, -1), axis=1)
+    n_c_opt, k_opt = np.unravel_index(mejor, metros.shape[1:])
+
+    def tramo(j, n_grupo):
+        j = np.minimum(j, n_max - 1)
+        vacio = n_grupo == 0
+        return (np.where(vacio, np.nan, x_izq_real[filas[:, 0], j]),
+                np.where(vacio, np.nan, x_der_real[filas[:, 0], j]))
+
+    g1_izq, g1_der = tramo(n_c_opt, k_opt - n_c_opt)
+    g2_izq, g2_der = tramo(k_opt, n_barras - k_opt)
+    metros_opt = metros.reshape(n_vigas, -1)[filas[:, 0], mejor]
+    return {
+        'x_teorico_izq': x_izq,
+        'x_teorico_der': x_der,
+        'x_real_izq': x_izq_real,
+        'x_real_der': x_der_real,
+        'n_continuas': n_c_opt,
+        'n_grupo1': k_opt - n_c_opt,
+        'grupo1_izq': g1_izq,
+        'grupo1_der': g1_der,
+        'n_grupo2': n_barras - k_opt,
+        'grupo2_izq': g2_izq,
+        'grupo2_der': g2_der,
+        'peso': metros_opt * PESOS[barra],
+        'peso_sin_cortes': n_barras * L * PESOS[barra],
+        'cubre_envolvente': cubre,
+    }
+
+
+def cortar_negativos(x, M_neg, fc, fy, b, d, n_barras, barra, min_continuas=2):
+    """
+    Cortes del acero negativo: la envolvente se divide en la estación de menor momento
+    y cada apoyo se resuelve como una joroba independiente (barras superiores, ψt = 1.3)
+    """
+    M_neg = np.atleast_2d(np.asarray(M_neg, dtype=float))
+    x = np.broadcast_to(np.atleast_2d(np.asarray(x, dtype=float)), M_neg.shape)
+    columnas = np.arange(M_neg.shape[1])
+    division = np.argmin(M_neg, axis=1)[:, None]
+    izquierdo = np.where(columnas <= division, M_neg, 0.0)
+    derecho = np.where(columnas >= division, M_neg, 0.0)
+    return {
+        'izquierdo': calcular_cortes(x, izquierdo, fc, fy, b, d, n_barras, barra, True, min_continuas),
+        'derecho': calcular_cortes(x, derecho, fc, fy, b, d, n_barras, barra, True, min_continuas),
+    }
@@ -0,0 +1,201 @@
+"""
+Diagrama de Interacción P-M - CONSORCIO DEJ
+Compatibilidad de deformaciones vectorizada para columnas rectangulares y circulares
+con distribución arbitraria de barras (ACI 318-2025 / E.060)
+Unidades: kg, cm (momentos en kg·cm, compresión positiva)
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from flexion_vectorizada import calcular_beta1
+
+ES = 2000000    # kg/cm²
+ECU = 0.003
+
+
+def crear_seccion_rectangular(b, h, barras_x, barras_y, barras_As, espiral=False):
+    """
+    Sección rectangular b × h (cm) con barras en coordenadas (x, y) medidas
+    desde la esquina superior izquierda; y crece hacia la cara inferior
+    """
+    return {
+        'forma': 'rectangular',
+        'b': float(b),
+        'h': float(h),
+        'barras_x': tuple(float(v) for v in np.atleast_1d(barras_x)),
+        'barras_y': tuple(float(v) for v in np.atleast_1d(barras_y)),
+        'barras_As': tuple(float(v) for v in np.broadcast_to(barras_As, np.shape(np.atleast_1d(barras_x)))),
+        'espiral': bool(espiral),
+    }
+
+
+def crear_seccion_circular(D, n_barras, As_barra, recubrimiento=6.0, espiral=True):
+    """Sección circular de diámetro D (cm) con n_barras repartidas en un anillo"""
+    R = D / 2
+    radio_barras = R - recubrimiento
+    angulos = 2 * np.pi * np.arange(n_barras) / n_barras
+    return {
+        'forma': 'circular',
+        'b': float(D),
+        'h': float(D),
+        'barras_x': tuple(R + radio_barras * np.sin(angulos)),
+        'barras_y': tuple(R - radio_barras * np.cos(angulos)),
+        'barras_As': tuple(np.full(n_barras, float(As_barra))),
+        'espiral': bool(espiral),
+    }
+
+
+def distribucion_perimetral(b, h, n_x, n_y, As_barra, recubrimiento=6.0):
+    """
+    Coordenadas de barras repartidas en el perímetro: n_x barras por cara horizontal
+    y n_y barras por cara vertical (incluidas las esquinas)
+    """
+    xs = np.linspace(recubrimiento, b - recubrimiento, n_x)
+    ys = np.linspace(recubrimiento, h - recubrimiento, n_y)
+    X, Y = np.meshgrid(xs, ys)
+    perimetro = (np.isin(Y, ys[[0, -1]])) | (np.isin(X, xs[[0, -1]]))
+    x, y = X[perimetro], Y[perimetro]
+    return x, y, np.full(len(x), float(As_barra))
+
+
+def firma_seccion(seccion, fc, fy):
+    """Firma inmutable de la sección y materiales, usada como clave de caché"""
+    return (seccion['forma'], seccion['b'], seccion['h'], seccion['barras_x'], seccion['barras_y'],
+            seccion['barras_As'], seccion['espiral'], float(fc), float(fy))
+
+
+def _bloque_compresion(forma, ancho, profundidad, a):
+    """Área del bloque de compresión de profundidad a y distancia de su centroide a la fibra extrema"""
+    if forma == 'circular':
+        R = profundidad / 2
+        a = np.clip(a, 0, 2 * R)
+        cuerda = np.sqrt(np.maximum(2 * R * a - a**2, 0))
+        area = R**2 * np.arccos(np.clip((R - a) / R, -1, 1)) - (R - a) * cuerda
+        y_barra = np.where(area > 0, 2 / 3 * cuerda**3 / np.maximum(area, 1e-12), 0.0)
+        return area, R - y_barra
+    a = np.clip(a, 0, profundidad)
+    return ancho * a, a / 2
+
+
+def _geometria(seccion, eje):
+    """Profundidad, ancho y coordenada de barras en la dirección de flexión"""
+    if eje == 'x':
+        return seccion['h'], seccion['b'], np.array(seccion['barras_y'])
+    return seccion['b'], seccion['h'], np.array(seccion['barras_x'])
+
+
+def factor_phi(eps_t, ey, espiral=False):
+    """
+    Factor φ con transición lineal entre compresión controlada (0.65 estribos, 0.75 espiral)
+    y tracción controlada (0.90); eps_t: deformación del acero extremo, ey = fy/Es
+    """
+    phi_c = 0.75 if espiral else 0.65
+    return np.clip(phi_c + (0.90 - phi_c) * (eps_t - ey) / (0.005 - ey), phi_c, 0.90)
+
+
+def _curva_un_sentido(seccion, fc, fy, profundidad, ancho, y, As, c):
+    """Pn, Mn y deformación del acero extremo en tracción para todas las profundidades c"""
+    beta1 = calcular_beta1(fc)
+    # Deformaciones y esfuerzos de todas las barras para todas las c (n_c × n_barras)
+    eps = ECU * (c[:, None] - y[None, :]) / c[:, None]
+    fs = np.clip(ES * eps, -fy, fy)
+    a = beta1 * c
+    area_c, y_c = _bloque_compresion(seccion['forma'], ancho, profundidad, a)
+    # El concreto desplazado por barras dentro del bloque no aporta
+    desplazado = (y[None, :] < a[:, None]) * 0.85 * fc
+    fuerza_barras = As[None, :] * (fs - desplazado)
+
+    centro = profundidad / 2
+    Cc = 0.85 * fc * area_c
+    Pn = Cc + fuerza_barras.sum(axis=1)
+    Mn = Cc * (centro - y_c) + (fuerza_barras * (centro - y[None, :])).sum(axis=1)
+    eps_t = ECU * (y.max() - c) / c
+    return Pn, Mn, eps_t
+
+
+@lru_cache(maxsize=1024)
+def _diagrama_cacheado(firma, eje, n_puntos):
+    forma, b, h, bx, by, bAs, espiral, fc, fy = firma
+    seccion = {'forma': forma, 'b': b, 'h': h, 'barras_x': bx, 'barras_y': by, 'barras_As': bAs,
+               'espiral': espiral}
+    profundidad, ancho, y = _geometria(seccion, eje)
+    As = np.array(bAs)
+    Ast = As.sum()
+    ey = fy / ES
+
+    Ag = np.pi * h**2 / 4 if forma == 'circular' else b * h
+    P0 = 0.85 * fc * (Ag - Ast) + fy * Ast
+    Pn_max = (0.85 if espiral else 0.80) * P0
+    Pnt = -fy * Ast
+
+    # Barrido de profundidades del eje neutro (densificado cerca de la falla balanceada)
+    c = profundidad * np.concatenate([np.geomspace(1e-3, 1.0, n_puntos // 2, endpoint=False),
+                                      np.linspace(1.0, 4.0, n_puntos - n_puntos // 2)])
+
+    curvas = []
+    for signo, y_sentido in ((1, y), (-1, profundidad - y)):
+        Pn, Mn, eps_t = _curva_un_sentido(seccion, fc, fy, profundidad, ancho, y_sentido, As, c)
+        phi = factor_phi(eps_t, ey, espiral)
+        curvas.append((Pn, signo * Mn, phi))
+
+    # Polígono cerrado: tracción pura → M+ → compresión pura → M- → tracción pura
+    (Pp, Mp, phip), (Pm, Mm, phim) = curvas
+    phi_t = 0.90
+    phi_c = 0.75 if espiral else 0.65
+    Pn = np.concatenate([[Pnt], Pp, [P0], Pm[::-1], [Pnt]])
+    Mn = np.concatenate([[0.0], Mp, [0.0], Mm[::-1], [0.0]])
+    phi = np.concatenate([[phi_t], phip, [phi_c], phim[::-1], [phi_t]])
+    phiPn = np.minimum(phi * Pn, phi_c * Pn_max)
+    phiMn = phi * Mn
+
+    resultado = {
+        'Pn': Pn, 'Mn': Mn, 'phi': phi, 'phiPn': phiPn, 'phiMn': phiMn,
+        'P0': P0, 'Pn_max': Pn_max, 'phiPn_max': phi_c * Pn_max, 'Pnt': Pnt,
+    }
+    for valor in resultado.values():
+        if isinstance(valor, np.ndarray):
+            valor.setflags(write=False)
+    return resultado
+
+
+def calcular_diagrama_interaccion(seccion, fc, fy, eje='x', n_puntos=80):
+    """
+    Curvas nominal y de diseño del diagrama de interacción para flexión alrededor de 'x' o 'y'
+
+    Cada diagrama se guarda en caché por firma de sección, así que verificar muchas
+    combinaciones sobre la misma columna no vuelve a calcular la curva
+    """
+    return _diagrama_cacheado(firma_seccion(seccion, fc, fy), eje, int(n_puntos))
+
+
+def razon_demanda_capacidad(curva_M, curva_P, Mu, Pu):
+    """
+    Razón demanda/capacidad de puntos (Mu, Pu) respecto a un polígono que contiene el origen:
+    intersección del rayo desde el origen con los lados del polígono (≤ 1 → punto dentro)
+    """
+    Mu = np.atleast_1d(np.asarray(Mu, dtype=float))
+    Pu = np.atleast_1d(np.asarray(Pu, dtype=float))
+    Ax, Ay = np.asarray(curva_M)[:-1], np.asarray(curva_P)[:-1]
+    ex, ey = np.diff(curva_M), np.diff(curva_P)
+
+    qx, qy = Mu[:, None], Pu[:, None]
+    det = qy * ex - qx * ey
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = (Ay * ex - Ax * ey) / det
+        s = (qx * Ay - qy * Ax) / det
+    valido = (np.abs(det) > 0) & (s >= -1e-12) & (s <= 1 + 1e-12) & (t > 0)
+    t = np.where(valido, t, np.inf).min(axis=1)
+    razon = np.where(np.isfinite(t), 1 / t, np.inf)
+    return np.where((Mu == 0) & (Pu == 0), 0.0, razon)
+
+
+def verificar_columna(seccion, fc, fy, Pu, Mu, eje='x'):
+    """
+    Verifica muchos pares (Pu, Mu) contra el diagrama de diseño de una columna
+    Retorna la razón demanda/capacidad y la máscara de puntos que cumplen
+    """
+    diagrama = calcular_diagrama_interaccion(seccion, fc, fy, eje)
+    razon = razon_demanda_capacidad(diagrama['phiMn'], diagrama['phiPn'], Mu, Pu)
+    return {'razon': razon, 'cumple': razon <= 1.0}
@@ -0,0 +1,156 @@
+"""
+Diseño por Capacidad en Nudos - CONSORCIO DEJ
+Columna fuerte - viga débil (ΣMnc ≥ 6/5·ΣMnb) y cortante en nudos de pórticos
+especiales resistentes a momentos (ACI 318-2025 18.7.3 y 18.8 / E.060 21.6),
+evaluados en todos los nudos con sumas por segmentos sobre la conectividad del pórtico
+Unidades: kg, cm (momentos en kg·cm)
+"""
+
+import numpy as np
+
+from diagrama_interaccion import calcular_diagrama_interaccion
+from flexion_biaxial import momento_resistente
+from modelo_portico import COLUMNA, VIGA
+
+# Coeficiente γ de resistencia del nudo en kg/cm² (φVn = φ·γ·√f'c·Aj)
+GAMMA_NUDO = {'confinado_4_caras': 5.3, 'confinado_3_caras': 4.0, 'otros': 3.2}
+PHI_NUDO = 0.85
+
+
+def _topologia_nudos(portico):
+    """
+    Papel de cada extremo de elemento en su nudo; se calcula una vez por pórtico y se
+    conserva en copias hechas con actualizar_secciones
+    """
+    if 'topologia_nudos' not in portico:
+        nodos = portico['nodos']
+        tipo = np.repeat(portico['tipo'][:, None], 2, axis=1)
+        extremo = np.broadcast_to(np.arange(2), nodos.shape)
+        portico['topologia_nudos'] = {
+            'elemento': np.broadcast_to(np.arange(len(nodos))[:, None], nodos.shape).ravel(),
+            'nudo': nodos.ravel(),
+            # Columna que nace en el nudo (extremo inferior) o llega a él (extremo superior)
+            'columna_arriba': ((tipo == COLUMNA) & (extremo == 0)).ravel(),
+            'columna_abajo': ((tipo == COLUMNA) & (extremo == 1)).ravel(),
+            # Viga a la derecha (extremo i) o a la izquierda (extremo j) del nudo
+            'viga_derecha': ((tipo == VIGA) & (extremo == 0)).ravel(),
+            'viga_izquierda': ((tipo == VIGA) & (extremo == 1)).ravel(),
+        }
+    return portico['topologia_nudos']
+
+
+def _suma_nudos(topologia, n_nudos, valores, mascara):
+    """Suma por nudo de los valores de los extremos seleccionados"""
+    suma = np.zeros(n_nudos)
+    np.add.at(suma, topologia['nudo'][mascara], valores[mascara])
+    return suma
+
+
+def momentos_vigas(portico, fc, fy, As_sup, As_inf, recubrimiento=6.0, factor_fy=1.0):
+    """
+    Momento nominal (factor_fy = 1) o probable (factor_fy = 1.25) de las vigas
+    As_sup, As_inf: acero superior e inferior por elemento (cm²); las columnas se ignoran
+    Retorna (M_negativo, M_positivo) por elemento
+    """
+    b, d = portico['b'], portico['h'] - recubrimiento
+    resultado = []
+    for As in (As_sup, As_inf):
+        As = np.broadcast_to(np.asarray(As, dtype=float), b.shape)
+        T = factor_fy * fy * As
+        a = T / (0.85 * fc * b)
+        resultado.append(np.where(portico['tipo'] == VIGA, T * (d - a / 2), 0.0))
+    return tuple(resultado)
+
+
+def momentos_nominales_columnas(secciones, indice_seccion, fc, fy, Pu, eje='x'):
+    """
+    Mn de cada columna al nivel de su carga axial, del diagrama de interacción nominal;
+    se toma el menor entre los sentidos positivo y negativo
+    """
+    Pu = np.asarray(Pu, dtype=float)
+    indice = np.broadcast_to(np.asarray(indice_seccion), Pu.shape)
+    Mn = np.zeros(Pu.shape)
+    for k in np.unique(indice):
+        grupo = indice == k
+        diagrama = calcular_diagrama_interaccion(secciones[k], fc, fy, eje)
+        M_pos, M_neg = momento_resistente(diagrama['Mn'], diagrama['Pn'], Pu[grupo])
+        Mn[grupo] = np.minimum(M_pos, -M_neg)
+    return Mn
+
+
+def verificar_nudos(portico, fc, fy, As_sup, As_inf, Mn_columnas, recubrimiento=6.0, factor=1.2,
+                    gamma=None):
+    """
+    Columna fuerte - viga débil y cortante en todos los nudos del pórtico
+
+    As_sup, As_inf: acero superior e inferior de cada elemento (cm², ignorado en columnas)
+    Mn_columnas: Mn de cada elemento (kg·cm, ignorado en vigas), p. ej. momentos_nominales_columnas
+    Para cada sentido del sismo, la viga a un lado aporta su momento negativo y la del otro
+    lado el positivo; se toma el sentido más desfavorable
+    """
+    topologia = _topologia_nudos(portico)
+    n_nudos = len(portico['coords'])
+    e = topologia['elemento']
+
+    # 1. Momentos por extremo de elemento: nominales y probables (1.25·fy) de vigas
+    Mn_neg, Mn_pos = momentos_vigas(portico, fc, fy, As_sup, As_inf, recubrimiento)
+    Mpr_neg, Mpr_pos = momentos_vigas(portico, fc, fy, As_sup, As_inf, recubrimiento, 1.25)
+    Mn_col = np.where(portico['tipo'] == COLUMNA,
+                      np.broadcast_to(np.asarray(Mn_columnas, dtype=float), portico['tipo'].shape), 0.0)
+
+    def suma(valores, papel):
+        return _suma_nudos(topologia, n_nudos, valores[e], topologia[papel])
+
+    # 2. Sumas por nudo en los dos sentidos
+    suma_columnas = suma(Mn_col, 'columna_arriba') + suma(Mn_col, 'columna_abajo')
+    suma_vigas = np.maximum(suma(Mn_neg, 'viga_derecha') + suma(Mn_pos, 'viga_izquierda'),
+                            suma(Mn_pos, 'viga_derecha') + suma(Mn_neg, 'viga_izquierda'))
+    n_vigas = suma(np.ones(len(portico['tipo'])), 'viga_derecha') + suma(
+        np.ones(len(portico['tipo'])), 'viga_izquierda')
+    tiene_arriba = suma(np.ones(len(portico['tipo'])), 'columna_arriba') > 0
+    aplica = (portico['piso_nudo'] > 0) & (n_vigas > 0) & tiene_arriba
+    with np.errstate(divide='ignore', invalid='ignore'):
+        razon_columna_viga = np.where(suma_vigas > 0, suma_columnas / suma_vigas, np.inf)
+
+    # 3. Cortante del nudo: Vj = 1.25·fy·(As sup + As inf de vigas opuestas) - Vcol
+    As_sup = np.broadcast_to(np.asarray(As_sup, dtype=float), portico['tipo'].shape)
+    As_inf = np.broadcast_to(np.asarray(As_inf, dtype=float), portico['tipo'].shape)
+    es_viga = (portico['tipo'] == VIGA)
+    T_sup = np.where(es_viga, 1.25 * fy * As_sup, 0.0)
+    T_inf = np.where(es_viga, 1.25 * fy * As_inf, 0.0)
+    L_col = np.where(portico['tipo'] == COLUMNA, portico['L'], 0.0)
+    altura = suma(L_col, 'columna_arriba') + suma(L_col, 'columna_abajo')
+    n_col = suma((portico['tipo'] == COLUMNA) * 1.0, 'columna_arriba') + suma(
+        (portico['tipo'] == COLUMNA) * 1.0, 'columna_abajo')
+    lc = altura / np.maximum(n_col, 1)
+
+    Vj = np.zeros(n_nudos)
+    for derecha_sup, izquierda_sup in ((True, False), (False, True)):
+        T = (suma(T_sup if derecha_sup else T_inf, 'viga_derecha')
+             + suma(T_sup if izquierda_sup else T_inf, 'viga_izquierda'))
+        Mpr = (suma(Mpr_neg if derecha_sup else Mpr_pos, 'viga_derecha')
+               + suma(Mpr_neg if izquierda_sup else Mpr_pos, 'viga_izquierda'))
+        Vj = np.maximum(Vj, T - Mpr / np.where(lc > 0, lc, np.inf))
+
+    # 4. Resistencia: φ·γ·√f'c·Aj, con Aj = h_col · mín(b_col, b_viga + h_col)
+    b_col = np.maximum(suma(portico['b'], 'columna_abajo'), suma(portico['b'], 'columna_arriba'))
+    h_col = np.maximum(suma(portico['h'], 'columna_abajo'), suma(portico['h'], 'columna_arriba'))
+    b_viga = np.zeros(n_nudos)
+    for papel in ('viga_derecha', 'viga_izquierda'):
+        mascara = topologia[papel]
+        np.maximum.at(b_viga, topologia['nudo'][mascara], portico['b'][e[mascara]])
+    Aj = h_col * np.minimum(b_col, b_viga + h_col)
+    if gamma is None:
+        gamma = np.where(n_vigas >= 2, GAMMA_NUDO['confinado_3_caras'], GAMMA_NUDO['otros'])
+    phiVn = PHI_NUDO * gamma * np.sqrt(fc) * Aj
+
+    return {
+        'suma_columnas': suma_columnas,
+        'suma_vigas': suma_vigas,
+        'razon_columna_viga': razon_columna_viga,
+        'cumple_columna_fuerte': ~aplica | (razon_columna_viga >= factor),
+        'Vj': Vj,
+        'phiVn': phiVn,
+        'cumple_cortante_nudo': ~aplica | (Vj <= phiVn),
+        'aplica': aplica,
+    }
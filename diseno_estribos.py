@@ -0,0 +1,120 @@
+"""
+Diseño de Estribos a lo Largo de la Viga - CONSORCIO DEJ
+Av/s requerido en todas las estaciones del diagrama V(x) y agrupación en zonas de
+separación práctica (zona de confinamiento, límites d/2 y d/4) según ACI 318-2025 / E.060
+Unidades: kg, cm (x en m, como los diagramas de cortante de la app)
+"""
+
+import numpy as np
+
+PHI_CORTANTE = 0.75
+
+
+def calcular_av_s_requerido(fc, fy, b, d, Vu):
+    """
+    Av/s requerido (cm²/cm) con las mismas expresiones de calcular_diseno_cortante,
+    vectorizado sobre estaciones y vigas; incluye el mínimo cuando Vu > φVc/2
+    """
+    Vu = np.abs(np.asarray(Vu, dtype=float))
+    Vc = 0.53 * np.sqrt(fc) * b * d
+    Vs_requerido = np.maximum(Vu / PHI_CORTANTE - Vc, 0.0)
+    Av_s_minimo = np.where(Vu > 0.5 * PHI_CORTANTE * Vc, np.maximum(0.2 * np.sqrt(fc), 3.5) * b / fy, 0.0)
+    Av_s = np.maximum(Vs_requerido / (fy * d), Av_s_minimo)
+    return Vc, Vs_requerido, Av_s
+
+
+def _envolvente_monotona(s):
+    """
+    Separación que no decrece desde cada apoyo hasta la estación de menor demanda:
+    mínimo acumulado hacia cada extremo, así las zonas quedan en orden práctico
+    """
+    columnas = np.arange(s.shape[1])
+    centro = np.argmax(s, axis=1)[:, None]
+    izquierda = np.where(columnas <= centro, s, np.inf)
+    izquierda = np.minimum.accumulate(izquierda[:, ::-1], axis=1)[:, ::-1]
+    derecha = np.minimum.accumulate(np.where(columnas >= centro, s, np.inf), axis=1)
+    return np.where(columnas <= centro, izquierda, derecha)
+
+
+def disenar_estribos(x, V, fc, fy, b, d, h=None, Av_estribo=1.42, db_longitudinal=1.59, db_estribo=0.95,
+                     confinamiento=True, incremento=2.5, s_minimo=5.0):
+    """
+    Diseño de estribos para una o varias vigas a partir de sus diagramas de cortante
+
+    x: Estaciones (m) - (n_estaciones,) o (n_vigas, n_estaciones)
+    V: Cortante último en cada estación (kg) - misma forma que x
+    b, d, h: Dimensiones (cm), un valor por viga
+    Av_estribo: Área de las ramas del estribo (cm²), por defecto 2 ramas de 3/8"
+    Retorna arreglos por estación y las zonas del cuadro de estribos
+    """
+    V = np.atleast_2d(np.asarray(V, dtype=float))
+    x = np.broadcast_to(np.atleast_2d(np.asarray(x, dtype=float)), V.shape)
+    n_vigas = V.shape[0]
+    b, d = (np.broadcast_to(np.asarray(v, dtype=float), (n_vigas,))[:, None] for v in (b, d))
+    h = d + 6.0 if h is None else np.broadcast_to(np.asarray(h, dtype=float), (n_vigas,))[:, None]
+
+    # 1. Resistencia del concreto y acero requerido en todas las estaciones
+    Vc, Vs_requerido, Av_s = calcular_av_s_requerido(fc, fy, b, d, V)
+    Vs_max = 2.1 * np.sqrt(fc) * b * d
+    cumple = Vs_requerido <= Vs_max
+
+    # 2. Separación máxima: d/2 ≤ 60 cm, o d/4 ≤ 30 cm si Vs > 1.1·√f'c·b·d
+    s_max = np.where(Vs_requerido > 1.1 * np.sqrt(fc) * b * d,
+                     np.minimum(d / 4, 30.0), np.minimum(d / 2, 60.0))
+
+    # 3. Zona de confinamiento: 2h desde cada cara de apoyo (E.060 21.4.4.4)
+    if confinamiento:
+        distancia = np.minimum(x - x[:, :1], x[:, -1:] - x) * 100
+        s_confinamiento = np.minimum(d / 4, min(10 * db_longitudinal, 24 * db_estribo, 30.0))
+        en_zona = distancia <= 2 * h
+        s_max = np.where(en_zona, np.minimum(s_max, s_confinamiento), s_max)
+    else:
+        en_zona = np.zeros(V.shape, dtype=bool)
+
+    # 4. Separación requerida y redondeo al incremento práctico
+    with np.errstate(divide='ignore'):
+        s_requerido = np.minimum(Av_estribo / Av_s, s_max)
+    s_practico = np.floor(s_requerido / incremento) * incremento
+    cumple &= s_practico >= s_minimo
+    s_practico = _envolvente_monotona(np.maximum(s_practico, s_minimo))
+
+    # 5. Zonas: tramos contiguos con la misma separación práctica
+    cambio = np.diff(s_practico, axis=1) != 0
+    inicio = np.hstack([np.ones((n_vigas, 1), dtype=bool), cambio])
+    fin = np.hstack([cambio, np.ones((n_vigas, 1), dtype=bool)])
+    bordes = (x[:, 1:] + x[:, :-1]) / 2
+    x_izq = np.hstack([x[:, :1], bordes])
+    x_der = np.hstack([bordes, x[:, -1:]])
+    viga_zona = np.nonzero(inicio)[0]
+    longitud = (x_der[fin] - x_izq[inicio]) * 100
+    s_zona = s_practico[inicio]
+
+    zonas = {
+        'viga': viga_zona,
+        'x_inicio': x_izq[inicio],
+        'x_fin': x_der[fin],
+        's': s_zona,
+        'n_estribos': np.ceil(longitud / s_zona - 1e-9).astype(int),
+    }
+    return {
+        'Vc': np.broadcast_to(Vc, V.shape),
+        'Vs_requerido': Vs_requerido,
+        'Vs_max': np.broadcast_to(Vs_max, V.shape),
+        'Av_s_requerido': Av_s,
+        's_max': s_max,
+        's_requerido': s_requerido,
+        's_practico': s_practico,
+        'zona_confinamiento': en_zona,
+        'cumple': cumple,
+        'verificacion': cumple.all(axis=1),
+        'zonas': zonas,
+        'n_estribos': np.bincount(viga_zona, weights=zonas['n_estribos'], minlength=n_vigas).astype(int),
+    }
+
+
+def cuadro_estribos(resultado, viga=0):
+    """Texto del cuadro de estribos de una viga, p. ej. '1@5cm, 9@10cm, 12@25cm, 9@10cm'"""
+    zonas = resultado['zonas']
+    propias = zonas['viga'] == viga
+    tramos = [f"{n}@{s:g}cm" for n, s in zip(zonas['n_estribos'][propias], zonas['s'][propias])]
+    return ", ".join(["1@5cm"] + tramos)
@@ -0,0 +1,226 @@
+"""
+Esbeltez de Columnas y Magnificación de Momentos - CONSORCIO DEJ
+Factores de longitud efectiva por rigideces relativas del pórtico (nomogramas de
+Jackson-Moreland resueltos numéricamente), clasificación arriostrado / no arriostrado
+por piso y factores δns, δs para todas las columnas (ACI 318-2025 6.6.4 / E.060)
+Unidades: kg, cm (momentos en kg·cm)
+"""
+
+import numpy as np
+
+from diagrama_interaccion import verificar_columna
+from flexion_general import biseccion
+from modelo_portico import COLUMNA, VIGA, cargas_laterales, desplazamientos_piso, resolver_portico
+
+# Rigideces efectivas para análisis de primer orden (ACI 318-2025 6.6.3.1.1)
+FACTOR_INERCIA_COLUMNA = 0.70
+FACTOR_INERCIA_VIGA = 0.35
+
+
+def factor_k_arriostrado(psi_a, psi_b):
+    """
+    k de pórticos arriostrados (nomograma sin desplazamiento lateral), con u = π/k ∈ (π, 2π):
+    ψAψB/4·u² + (ψA+ψB)/2·(1 - u/tan u) + 2·tan(u/2)/u - 1 = 0
+    """
+    psi_a, psi_b = np.broadcast_arrays(*(np.clip(np.asarray(v, dtype=float), 1e-6, 1e6) for v in (psi_a, psi_b)))
+
+    def ecuacion(u):
+        return (psi_a * psi_b / 4 * u**2 + (psi_a + psi_b) / 2 * (1 - u / np.tan(u))
+                + 2 * np.tan(u / 2) / u - 1)
+
+    u = biseccion(ecuacion, np.full(psi_a.shape, np.pi * (1 + 1e-9)), np.full(psi_a.shape, 2 * np.pi * (1 - 1e-9)))
+    return np.pi / u
+
+
+def factor_k_no_arriostrado(psi_a, psi_b):
+    """
+    k de pórticos no arriostrados (nomograma con desplazamiento lateral), con u = π/k ∈ (0, π):
+    (ψAψB·u² - 36) / (6·(ψA+ψB)) - u/tan u = 0
+    """
+    psi_a, psi_b = np.broadcast_arrays(*(np.clip(np.asarray(v, dtype=float), 1e-6, 1e6) for v in (psi_a, psi_b)))
+
+    def ecuacion(u):
+        return (psi_a * psi_b * u**2 - 36) / (6 * (psi_a + psi_b)) - u / np.tan(u)
+
+    u = biseccion(ecuacion, np.full(psi_a.shape, 1e-9), np.full(psi_a.shape, np.pi * (1 - 1e-9)))
+    return np.pi / u
+
+
+def factores_psi(portico, psi_base=1.0):
+    """
+    ψ = Σ(EI/L) columnas / Σ(EI/L) vigas en cada nudo, con 0.70·Ig y 0.35·Ig
+    Retorna ψ en el extremo inferior y superior de cada columna; los nudos de la base
+    (empotrados) toman psi_base
+    """
+    tipo = portico['tipo']
+    factor = np.where(tipo == COLUMNA, FACTOR_INERCIA_COLUMNA, FACTOR_INERCIA_VIGA)
+    rigidez = factor * portico['E'] * portico['I'] / portico['L']
+    n_nudos = len(portico['coords'])
+    nodos = portico['nodos']
+
+    suma = np.zeros((2, n_nudos))
+    for extremo in (0, 1):
+        np.add.at(suma, (tipo, nodos[:, extremo]), rigidez)
+    with np.errstate(divide='ignore'):
+        psi = np.where(suma[VIGA] > 0, suma[COLUMNA] / suma[VIGA], np.inf)
+    psi[portico['piso_nudo'] == 0] = psi_base
+
+    columnas = np.flatnonzero(tipo == COLUMNA)
+    return psi[nodos[columnas, 0]], psi[nodos[columnas, 1]]
+
+
+def indice_estabilidad(portico, fuerzas_piso, Pu_columnas):
+    """
+    Q = ΣPu·Δo / (Vus·lc) por piso con rigideces fisuradas (ACI 318-2025 6.6.4.3);
+    el piso se considera arriostrado si Q ≤ 0.05
+    """
+    fisurado = dict(portico)
+    fisurado['I'] = portico['I'] * np.where(portico['tipo'] == COLUMNA, FACTOR_INERCIA_COLUMNA,
+                                            FACTOR_INERCIA_VIGA)
+    u = resolver_portico(fisurado, cargas_laterales(fisurado, fuerzas_piso))
+    desplazamiento = desplazamientos_piso(fisurado, u)
+    deriva = np.diff(np.concatenate([[0.0], desplazamiento]))
+
+    columnas = portico['tipo'] == COLUMNA
+    piso = portico['piso'][columnas] - 1
+    Pu_piso = np.bincount(piso, weights=Pu_columnas, minlength=portico['num_pisos'])
+    Vus = np.cumsum(np.asarray(fuerzas_piso, dtype=float)[::-1])[::-1]
+    lc = np.bincount(piso, weights=portico['L'][columnas], minlength=portico['num_pisos']) / np.bincount(piso)
+    Q = Pu_piso * deriva / (Vus * lc)
+    return {'Q': Q, 'deriva': deriva, 'arriostrado': Q <= 0.05}
+
+
+def analizar_esbeltez(portico, fuerzas_piso, Pu_columnas, psi_base=1.0, beta_dns=0.6):
+    """
+    Esbeltez de todas las columnas del pórtico
+
+    fuerzas_piso: Fuerzas laterales de primer orden por piso (kg)
+    Pu_columnas: Carga axial mayorada de cada columna (kg), en el orden de los elementos
+    Retorna por columna ψ, k (según la clasificación de su piso), lu, r, k·lu/r y Pc
+    """
+    columnas = np.flatnonzero(portico['tipo'] == COLUMNA)
+    piso = portico['piso'][columnas]
+
+    # 1. Clasificación por piso
+    estabilidad = indice_estabilidad(portico, fuerzas_piso, Pu_columnas)
+    arriostrado = estabilidad['arriostrado'][piso - 1]
+
+    # 2. Factores k de ambos nomogramas para todas las columnas
+    psi_inf, psi_sup = factores_psi(portico, psi_base)
+    k_arriostrado = factor_k_arriostrado(psi_inf, psi_sup)
+    k_no_arriostrado = factor_k_no_arriostrado(psi_inf, psi_sup)
+    k = np.where(arriostrado, k_arriostrado, k_no_arriostrado)
+
+    # 3. Longitud libre (descontando el peralte de la viga superior) y radio de giro r = 0.3·h
+    vigas = portico['tipo'] == VIGA
+    h_viga = np.zeros(portico['num_pisos'] + 1)
+    if vigas.any():
+        h_viga[1:] = np.bincount(portico['piso'][vigas] - 1, weights=portico['h'][vigas],
+                                 minlength=portico['num_pisos']) / np.maximum(
+            np.bincount(portico['piso'][vigas] - 1, minlength=portico['num_pisos']), 1)
+    lu = portico['L'][columnas] - h_viga[piso]
+    r = 0.3 * portico['h'][columnas]
+
+    # 4. Cargas críticas: (EI)eff = 0.4·Ec·Ig/(1 + βdns) sin desplazamiento y 0.4·Ec·Ig con desplazamiento
+    EI = 0.4 * portico['E'][columnas] * portico['I'][columnas]
+    Pc_ns = np.pi**2 * EI / (1 + beta_dns) / (k_arriostrado * lu)**2
+    Pc_s = np.pi**2 * EI / (k_no_arriostrado * lu)**2
+    return {
+        'columnas': columnas,
+        'piso': piso,
+        'Q': estabilidad['Q'],
+        'arriostrado_piso': estabilidad['arriostrado'],
+        'arriostrado': arriostrado,
+        'psi_inferior': psi_inf,
+        'psi_superior': psi_sup,
+        'k_arriostrado': k_arriostrado,
+        'k_no_arriostrado': k_no_arriostrado,
+        'k': k,
+        'lu': lu,
+        'r': r,
+        'h': portico['h'][columnas],
+        'Ag': portico['A'][columnas],
+        'fc': portico['fc'],
+        'esbeltez': k * lu / r,
+        'Pc_ns': Pc_ns,
+        'Pc_s': Pc_s,
+    }
+
+
+def _ordenar_extremos(M_i, M_j):
+    """M1 (menor), M2 (mayor) en valor absoluto y M1/M2 con signo ACI (negativo en curvatura simple)"""
+    mayor_j = np.abs(M_j) >= np.abs(M_i)
+    M1 = np.where(mayor_j, M_i, M_j)
+    M2 = np.where(mayor_j, M_j, M_i)
+    # Momentos de extremo con el mismo signo (convención de elemento) → doble curvatura
+    with np.errstate(divide='ignore', invalid='ignore'):
+        razon = np.where(M2 != 0, np.sign(M_i * M_j) * np.abs(M1) / np.abs(M2), 1.0)
+    return M1, M2, razon
+
+
+def magnificar_momentos(esbeltez, Pu, M_ns_i, M_ns_j, M_s_i=0.0, M_s_j=0.0):
+    """
+    Momentos magnificados de todas las columnas y combinaciones (arreglos (..., n_columnas))
+
+    M_ns_i, M_ns_j: momentos de extremo sin desplazamiento lateral (gravedad), convención de elemento
+    M_s_i, M_s_j: momentos de extremo por desplazamiento lateral (sismo/viento)
+    Los pisos no arriostrados amplifican M_s con δs = 1/(1 - ΣPu/(0.75·ΣPc)); luego se aplica δns
+    a lo largo de la columna. Se respeta M2,min = Pu·(1.5 + 0.03h)
+    """
+    Pu, M_ns_i, M_ns_j, M_s_i, M_s_j = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (Pu, M_ns_i, M_ns_j, M_s_i, M_s_j)))
+    piso = esbeltez['piso'] - 1
+    n_pisos = len(esbeltez['Q'])
+    h, r, lu = esbeltez['h'], esbeltez['r'], esbeltez['lu']
+
+    # 1. δs por piso: ΣPu y ΣPc de las columnas del piso (para todas las combinaciones a la vez)
+    pertenece = (piso[:, None] == np.arange(n_pisos)[None, :]).astype(float)
+    suma_Pu = Pu @ pertenece
+    suma_Pc = esbeltez['Pc_s'] @ pertenece
+    with np.errstate(divide='ignore'):
+        delta_s = np.where(suma_Pu < 0.75 * suma_Pc, 1 / (1 - suma_Pu / (0.75 * suma_Pc)), np.inf)
+    delta_s = np.where(esbeltez['arriostrado_piso'], 1.0, np.maximum(delta_s, 1.0))[..., piso]
+
+    M_i = M_ns_i + delta_s * M_s_i
+    M_j = M_ns_j + delta_s * M_s_j
+    M1, M2, razon = _ordenar_extremos(M_i, M_j)
+
+    # 2. Límite para despreciar la esbeltez: 34 + 12·M1/M2 ≤ 40 (arriostrado), 22 (no arriostrado)
+    limite = np.where(esbeltez['arriostrado'], np.minimum(34 + 12 * razon, 40.0), 22.0)
+    esbelta = esbeltez['esbeltez'] > limite
+
+    # 3. δns con Cm = 0.6 - 0.4·M1/M2 ≥ 0.4 (en no arriostrados solo si lu/r > 35/√(Pu/(f'c·Ag)))
+    Cm = np.maximum(0.6 - 0.4 * razon, 0.4)
+    with np.errstate(divide='ignore'):
+        delta_ns = np.where(Pu < 0.75 * esbeltez['Pc_ns'], Cm / (1 - Pu / (0.75 * esbeltez['Pc_ns'])), np.inf)
+    delta_ns = np.maximum(delta_ns, 1.0)
+    M2_min = Pu * (1.5 + 0.03 * h)
+    limite_ns = 35 / np.sqrt(np.maximum(Pu, 1e-9) / (esbeltez['fc'] * esbeltez['Ag']))
+    aplica_ns = esbelta & (esbeltez['arriostrado'] | (lu / r > limite_ns))
+    Mc = np.where(aplica_ns, delta_ns * np.maximum(np.abs(M2), M2_min), np.maximum(np.abs(M2), M2_min))
+    return {
+        'M1': M1,
+        'M2': M2,
+        'M1_M2': razon,
+        'delta_s': delta_s,
+        'delta_ns': np.where(aplica_ns, delta_ns, 1.0),
+        'esbelta': esbelta,
+        'estable': np.isfinite(Mc),
+        'Mc': Mc,
+    }
+
+
+def verificar_columnas_esbeltas(esbeltez, secciones, indice_seccion, fc, fy, Pu, magnificados):
+    """
+    Verifica (Pu, Mc) de todas las columnas contra su diagrama de interacción
+
+    secciones: lista de secciones de diagrama_interaccion; indice_seccion: sección de cada columna
+    magnificados: resultado de magnificar_momentos
+    """
+    Pu, Mc = np.broadcast_arrays(np.asarray(Pu, dtype=float), magnificados['Mc'])
+    indice = np.broadcast_to(np.asarray(indice_seccion), Pu.shape)
+    razon = np.full(Pu.shape, np.inf)
+    for k in np.unique(indice):
+        grupo = (indice == k) & np.isfinite(Mc)
+        razon[grupo] = verificar_columna(secciones[k], fc, fy, Pu[grupo], Mc[grupo])['razon']
+    return {'razon': razon, 'cumple': razon <= 1.0}
@@ -0,0 +1,220 @@
+"""
+Flexión Biaxial de Columnas - CONSORCIO DEJ
+Métodos de carga recíproca y de contorno de carga de Bresler, y superficie de
+interacción 3D por fibras, vectorizados sobre todas las combinaciones de carga
+Unidades: kg, cm (momentos en kg·cm, compresión positiva)
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from flexion_vectorizada import calcular_beta1
+from diagrama_interaccion import (
+    ES,
+    ECU,
+    firma_seccion,
+    calcular_diagrama_interaccion,
+    razon_demanda_capacidad,
+    factor_phi,
+)
+
+
+def momento_resistente(curva_M, curva_P, Pu):
+    """
+    Momento resistente del polígono de interacción al nivel de carga axial Pu
+    Retorna el mayor momento positivo y el menor negativo para cada Pu
+    """
+    Pu = np.atleast_1d(np.asarray(Pu, dtype=float))[:, None]
+    Ax, Ay = np.asarray(curva_M)[:-1], np.asarray(curva_P)[:-1]
+    ex, ey = np.diff(curva_M), np.diff(curva_P)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        s = (Pu - Ay) / ey
+        M = Ax + s * ex
+    valido = (ey != 0) & (s >= 0) & (s <= 1)
+    M_pos = np.where(valido, M, -np.inf).max(axis=1)
+    M_neg = np.where(valido, M, np.inf).min(axis=1)
+    return np.maximum(M_pos, 0.0), np.minimum(M_neg, 0.0)
+
+
+def _capacidades_uniaxiales(seccion, fc, fy):
+    diagrama_x = calcular_diagrama_interaccion(seccion, fc, fy, 'x')
+    diagrama_y = calcular_diagrama_interaccion(seccion, fc, fy, 'y')
+    phi_c = 0.75 if seccion['espiral'] else 0.65
+    return diagrama_x, diagrama_y, phi_c * diagrama_x['P0']
+
+
+def _razon_bresler_reciproca(seccion, fc, fy, Pu, Mux, Muy):
+    """1/φPni = 1/φPnx + 1/φPny - 1/φP0 (válido para Pn ≥ 0.1·f'c·Ag)"""
+    diagrama_x, diagrama_y, phiP0 = _capacidades_uniaxiales(seccion, fc, fy)
+    razon_x = razon_demanda_capacidad(diagrama_x['phiMn'], diagrama_x['phiPn'], np.abs(Mux), Pu)
+    razon_y = razon_demanda_capacidad(diagrama_y['phiMn'], diagrama_y['phiPn'], np.abs(Muy), Pu)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        phiPnx = Pu / razon_x
+        phiPny = Pu / razon_y
+        phiPni = 1 / (1 / phiPnx + 1 / phiPny - 1 / phiP0)
+        razon = np.where(phiPni > 0, Pu / phiPni, np.inf)
+
+    # Carga axial baja: interacción lineal de momentos al nivel Pu
+    Ag = seccion['b'] * seccion['h'] if seccion['forma'] == 'rectangular' else np.pi * seccion['h']**2 / 4
+    baja = Pu < 0.1 * fc * Ag * (0.75 if seccion['espiral'] else 0.65)
+    lineal = _razon_contorno(seccion, fc, fy, Pu, Mux, Muy, alfa=1.0)
+    return np.where(baja, lineal, razon)
+
+
+def _razon_contorno(seccion, fc, fy, Pu, Mux, Muy, alfa=1.5):
+    """(Mux/φMnx)^α + (Muy/φMny)^α ≤ 1, con φMnx y φMny al nivel Pu"""
+    diagrama_x, diagrama_y, _ = _capacidades_uniaxiales(seccion, fc, fy)
+    Mx_pos, Mx_neg = momento_resistente(diagrama_x['phiMn'], diagrama_x['phiPn'], Pu)
+    My_pos, My_neg = momento_resistente(diagrama_y['phiMn'], diagrama_y['phiPn'], Pu)
+    phiMnx = np.where(Mux >= 0, Mx_pos, -Mx_neg)
+    phiMny = np.where(Muy >= 0, My_pos, -My_neg)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        termino_x = np.where(Mux == 0, 0.0, np.abs(Mux) / phiMnx)
+        termino_y = np.where(Muy == 0, 0.0, np.abs(Muy) / phiMny)
+    razon = np.maximum((termino_x**alfa + termino_y**alfa)**(1 / alfa), Pu / diagrama_x['phiPn_max'])
+    fuera_de_rango = (Pu > diagrama_x['phiPn_max']) | (Pu < diagrama_x['phiPn'].min())
+    return np.where(fuera_de_rango, np.inf, np.nan_to_num(razon, nan=np.inf))
+
+
+def _fibras_concreto(seccion, n_fibras):
+    """Centroides y áreas de fibras de concreto en coordenadas centradas (X a la derecha, Y hacia arriba)"""
+    b, h = seccion['b'], seccion['h']
+    xs = (np.arange(n_fibras) + 0.5) / n_fibras * b
+    ys = (np.arange(n_fibras) + 0.5) / n_fibras * h
+    X, Y = np.meshgrid(xs - b / 2, h / 2 - ys)
+    area = np.full(X.shape, b * h / n_fibras**2)
+    if seccion['forma'] == 'circular':
+        dentro = X**2 + Y**2 <= (h / 2)**2
+        area = np.where(dentro, area, 0.0)
+    return X.ravel(), Y.ravel(), area.ravel()
+
+
+@lru_cache(maxsize=256)
+def _meridianos_cacheados(firma, n_angulos, n_profundidades, n_fibras):
+    forma, b, h, bx, by, bAs, espiral, fc, fy = firma
+    seccion = {'forma': forma, 'b': b, 'h': h, 'espiral': espiral}
+    Xc, Yc, Ac = _fibras_concreto(seccion, n_fibras)
+    Xs = np.array(bx) - b / 2
+    Ys = h / 2 - np.array(by)
+    As = np.array(bAs)
+    beta1 = float(calcular_beta1(fc))
+    ey = fy / ES
+
+    # Dirección de compresión θ y profundidad c (ejes: ángulo × profundidad × fibra)
+    theta = 2 * np.pi * np.arange(n_angulos) / n_angulos
+    u = np.stack([np.cos(theta), np.sin(theta)], axis=1)
+    esquinas = np.array([[-b / 2, -h / 2], [b / 2, -h / 2], [b / 2, h / 2], [-b / 2, h / 2]])
+    extremo = (esquinas @ u.T).max(axis=0)
+    if forma == 'circular':
+        extremo = np.full(n_angulos, h / 2)
+
+    prof_c = extremo[:, None] - (u[:, 0:1] * Xc + u[:, 1:2] * Yc)
+    prof_s = extremo[:, None] - (u[:, 0:1] * Xs + u[:, 1:2] * Ys)
+    altura = 2 * extremo
+    c = altura[:, None] * np.geomspace(0.02, 4.0, n_profundidades)[None, :]
+
+    # Concreto: bloque equivalente; acero: compatibilidad de deformaciones
+    en_bloque = prof_c[:, None, :] < beta1 * c[:, :, None]
+    Fc = 0.85 * fc * Ac * en_bloque
+    eps_s = ECU * (c[:, :, None] - prof_s[:, None, :]) / c[:, :, None]
+    fs = np.clip(ES * eps_s, -fy, fy)
+    desplazado = 0.85 * fc * (prof_s[:, None, :] < beta1 * c[:, :, None])
+    Fs = As * (fs - desplazado)
+
+    Pn = Fc.sum(axis=2) + Fs.sum(axis=2)
+    Mnx = (Fc * Yc).sum(axis=2) + (Fs * Ys).sum(axis=2)
+    Mny = (Fc * Xc).sum(axis=2) + (Fs * Xs).sum(axis=2)
+    eps_t = ECU * (prof_s.max(axis=1)[:, None] - c) / c
+    phi = factor_phi(eps_t, ey, espiral)
+
+    Ag = Ac.sum()
+    P0 = 0.85 * fc * (Ag - As.sum()) + fy * As.sum()
+    phi_c = 0.75 if espiral else 0.65
+    phiPn_max = phi_c * (0.85 if espiral else 0.80) * P0
+    resultado = {
+        'theta': theta,
+        'Pn': Pn, 'Mnx': Mnx, 'Mny': Mny, 'phi': phi,
+        'phiPn': np.minimum(phi * Pn, phiPn_max), 'phiMnx': phi * Mnx, 'phiMny': phi * Mny,
+        'phiPn_max': phiPn_max,
+    }
+    for valor in resultado.values():
+        if isinstance(valor, np.ndarray):
+            valor.setflags(write=False)
+    return resultado
+
+
+def calcular_superficie_interaccion(seccion, fc, fy, n_angulos=36, n_profundidades=40, n_fibras=30):
+    """
+    Meridianos de la superficie de interacción 3D (P, Mx, My) para n_angulos
+    direcciones del eje neutro; se guardan en caché por firma de sección
+    """
+    return _meridianos_cacheados(firma_seccion(seccion, fc, fy), int(n_angulos), int(n_profundidades),
+                                 int(n_fibras))
+
+
+def _razon_superficie(seccion, fc, fy, Pu, Mux, Muy):
+    """Contorno de la superficie al nivel Pu y razón por rayo desde el origen en el plano (Mx, My)"""
+    sup = calcular_superficie_interaccion(seccion, fc, fy)
+    n_angulos = len(sup['theta'])
+
+    # Contorno de cada punto: interpolación de cada meridiano al nivel de su Pu
+    Mx = np.empty((len(Pu), n_angulos))
+    My = np.empty((len(Pu), n_angulos))
+    for k in range(n_angulos):
+        orden = np.argsort(sup['phiPn'][k])
+        P_k = sup['phiPn'][k][orden]
+        Mx[:, k] = np.interp(Pu, P_k, sup['phiMnx'][k][orden])
+        My[:, k] = np.interp(Pu, P_k, sup['phiMny'][k][orden])
+
+    # Intersección del rayo (Mux, Muy) con el contorno cerrado
+    Ax, Ay = Mx, My
+    ex = np.roll(Mx, -1, axis=1) - Mx
+    ey = np.roll(My, -1, axis=1) - My
+    qx, qy = Mux[:, None], Muy[:, None]
+    det = qy * ex - qx * ey
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = (Ay * ex - Ax * ey) / det
+        s = (qx * Ay - qy * Ax) / det
+    valido = (np.abs(det) > 0) & (s >= -1e-12) & (s <= 1 + 1e-12) & (t > 0)
+    t = np.where(valido, t, np.inf).min(axis=1)
+    razon = np.where(np.isfinite(t), 1 / t, np.inf)
+    razon = np.maximum(np.where((Mux == 0) & (Muy == 0), 0.0, razon), Pu / sup['phiPn_max'])
+    fuera_de_rango = (Pu > sup['phiPn_max']) | (Pu < sup['phiPn'].min())
+    return np.where(fuera_de_rango, np.inf, razon)
+
+
+METODOS = {
+    'bresler': _razon_bresler_reciproca,
+    'contorno': _razon_contorno,
+    'superficie': _razon_superficie,
+}
+
+
+def verificar_flexion_biaxial(secciones, indice_seccion, fc, fy, Pu, Mux, Muy, metodo='bresler',
+                              tamano_bloque=8192):
+    """
+    Verifica todas las combinaciones (Pu, Mux, Muy) de todas las columnas en una pasada
+
+    secciones: Lista de secciones (crear_seccion_rectangular / crear_seccion_circular)
+    indice_seccion: Sección de cada punto de carga (arreglo de enteros)
+    Pu, Mux, Muy: Arreglos de la misma forma que indice_seccion (kg, kg·cm)
+    metodo: 'bresler' (carga recíproca), 'contorno' (contorno de carga) o 'superficie' (3D)
+    """
+    Pu, Mux, Muy, indice = np.broadcast_arrays(
+        np.asarray(Pu, dtype=float), np.asarray(Mux, dtype=float), np.asarray(Muy, dtype=float),
+        np.asarray(indice_seccion))
+    forma = Pu.shape
+    Pu, Mux, Muy, indice = Pu.ravel(), Mux.ravel(), Muy.ravel(), indice.ravel()
+    calcular_razon = METODOS[metodo]
+
+    # Agrupación por sección y bloques de tamaño fijo para acotar la memoria
+    razon = np.empty(Pu.shape)
+    for k in np.unique(indice):
+        grupo = np.flatnonzero(indice == k)
+        for inicio in range(0, len(grupo), tamano_bloque):
+            filas = grupo[inicio:inicio + tamano_bloque]
+            razon[filas] = calcular_razon(secciones[k], fc, fy, Pu[filas], Mux[filas], Muy[filas])
+
+    razon = razon.reshape(forma)
+    return {'razon': razon, 'cumple': razon <= 1.0}
@@ -0,0 +1,150 @@
+"""
+Flexión General por Compatibilidad de Deformaciones - CONSORCIO DEJ
+Secciones T, L y rectangulares con acero simple o doble (ACI 318-2025 / E.060):
+búsqueda del eje neutro por bisección vectorizada sobre muchas secciones a la vez
+Unidades: kg, cm (Mu en kg·cm)
+"""
+
+import numpy as np
+
+from diagrama_interaccion import ES, ECU, factor_phi
+from flexion_vectorizada import calcular_beta1, calcular_cuantias
+
+# Límite de sección controlada por tracción: εt = 0.005 → c/d = 0.003/0.008
+C_D_TRACCION = ECU / (ECU + 0.005)
+
+
+def ancho_efectivo_ala(bw, hf, L, separacion_libre, tipo='T'):
+    """
+    Ancho efectivo del ala (cm) de vigas monolíticas con la losa (ACI 318-2025 Tabla 6.3.2.1)
+
+    bw, hf: ancho del alma y espesor de losa (cm); L: luz (cm); separacion_libre: distancia
+    libre a la viga vecina (cm); tipo: 'T' (losa a ambos lados) o 'L' (a un lado)
+    """
+    bw, hf, L, sw = (np.asarray(v, dtype=float) for v in (bw, hf, L, separacion_libre))
+    if tipo == 'T':
+        return bw + 2 * np.minimum(np.minimum(8 * hf, sw / 2), L / 8)
+    return bw + np.minimum(np.minimum(6 * hf, sw / 2), L / 12)
+
+
+def _bloque_ala(b, bf, hf, a):
+    """Área y centroide (desde la fibra superior) del bloque de compresión en sección T/L"""
+    a_ala = np.minimum(a, hf)
+    area = b * a + (bf - b) * a_ala
+    momento = b * a**2 / 2 + (bf - b) * a_ala**2 / 2
+    return area, momento / np.where(area > 0, area, 1.0)
+
+
+def _esfuerzo_acero(c, profundidad, fy):
+    """Esfuerzo (compresión positiva) del acero a 'profundidad' desde la fibra superior"""
+    return np.clip(ES * ECU * (c - profundidad) / c, -fy, fy)
+
+
+def biseccion(funcion, inferior, superior, iteraciones=60):
+    """Raíz de una función creciente, vectorizada: todos los elementos (p. ej. secciones) avanzan juntos"""
+    for _ in range(iteraciones):
+        medio = (inferior + superior) / 2
+        positivo = funcion(medio) > 0
+        superior = np.where(positivo, medio, superior)
+        inferior = np.where(positivo, inferior, medio)
+    return (inferior + superior) / 2
+
+
+def calcular_resistencia_flexion(fc, fy, b, d, As, As_prima=0.0, d_prima=6.0, bf=None, hf=None):
+    """
+    Momento resistente de secciones con As en tracción y A's en compresión
+
+    b: ancho del alma; bf, hf: ancho y espesor del ala (por defecto sección rectangular)
+    El eje neutro se obtiene por bisección del equilibrio C(c) - T(c) = 0
+    """
+    bf = b if bf is None else bf
+    hf = d if hf is None else hf
+    fc, fy, b, d, As, As_prima, d_prima, bf, hf = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (fc, fy, b, d, As, As_prima, d_prima, bf, hf)))
+    beta1 = calcular_beta1(fc)
+
+    def fuerzas(c):
+        area, y_c = _bloque_ala(b, bf, hf, beta1 * c)
+        fs_prima = _esfuerzo_acero(c, d_prima, fy)
+        desplazado = np.where(beta1 * c > d_prima, 0.85 * fc, 0.0)
+        Cc = 0.85 * fc * area
+        Cs = As_prima * (fs_prima - desplazado)
+        T = -As * _esfuerzo_acero(c, d, fy)
+        return Cc, y_c, Cs, T
+
+    def residuo(c):
+        Cc, _, Cs, T = fuerzas(c)
+        return Cc + Cs - T
+
+    c = biseccion(residuo, np.full(d.shape, 1e-6), d / beta1)
+    Cc, y_c, Cs, T = fuerzas(c)
+    Mn = Cc * (d - y_c) + Cs * (d - d_prima)
+    eps_t = ECU * (d - c) / c
+    phi = factor_phi(eps_t, fy / ES)
+    return {
+        'c': c,
+        'c_d': c / d,
+        'a': beta1 * c,
+        'eps_t': eps_t,
+        'fs_prima': _esfuerzo_acero(c, d_prima, fy),
+        'Mn': Mn,
+        'phi': phi,
+        'phiMn': phi * Mn,
+    }
+
+
+def calcular_diseno_flexion_general(fc, fy, b, d, Mu, bf=None, hf=None, d_prima=6.0, c_d_max=C_D_TRACCION):
+    """
+    Diseño por flexión de secciones T/L o rectangulares, con acero en compresión si hace falta
+
+    Si Mu ≤ φMn con c/d = c_d_max (tracción controlada), el eje neutro que equilibra Mu se
+    busca por bisección y As = C/fy; si no, se fija c = c_d_max·d y el momento restante lo
+    toma el par A's - As adicional, con f's por compatibilidad de deformaciones.
+    Retorna As, A's, c/d y φ por sección
+    """
+    bf = b if bf is None else bf
+    hf = d if hf is None else hf
+    fc, fy, b, d, Mu, bf, hf, d_prima = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (fc, fy, b, d, Mu, bf, hf, d_prima)))
+    beta1 = calcular_beta1(fc)
+    phi = 0.9
+
+    def momento_concreto(c):
+        area, y_c = _bloque_ala(b, bf, hf, beta1 * c)
+        Cc = 0.85 * fc * area
+        return Cc, Cc * (d - y_c)
+
+    # 1. Capacidad con acero simple en el límite de tracción controlada
+    c_lim = c_d_max * d
+    Cc_lim, Mn_lim = momento_concreto(c_lim)
+    doble = phi * Mn_lim < Mu
+
+    # 2. Acero simple: eje neutro tal que φ·Mn(c) = Mu
+    c = biseccion(lambda c: phi * momento_concreto(c)[1] - Mu, np.full(d.shape, 1e-6), c_lim)
+    Cc, _ = momento_concreto(c)
+    As_simple = Cc / fy
+
+    # 3. Acero doble: par adicional A's·(f's - 0.85f'c) con brazo d - d'
+    fs_prima = _esfuerzo_acero(c_lim, d_prima, fy)
+    esfuerzo_neto = fs_prima - np.where(beta1 * c_lim > d_prima, 0.85 * fc, 0.0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        As_prima = np.where(doble, (Mu / phi - Mn_lim) / (esfuerzo_neto * (d - d_prima)), 0.0)
+    As_doble = (Cc_lim + As_prima * esfuerzo_neto) / fy
+
+    # 4. Acero mínimo en el alma y resultado por sección
+    As_min = calcular_cuantias(fc, fy)['rho_min'] * b * d
+    As = np.maximum(np.where(doble, As_doble, As_simple), As_min)
+    c = np.where(doble, c_lim, c)
+    cumple = ~doble | ((esfuerzo_neto > 0) & (d_prima < c_lim))
+    return {
+        'As': As,
+        'As_prima': np.where(cumple, As_prima, np.nan),
+        'c': c,
+        'c_d': c / d,
+        'phi': factor_phi(ECU * (d - c) / c, fy / ES),
+        'doblemente_reforzada': doble,
+        'ala_en_compresion': beta1 * c > hf,
+        'fs_prima': np.where(doble, fs_prima, 0.0),
+        'requiere_minimo': As_min > np.where(doble, As_doble, As_simple),
+        'verificacion': cumple,
+    }
@@ -0,0 +1,88 @@
+"""
+Diseño por Flexión Vectorizado - CONSORCIO DEJ
+Versión con arreglos NumPy de calcular_diseno_flexion (ACI 318-2025):
+la cuantía requerida se obtiene en forma cerrada de la ecuación cuadrática en ρ
+Unidades: kg, cm (Mu en kg·cm)
+"""
+
+import numpy as np
+
+
+def calcular_beta1(fc):
+    """β1 del bloque equivalente de compresión para arreglos de f'c"""
+    fc = np.asarray(fc, dtype=float)
+    return np.where(fc <= 280, 0.85, np.maximum(0.85 - 0.05 * ((fc - 280) / 70), 0.65))
+
+
+def calcular_cuantias(fc, fy):
+    """Cuantías balanceada, mínima y máxima para arreglos de f'c y fy"""
+    fc = np.asarray(fc, dtype=float)
+    fy = np.asarray(fy, dtype=float)
+    beta1 = calcular_beta1(fc)
+    rho_b = 0.85 * beta1 * (fc / fy) * (6000 / (6000 + fy))
+    rho_min = np.maximum(0.8 * np.sqrt(fc) / fy, 14 / fy)
+    rho_max = 0.75 * rho_b
+    return {'beta1': beta1, 'rho_b': rho_b, 'rho_min': rho_min, 'rho_max': rho_max}
+
+
+def calcular_rho_requerido(fc, fy, b, d, Mu, phi=0.9):
+    """
+    Cuantía requerida de la ecuación Mu = φ·ρ·fy·b·d²·(1 - 0.59·ρ·fy/f'c)
+
+    ρ = 0.85·f'c/fy·(1 - √(1 - 2·Ru/(0.85·φ·f'c))), con Ru = Mu/(b·d²)
+    Retorna (rho, existe_solucion); donde el discriminante es negativo la sección
+    no alcanza Mu con acero simple y rho se devuelve como NaN
+    """
+    fc = np.asarray(fc, dtype=float)
+    fy = np.asarray(fy, dtype=float)
+    Ru = np.asarray(Mu, dtype=float) / (np.asarray(b, dtype=float) * np.asarray(d, dtype=float)**2)
+    discriminante = 1 - 2 * Ru / (0.85 * phi * fc)
+    existe = discriminante >= 0
+    rho = 0.85 * fc / fy * (1 - np.sqrt(np.where(existe, discriminante, np.nan)))
+    return rho, existe
+
+
+def calcular_diseno_flexion_vectorizado(fc, fy, b, d, Mu):
+    """
+    Diseño por flexión de muchas secciones rectangulares en una sola llamada
+
+    fc, fy: kg/cm²; b, d: cm; Mu: kg·cm (arreglos con formas compatibles)
+    Retorna un diccionario de arreglos con las mismas claves de calcular_diseno_flexion
+    más las máscaras de verificación
+    """
+    fc, fy, b, d, Mu = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (fc, fy, b, d, Mu)))
+    phi = 0.9
+
+    # 1. Cuantías límite
+    cuantias = calcular_cuantias(fc, fy)
+
+    # 2. Cuantía requerida en forma cerrada
+    rho_requerido, existe_solucion = calcular_rho_requerido(fc, fy, b, d, Mu, phi)
+
+    # 3. Cuantía de diseño (no menor que la mínima)
+    requiere_minimo = existe_solucion & (rho_requerido < cuantias['rho_min'])
+    rho = np.where(requiere_minimo, cuantias['rho_min'], rho_requerido)
+    cumple_cuantia_max = existe_solucion & (rho <= cuantias['rho_max'])
+
+    # 4. Acero y momento resistente
+    As = rho * b * d
+    a = As * fy / (0.85 * fc * b)
+    Mn = As * fy * (d - a / 2)
+    phiMn = phi * Mn
+
+    return {
+        'beta1': cuantias['beta1'],
+        'rho_b': cuantias['rho_b'],
+        'rho_min': cuantias['rho_min'],
+        'rho_max': cuantias['rho_max'],
+        'rho_requerido': rho_requerido,
+        'rho': rho,
+        'As': As,
+        'a': a,
+        'Mn': Mn,
+        'phiMn': phiMn,
+        'existe_solucion': existe_solucion,
+        'requiere_minimo': requiere_minimo,
+        'cumple_cuantia_max': cumple_cuantia_max,
+        'verificacion': existe_solucion & cumple_cuantia_max & (phiMn >= Mu * (1 - 1e-9)),
+    }
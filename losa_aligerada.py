@@ -0,0 +1,278 @@
+"""
+Diseño de Losas Aligeradas en una Dirección - CONSORCIO DEJ
+Momentos por vigueta con coeficientes E.060 o viga continua (ecuación de tres momentos
+con alternancia de carga viva), acero positivo y negativo, ensanches por cortante y deflexiones
+Unidades: kg, cm (luces en m, cargas en kg/m², momentos de diseño en kg·cm)
+"""
+
+import numpy as np
+
+from diseno_estribos import PHI_CORTANTE
+from flexion_vectorizada import calcular_cuantias, calcular_rho_requerido
+from seleccion_barras import AREAS, DESIGNACION
+
+# Geometría típica de aligerado con ladrillo de 30 cm: viguetas cada 40 cm
+SEPARACION_VIGUETAS = 0.40   # m
+ANCHO_VIGUETA = 10.0         # cm
+ESPESOR_LOSA = 5.0           # cm
+RECUBRIMIENTO_VIGUETA = 3.0  # cm al centroide del acero
+
+# Peso propio del aligerado (kg/m²) por peralte total (cm) - E.020 Anexo 1
+PESO_ALIGERADO = {17: 280.0, 20: 300.0, 25: 350.0, 30: 420.0}
+
+# Anchos efectivos de vigueta con ensanche (ladrillos retirados)
+ANCHO_ENSANCHE = {'alternado': 25.0, 'corrido': 40.0}
+
+
+def franjas_losa(luces_x, luces_y, direccion='x'):
+    """
+    Franjas de viguetas de un paño rectangular de luces_x × luces_y (m)
+
+    Las viguetas corren en 'direccion' y son continuas sobre todos los tramos;
+    cada vano de la otra dirección es una franja con ancho / 0.40 viguetas iguales
+    """
+    luces_x = np.asarray(luces_x, dtype=float)
+    luces_y = np.asarray(luces_y, dtype=float)
+    tramos, anchos = (luces_x, luces_y) if direccion == 'x' else (luces_y, luces_x)
+    return {
+        'luces': np.broadcast_to(tramos, (len(anchos), len(tramos))).copy(),
+        'ancho': anchos,
+        'n_viguetas': np.round(anchos / SEPARACION_VIGUETAS).astype(int),
+    }
+
+
+def peralte_aligerado(luces):
+    """Peralte del aligerado: h ≥ L/25 (criterio de la app) redondeado al espesor comercial"""
+    disponibles = np.array(sorted(PESO_ALIGERADO))
+    h_requerido = np.max(np.atleast_2d(luces)) * 100 / 25
+    return int(disponibles[min(np.searchsorted(disponibles, h_requerido - 1e-9), len(disponibles) - 1)])
+
+
+def momentos_coeficientes(luces, wu, ancho_apoyo=0.25):
+    """
+    Método de coeficientes E.060 (8.3.3) para viguetas continuas
+
+    luces: (n_franjas, n_tramos) luces entre ejes (m); wu: carga última por vigueta (kg/m)
+    Retorna magnitudes en kg·m: M_neg en apoyos (n, n_tramos + 1), M_pos por tramo y
+    V en las caras izquierda y derecha de cada tramo (n, n_tramos, 2)
+    """
+    luces = np.atleast_2d(luces)
+    wu = np.broadcast_to(np.asarray(wu, dtype=float).reshape(-1, 1), luces.shape)
+    n, m = luces.shape
+    Ln = luces - ancho_apoyo
+
+    # 1. Momentos positivos: tramos extremos wLn²/14 (apoyo monolítico), interiores wLn²/16
+    coef_pos = np.full(m, 16.0)
+    coef_pos[[0, -1]] = 14.0 if m > 1 else 8.0
+    M_pos = wu * Ln**2 / coef_pos
+
+    # 2. Momentos negativos: exterior wLn²/24; primer apoyo interior /9 (dos tramos) o /10; demás /11
+    Ln_apoyo = np.hstack([Ln[:, :1], (Ln[:, :-1] + Ln[:, 1:]) / 2, Ln[:, -1:]])
+    w_apoyo = np.hstack([wu[:, :1], np.maximum(wu[:, :-1], wu[:, 1:]), wu[:, -1:]])
+    coef_neg = np.full(m + 1, 11.0)
+    coef_neg[[0, -1]] = 24.0
+    if m > 1:
+        coef_neg[[1, -2]] = 9.0 if m == 2 else 10.0
+    M_neg = w_apoyo * Ln_apoyo**2 / coef_neg
+
+    # 3. Cortantes: 1.15·wLn/2 en la cara del primer apoyo interior, wLn/2 en las demás
+    V = np.repeat((wu * Ln / 2)[:, :, None], 2, axis=2)
+    if m > 1:
+        V[:, 0, 1] *= 1.15
+        V[:, -1, 0] *= 1.15
+    return {'M_neg': M_neg, 'M_pos': M_pos, 'V': V}
+
+
+def _patrones_carga_viva(m):
+    """Patrones de alternancia: todos los tramos, tramos pares, impares y pares adyacentes a cada apoyo"""
+    tramos = np.arange(m)
+    patrones = [np.ones(m), (tramos % 2 == 0) * 1.0, (tramos % 2 == 1) * 1.0]
+    for apoyo in range(1, m):
+        derecha = (tramos >= apoyo) & ((tramos - apoyo) % 2 == 0)
+        izquierda = (tramos < apoyo) & ((apoyo - 1 - tramos) % 2 == 0)
+        patrones.append((derecha | izquierda) * 1.0)
+    return np.array(patrones)
+
+
+def momentos_viga_continua(luces, w_muerta, w_viva, ancho_apoyo=0.25, factor_muerta=1.2, factor_viva=1.6):
+    """
+    Envolvente de momentos y cortantes de viguetas continuas simplemente apoyadas en sus ejes
+
+    Resuelve la ecuación de tres momentos para todas las franjas y todos los patrones
+    de carga viva en una sola llamada a np.linalg.solve; mismas salidas que momentos_coeficientes
+    """
+    luces = np.atleast_2d(luces)
+    n, m = luces.shape
+    w_muerta = np.broadcast_to(np.asarray(w_muerta, dtype=float).reshape(-1, 1), luces.shape)
+    w_viva = np.broadcast_to(np.asarray(w_viva, dtype=float).reshape(-1, 1), luces.shape)
+    patrones = _patrones_carga_viva(m)
+    # Cargas (n_franjas, n_patrones, n_tramos)
+    w = factor_muerta * w_muerta[:, None, :] + factor_viva * w_viva[:, None, :] * patrones[None, :, :]
+    L = np.broadcast_to(luces[:, None, :], w.shape)
+
+    # 1. Momentos en apoyos interiores (hogging negativo): sistema tridiagonal por franja y patrón
+    M_apoyos = np.zeros(w.shape[:2] + (m + 1,))
+    if m > 1:
+        A = np.zeros(w.shape[:2] + (m - 1, m - 1))
+        i = np.arange(m - 1)
+        A[..., i, i] = 2 * (L[..., :-1] + L[..., 1:])
+        A[..., i[1:], i[:-1]] = L[..., 1:-1]
+        A[..., i[:-1], i[1:]] = L[..., 1:-1]
+        rhs = -(w[..., :-1] * L[..., :-1]**3 + w[..., 1:] * L[..., 1:]**3) / 4
+        M_apoyos[..., 1:-1] = np.linalg.solve(A, rhs[..., None])[..., 0]
+
+    # 2. Momento positivo máximo y cortantes en las caras de cada tramo
+    Ma, Mb = M_apoyos[..., :-1], M_apoyos[..., 1:]
+    x_max = np.clip(L / 2 + (Mb - Ma) / (w * L), 0, L)
+    M_tramo = Ma * (1 - x_max / L) + Mb * x_max / L + w * x_max * (L - x_max) / 2
+    cara = ancho_apoyo / 2
+    V_izq = (Mb - Ma) / L + w * (L / 2 - cara)
+    V_der = -((Mb - Ma) / L + w * (L / 2 - (L - cara)))
+
+    # 3. Envolvente sobre patrones; en apoyos extremos monolíticos se toma wLn²/24 como mínimo
+    M_neg = np.max(-M_apoyos, axis=1)
+    w_max = w.max(axis=1)
+    Ln = luces - ancho_apoyo
+    M_neg[:, 0] = np.maximum(M_neg[:, 0], w_max[:, 0] * Ln[:, 0]**2 / 24)
+    M_neg[:, -1] = np.maximum(M_neg[:, -1], w_max[:, -1] * Ln[:, -1]**2 / 24)
+    return {
+        'M_neg': M_neg,
+        'M_pos': np.max(M_tramo, axis=1),
+        'V': np.stack([V_izq.max(axis=1), V_der.max(axis=1)], axis=-1),
+    }
+
+
+def _combinaciones_vigueta():
+    """Una o dos barras por vigueta (3/8" a 3/4"), ordenadas por área"""
+    i, j = np.meshgrid(np.arange(4), np.arange(-1, 4), indexing='ij')
+    validas = (j <= i) & (j >= i - 1)
+    i, j = i[validas], j[validas]
+    As = AREAS[i] + np.where(j >= 0, AREAS[np.maximum(j, 0)], 0.0)
+    designacion = np.char.add(DESIGNACION, '"').astype(object)
+    texto = np.where(j == i, '2 Ø ' + designacion[i],
+                     np.where(j < 0, '1 Ø ' + designacion[i],
+                              '1 Ø ' + designacion[i] + ' + 1 Ø ' + designacion[np.maximum(j, 0)]))
+    orden = np.argsort(As, kind='stable')
+    return As[orden], texto[orden]
+
+
+def _seleccionar_acero(As_requerido):
+    """Combinación de menor área que cubre As_requerido para todas las viguetas"""
+    As_tabla, texto = _combinaciones_vigueta()
+    k = np.searchsorted(As_tabla, As_requerido, side='left')
+    cumple = k < len(As_tabla)
+    k = np.minimum(k, len(As_tabla) - 1)
+    return np.where(cumple, As_tabla[k], np.nan), np.where(cumple, texto[k], 'NO CUMPLE')
+
+
+def _inercias_vigueta(h, As, n_mod):
+    """Inercia bruta, inercia fisurada y distancia del eje centroidal a la fibra en tracción de la vigueta T"""
+    bf, bw, hf = SEPARACION_VIGUETAS * 100, ANCHO_VIGUETA, ESPESOR_LOSA
+    area_ala, area_alma = bf * hf, bw * (h - hf)
+    y_sup = (area_ala * hf / 2 + area_alma * (hf + (h - hf) / 2)) / (area_ala + area_alma)
+    Ig = (bf * hf**3 / 12 + area_ala * (y_sup - hf / 2)**2
+          + bw * (h - hf)**3 / 12 + area_alma * (hf + (h - hf) / 2 - y_sup)**2)
+    # Eje neutro fisurado suponiendo que cae en el ala (caso usual en aligerados)
+    d = h - RECUBRIMIENTO_VIGUETA
+    c = (-n_mod * As + np.sqrt((n_mod * As)**2 + 2 * bf * n_mod * As * d)) / bf
+    Icr = bf * c**3 / 3 + n_mod * As * (d - c)**2
+    return Ig, Icr, h - y_sup
+
+
+def disenar_losa_aligerada(luces_x, luces_y, CM, CV, fc, fy, h=None, direccion='x', metodo='coeficientes',
+                           ancho_apoyo=0.25, limite_deflexion=480):
+    """
+    Diseño de todas las viguetas de una losa aligerada en una dirección
+
+    luces_x, luces_y: Luces entre ejes (m); CM: carga muerta adicional (kg/m², sin peso propio)
+    CV: carga viva (kg/m²); h: peralte (cm), por defecto el menor comercial con h ≥ L/25
+    metodo: 'coeficientes' (E.060 8.3.3) o 'viga_continua' (tres momentos con alternancia)
+    Retorna arreglos (n_franjas, n_tramos) por tramo y (n_franjas, n_tramos + 1) por apoyo
+    """
+    franjas = franjas_losa(luces_x, luces_y, direccion)
+    luces = franjas['luces']
+    n, m = luces.shape
+    h = peralte_aligerado(luces) if h is None else h
+    if h not in PESO_ALIGERADO:
+        raise ValueError(f"Peralte de aligerado no tabulado: h = {h} cm (comerciales: {sorted(PESO_ALIGERADO)})")
+    d = h - RECUBRIMIENTO_VIGUETA
+    bf, bw = SEPARACION_VIGUETAS * 100, ANCHO_VIGUETA
+
+    # 1. Cargas por vigueta (kg/m)
+    w_muerta = (PESO_ALIGERADO[h] + CM) * SEPARACION_VIGUETAS
+    w_viva = CV * SEPARACION_VIGUETAS
+    wu = 1.2 * w_muerta + 1.6 * w_viva
+
+    # 2. Momentos y cortantes de todas las franjas
+    if metodo == 'coeficientes':
+        esfuerzos = momentos_coeficientes(luces, np.full(n, wu), ancho_apoyo)
+    else:
+        esfuerzos = momentos_viga_continua(luces, np.full(n, w_muerta), np.full(n, w_viva), ancho_apoyo)
+    Mu_pos = esfuerzos['M_pos'] * 100
+    Mu_neg = esfuerzos['M_neg'] * 100
+
+    # 3. Acero positivo (ala de 40 cm en compresión) y negativo (alma de 10 cm)
+    cuantias = calcular_cuantias(fc, fy)
+    rho_pos, existe_pos = calcular_rho_requerido(fc, fy, bf, d, Mu_pos)
+    rho_neg, existe_neg = calcular_rho_requerido(fc, fy, bw, d, Mu_neg)
+    As_min = cuantias['rho_min'] * bw * d
+    As_pos = np.maximum(rho_pos * bf * d, As_min)
+    As_neg = np.maximum(rho_neg * bw * d, As_min)
+    a_pos = As_pos * fy / (0.85 * fc * bf)
+    As_pos_colocado, barras_pos = _seleccionar_acero(As_pos)
+    As_neg_colocado, barras_neg = _seleccionar_acero(As_neg)
+    cumple_flexion = (existe_pos & (rho_pos <= cuantias['rho_max'] * bw / bf) & (a_pos <= ESPESOR_LOSA)
+                      & np.isfinite(As_pos_colocado)).all(axis=1)
+    cumple_flexion &= (existe_neg & (rho_neg <= cuantias['rho_max']) & np.isfinite(As_neg_colocado)).all(axis=1)
+
+    # 4. Cortante a d de la cara: φVc = φ·1.1·0.53·√f'c·bw·d con φ = 0.75; si no basta, ensanche
+    V = esfuerzos['V']
+    Vu = np.maximum(V - wu * d / 100, 0.0)
+    phiVc = {ancho: PHI_CORTANTE * 1.1 * 0.53 * np.sqrt(fc) * ancho * d for ancho in
+             (bw, ANCHO_ENSANCHE['alternado'], ANCHO_ENSANCHE['corrido'])}
+    ensanche = np.select([Vu <= phiVc[bw], Vu <= phiVc[ANCHO_ENSANCHE['alternado']],
+                          Vu <= phiVc[ANCHO_ENSANCHE['corrido']]],
+                         ['ninguno', 'alternado', 'corrido'], 'insuficiente').astype(object)
+    longitud_ensanche = np.maximum(V - phiVc[bw], 0.0) / wu
+
+    # 5. Peralte mínimo (E.060 Tabla 9.1) y, si no cumple, deflexión diferida con Ie de Branson
+    coef = np.full(m, 21.0)
+    coef[[0, -1]] = 18.5 if m > 1 else 16.0
+    cumple_peralte = h >= luces * 100 / coef
+
+    Ec = 15000 * np.sqrt(fc)
+    Ig, Icr, y_t = _inercias_vigueta(h, As_pos_colocado, 2e6 / Ec)
+    Mcr = 2 * np.sqrt(fc) * Ig / y_t
+    Ma = Mu_pos / (wu / (w_muerta + w_viva))
+    Ie = np.minimum(Ig, (Mcr / Ma)**3 * Ig + (1 - (Mcr / Ma)**3) * Icr)
+    Ln = (luces - ancho_apoyo) * 100
+    # Δ = 5·L²/(48·Ec·Ie)·(Mm - 0.1·(Ma + Mb)) con momentos de servicio
+    Mneg_serv = Mu_neg / (wu / (w_muerta + w_viva))
+    M_efectivo = np.maximum(Ma - 0.1 * (Mneg_serv[:, :-1] + Mneg_serv[:, 1:]), 0.0)
+    delta_total = 5 * Ln**2 / (48 * Ec * Ie) * M_efectivo
+    fraccion_muerta = w_muerta / (w_muerta + w_viva)
+    delta_diferida = delta_total * (fraccion_muerta * 2.0 + (1 - fraccion_muerta))
+    cumple_deflexion = cumple_peralte | (delta_diferida <= Ln / limite_deflexion)
+
+    return {
+        'h': h,
+        'luces': luces,
+        'n_viguetas': franjas['n_viguetas'],
+        'wu': wu,
+        'Mu_pos': Mu_pos,
+        'Mu_neg': Mu_neg,
+        'As_pos': As_pos,
+        'As_neg': As_neg,
+        'As_pos_colocado': As_pos_colocado,
+        'As_neg_colocado': As_neg_colocado,
+        'barras_pos': barras_pos,
+        'barras_neg': barras_neg,
+        'Vu': Vu,
+        'phiVc': phiVc[bw],
+        'ensanche': ensanche,
+        'longitud_ensanche': longitud_ensanche,
+        'cumple_peralte': cumple_peralte,
+        'deflexion': delta_diferida,
+        'cumple_deflexion': cumple_deflexion,
+        'verificacion': cumple_flexion & (ensanche != 'insuficiente').all(axis=(1, 2)) & cumple_deflexion.all(axis=1),
+    }
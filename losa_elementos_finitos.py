@@ -0,0 +1,284 @@
+"""
+Losas en Dos Direcciones por Elementos Finitos - CONSORCIO DEJ
+Placas de Mindlin con elementos cuadriláteros MITC4 sobre una malla de paños
+rectangulares, apoyos en columnas o en ejes, aberturas y balasto para plateas;
+matriz de rigidez dispersa resuelta con factorización directa y momentos por
+unidad de ancho con demandas de punzonamiento en columnas
+Unidades: kg, cm (luces en m, cargas en kg/m², momentos en kg·cm/cm)
+"""
+
+import numpy as np
+
+from zapatas import resistencia_punzonamiento
+
+try:
+    import scipy.sparse as sparse
+    from scipy.sparse.linalg import spsolve
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+GAUSS = np.array([-1.0, 1.0]) / np.sqrt(3.0)
+XI_NODOS = np.array([-1.0, 1.0, 1.0, -1.0])
+ETA_NODOS = np.array([-1.0, -1.0, 1.0, 1.0])
+FACTOR_CORTE = 5.0 / 6.0
+
+
+def crear_malla_losa(luces_x, luces_y, divisiones=10, aberturas=()):
+    """
+    Malla de rectángulos sobre los paños definidos por las luces (m) entre ejes
+
+    divisiones: elementos por paño en cada dirección
+    aberturas: rectángulos (x0, y0, x1, y1) en m; se eliminan los elementos con centro dentro
+    Los nudos se numeran por filas (y) y columnas (x); las columnas quedan en los cruces de ejes
+    """
+    ejes_x = np.concatenate([[0.0], np.cumsum(luces_x)]) * 100
+    ejes_y = np.concatenate([[0.0], np.cumsum(luces_y)]) * 100
+    x = np.unique(np.concatenate([np.linspace(a, b, divisiones + 1) for a, b in zip(ejes_x[:-1], ejes_x[1:])]))
+    y = np.unique(np.concatenate([np.linspace(a, b, divisiones + 1) for a, b in zip(ejes_y[:-1], ejes_y[1:])]))
+    nx, ny = len(x), len(y)
+    X, Y = np.meshgrid(x, y)
+    nodo = np.arange(nx * ny).reshape(ny, nx)
+
+    elementos = np.stack([nodo[:-1, :-1], nodo[:-1, 1:], nodo[1:, 1:], nodo[1:, :-1]], axis=-1).reshape(-1, 4)
+    dx = np.broadcast_to(np.diff(x)[None, :], (ny - 1, nx - 1)).ravel()
+    dy = np.broadcast_to(np.diff(y)[:, None], (ny - 1, nx - 1)).ravel()
+    xc = ((x[:-1] + x[1:]) / 2)[None, :] + np.zeros((ny - 1, 1))
+    yc = ((y[:-1] + y[1:]) / 2)[:, None] + np.zeros((1, nx - 1))
+    activo = np.ones((ny - 1, nx - 1), dtype=bool)
+    for x0, y0, x1, y1 in aberturas:
+        activo &= ~((xc > x0 * 100) & (xc < x1 * 100) & (yc > y0 * 100) & (yc < y1 * 100))
+
+    columna_x = np.searchsorted(x, ejes_x)
+    columna_y = np.searchsorted(y, ejes_y)
+    CI, CJ = np.meshgrid(columna_x, columna_y)
+    borde_x = (CI == 0) | (CI == nx - 1)
+    borde_y = (CJ == 0) | (CJ == ny - 1)
+    return {
+        'coords': np.column_stack([X.ravel(), Y.ravel()]),
+        'forma': (ny, nx),
+        'elementos': elementos[activo.ravel()],
+        'dx': dx[activo.ravel()],
+        'dy': dy[activo.ravel()],
+        'activo': activo,
+        'columnas': nodo[CJ, CI].ravel(),
+        # Ubicación de cada columna para el perímetro crítico: 0 interior, 1 borde, 2 esquina
+        'ubicacion_columnas': (borde_x.astype(int) + borde_y.astype(int)).ravel(),
+        # Borde libre de cada columna: perpendicular a x (x = 0 o máximo) o a y
+        'borde_x_columnas': borde_x.ravel(),
+        'borde_y_columnas': borde_y.ravel(),
+        'nudos_ejes': np.unique(np.concatenate([nodo[:, columna_x].ravel(), nodo[columna_y, :].ravel()])),
+    }
+
+
+def _matrices_b(xi, eta, a, b):
+    """Matrices de curvatura (3×12) y de corte MITC4 (2×12) de un rectángulo a × b en (ξ, η)"""
+    def derivadas(xi, eta):
+        N = (1 + XI_NODOS * xi) * (1 + ETA_NODOS * eta) / 4
+        N_x = XI_NODOS * (1 + ETA_NODOS * eta) / 4 * 2 / a
+        N_y = ETA_NODOS * (1 + XI_NODOS * xi) / 4 * 2 / b
+        return N, N_x, N_y
+
+    N, N_x, N_y = derivadas(xi, eta)
+    Bb = np.zeros((3, 12))
+    Bb[0, 1::3] = N_x
+    Bb[1, 2::3] = N_y
+    Bb[2, 1::3] = N_y
+    Bb[2, 2::3] = N_x
+
+    def corte(xi, eta):
+        N, N_x, N_y = derivadas(xi, eta)
+        Bs = np.zeros((2, 12))
+        Bs[0, 0::3], Bs[0, 1::3] = N_x, N
+        Bs[1, 0::3], Bs[1, 2::3] = N_y, N
+        return Bs
+
+    # Deformaciones de corte supuestas: γxz interpolada entre los puntos (0, ±1) y γyz entre (±1, 0)
+    Bs = np.zeros((2, 12))
+    Bs[0] = (1 - eta) / 2 * corte(0, -1)[0] + (1 + eta) / 2 * corte(0, 1)[0]
+    Bs[1] = (1 - xi) / 2 * corte(-1, 0)[1] + (1 + xi) / 2 * corte(1, 0)[1]
+    return Bb, Bs
+
+
+def _rigideces_unitarias(a, b, E, nu):
+    """Rigideces de flexión (por h³) y de corte (por h) del rectángulo a × b, integración 2×2"""
+    Cb = E / (12 * (1 - nu**2)) * np.array([[1, nu, 0], [nu, 1, 0], [0, 0, (1 - nu) / 2]])
+    Cs = FACTOR_CORTE * E / (2 * (1 + nu)) * np.eye(2)
+    Kb = np.zeros((12, 12))
+    Ks = np.zeros((12, 12))
+    for xi in GAUSS:
+        for eta in GAUSS:
+            Bb, Bs = _matrices_b(xi, eta, a, b)
+            Kb += Bb.T @ Cb @ Bb * a * b / 4
+            Ks += Bs.T @ Cs @ Bs * a * b / 4
+    return Kb, Ks, Cb, Cs
+
+
+def _resolver_bloques(indice_bloque, filas, columnas, valores, F):
+    """
+    Cholesky por bloques de la matriz tridiagonal por bloques que resulta de numerar los
+    nudos por filas de la malla (respaldo sin scipy): cada fila de nudos es un bloque
+    """
+    n_bloques = indice_bloque.max() + 1
+    tamano = np.bincount(indice_bloque, minlength=n_bloques)
+    m = tamano.max()
+    local = np.arange(len(indice_bloque)) - np.concatenate([[0], np.cumsum(tamano)[:-1]])[indice_bloque]
+
+    bf, bc = indice_bloque[filas], indice_bloque[columnas]
+    diagonal = bf == bc
+    inferior = bf == bc + 1
+    D = np.bincount((bf[diagonal] * m + local[filas[diagonal]]) * m + local[columnas[diagonal]],
+                    valores[diagonal], minlength=n_bloques * m * m).reshape(n_bloques, m, m)
+    S = np.bincount((bc[inferior] * m + local[filas[inferior]]) * m + local[columnas[inferior]],
+                    valores[inferior], minlength=n_bloques * m * m).reshape(n_bloques, m, m)
+    # Las posiciones de relleno de bloques más pequeños quedan desacopladas con diagonal unitaria
+    bloque, posicion = np.nonzero(np.arange(m)[None, :] >= tamano[:, None])
+    D[bloque, posicion, posicion] = 1.0
+    b = np.zeros((n_bloques, m))
+    b[indice_bloque, local] = F
+
+    L = np.empty_like(D)
+    L_sub = np.zeros_like(S)
+    for i in range(n_bloques):
+        Di = D[i] - L_sub[i - 1] @ L_sub[i - 1].T if i > 0 else D[i]
+        L[i] = np.linalg.cholesky(Di)
+        if i < n_bloques - 1:
+            L_sub[i] = np.linalg.solve(L[i], S[i].T).T
+    y = np.empty_like(b)
+    for i in range(n_bloques):
+        y[i] = np.linalg.solve(L[i], b[i] - (L_sub[i - 1] @ y[i - 1] if i > 0 else 0))
+    x = np.empty_like(b)
+    for i in range(n_bloques - 1, -1, -1):
+        x[i] = np.linalg.solve(L[i].T, y[i] - (L_sub[i].T @ x[i + 1] if i < n_bloques - 1 else 0))
+    return x[indice_bloque, local]
+
+
+def analizar_losa(malla, h, q, E=None, fc=210.0, nu=0.2, apoyo='columnas', cargas_nudos=None,
+                  modulo_balasto=0.0):
+    """
+    Desplazamientos, momentos y reacciones de la losa
+
+    h: espesor (cm), escalar o por elemento; q: carga uniforme (kg/m²), escalar o por elemento
+    apoyo: 'columnas' (w = 0 en los cruces de ejes), 'ejes' (w = 0 a lo largo de todos los ejes,
+    losa apoyada en vigas o muros) o 'ninguno' (platea sobre balasto)
+    cargas_nudos: fuerzas puntuales (kg) por nudo, p. ej. cargas de columnas sobre una platea
+    modulo_balasto: coeficiente de balasto (kg/cm³) repartido en los nudos
+    Con scipy se factoriza la matriz dispersa; sin scipy, con Cholesky por bloques
+    """
+    E = 15000 * np.sqrt(fc) if E is None else E
+    elementos = malla['elementos']
+    n_el = len(elementos)
+    n_nudos = len(malla['coords'])
+    n = 3 * n_nudos
+    h = np.broadcast_to(np.asarray(h, dtype=float), (n_el,))
+    q = np.broadcast_to(np.asarray(q, dtype=float), (n_el,)) / 1e4
+    area = malla['dx'] * malla['dy']
+
+    # 1. Rigidez de cada elemento: K = h³·Kb + h·Ks con matrices unitarias por tamaño de elemento
+    tamanos, grupo = np.unique(np.column_stack([malla['dx'], malla['dy']]), axis=0, return_inverse=True)
+    grupo = grupo.ravel()
+    unitarias = [_rigideces_unitarias(a, b, E, nu) for a, b in tamanos]
+    Kb = np.stack([u[0] for u in unitarias])[grupo]
+    Ks = np.stack([u[1] for u in unitarias])[grupo]
+    K_el = h[:, None, None]**3 * Kb + h[:, None, None] * Ks
+    gdl = (3 * elementos[:, :, None] + np.arange(3)).reshape(n_el, 12)
+
+    # 2. Cargas y balasto en los GDL de desplazamiento vertical
+    F = np.zeros(n)
+    np.add.at(F, 3 * elementos, np.repeat((q * area / 4)[:, None], 4, axis=1))
+    if cargas_nudos is not None:
+        F[0::3] += np.asarray(cargas_nudos, dtype=float)
+    resorte = np.zeros(n_nudos)
+    np.add.at(resorte, elementos, np.repeat((modulo_balasto * area / 4)[:, None], 4, axis=1))
+
+    # 3. Restricciones: apoyos y nudos sin elementos (aberturas)
+    fijo = np.zeros(n, dtype=bool)
+    if apoyo == 'columnas':
+        fijo[3 * malla['columnas']] = True
+    elif apoyo == 'ejes':
+        fijo[3 * malla['nudos_ejes']] = True
+    huerfano = np.bincount(elementos.ravel(), minlength=n_nudos) == 0
+    fijo[(3 * np.flatnonzero(huerfano)[:, None] + np.arange(3)).ravel()] = True
+    libre = np.flatnonzero(~fijo)
+    numero = np.full(n, -1)
+    numero[libre] = np.arange(len(libre))
+
+    filas = np.broadcast_to(gdl[:, :, None], K_el.shape).ravel()
+    columnas = np.broadcast_to(gdl[:, None, :], K_el.shape).ravel()
+    valores = K_el.ravel()
+    filas = np.concatenate([filas, 3 * np.arange(n_nudos)])
+    columnas = np.concatenate([columnas, 3 * np.arange(n_nudos)])
+    valores = np.concatenate([valores, resorte])
+    usar = (numero[filas] >= 0) & (numero[columnas] >= 0)
+    filas, columnas, valores = numero[filas[usar]], numero[columnas[usar]], valores[usar]
+
+    # 4. Solución directa
+    u = np.zeros(n)
+    if SCIPY_AVAILABLE:
+        K = sparse.csc_matrix((valores, (filas, columnas)), shape=(len(libre), len(libre)))
+        u[libre] = spsolve(K, F[libre])
+    else:
+        fila_nudo = libre // 3 // malla['forma'][1]
+        u[libre] = _resolver_bloques(fila_nudo, filas, columnas, valores, F[libre])
+
+    # 5. Momentos y cortantes en el centro de cada elemento, reacciones en los apoyos
+    u_el = u[gdl]
+    momentos = np.zeros((n_el, 3))
+    cortantes = np.zeros((n_el, 2))
+    for g, (a, b) in enumerate(tamanos):
+        en_grupo = grupo == g
+        Bb, Bs = _matrices_b(0.0, 0.0, a, b)
+        _, _, Cb, Cs = unitarias[g]
+        momentos[en_grupo] = h[en_grupo, None]**3 * (u_el[en_grupo] @ Bb.T @ Cb)
+        cortantes[en_grupo] = h[en_grupo, None] * (u_el[en_grupo] @ Bs.T @ Cs)
+    fuerza_interna = np.zeros(n)
+    np.add.at(fuerza_interna, gdl, np.einsum('eij,ej->ei', K_el, u_el))
+    fuerza_interna[0::3] += resorte * u[0::3]
+    reacciones = np.where(fijo, F - fuerza_interna, 0.0)[0::3]
+
+    Mx, My, Mxy = momentos.T
+    ny, nx = malla['forma']
+
+    def campo(valor):
+        resultado = np.full((ny - 1) * (nx - 1), np.nan)
+        resultado[malla['activo'].ravel()] = valor
+        return resultado.reshape(ny - 1, nx - 1)
+
+    return {
+        'w': u[0::3].reshape(ny, nx),
+        'Mx': campo(Mx),
+        'My': campo(My),
+        'Mxy': campo(Mxy),
+        # Momentos de diseño de Wood-Armer: inferiores (positivos) y superiores (negativos)
+        'Mx_inferior': campo(np.maximum(Mx + np.abs(Mxy), 0)),
+        'My_inferior': campo(np.maximum(My + np.abs(Mxy), 0)),
+        'Mx_superior': campo(np.minimum(Mx - np.abs(Mxy), 0)),
+        'My_superior': campo(np.minimum(My - np.abs(Mxy), 0)),
+        'Qx': campo(cortantes[:, 0]),
+        'Qy': campo(cortantes[:, 1]),
+        'reacciones': reacciones,
+        'reacciones_columnas': reacciones[malla['columnas']],
+        'carga_total': F[0::3].sum(),
+        'n_gdl': len(libre),
+    }
+
+
+def verificar_punzonamiento_losa(malla, resultado, fc, d, c1, c2, q=0.0):
+    """
+    Punzonamiento en cada columna con la reacción del análisis como demanda
+
+    c1, c2: dimensiones de la columna en x e y (cm); d: peralte efectivo (cm)
+    q: carga última (kg/m²) que se descuenta dentro del perímetro crítico
+    """
+    ubicacion = malla['ubicacion_columnas']
+    borde_x, borde_y = malla['borde_x_columnas'], malla['borde_y_columnas']
+    # Perímetro crítico a d/2 de las caras: el lado sobre un borde libre se pierde y los
+    # lados perpendiculares a ese borde llegan solo hasta la cara de la columna (c + d/2)
+    lado_1 = c1 + np.where(borde_x, d / 2, d)
+    lado_2 = c2 + np.where(borde_y, d / 2, d)
+    bo = (2 - borde_y) * lado_1 + (2 - borde_x) * lado_2
+    alfa_s = np.select([ubicacion == 0, ubicacion == 1], [40, 30], 20)
+    beta = max(c1, c2) / min(c1, c2)
+    Vu = np.abs(resultado['reacciones_columnas']) - q / 1e4 * lado_1 * lado_2
+    phiVc = resistencia_punzonamiento(fc, bo, d, beta, alfa_s)
+    return {'Vu': Vu, 'bo': bo, 'phiVc': phiVc, 'razon': Vu / phiVc, 'cumple': Vu <= phiVc}
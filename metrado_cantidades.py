@@ -0,0 +1,101 @@
+"""
+Metrado de Cantidades - CONSORCIO DEJ
+Volumen de concreto, área de encofrado y peso de acero (tabla kg/m de APP1.py) por
+tipo de elemento y piso, con presupuesto por precios unitarios; todas las sumas se
+hacen sobre arreglos de elementos y admiten muchas alternativas a la vez
+Unidades: m³, m², kg y S/ (secciones en cm, longitudes del pórtico en cm)
+"""
+
+import numpy as np
+
+from modelo_portico import COLUMNA, VIGA
+from seleccion_barras import DIAMETROS, PESOS
+
+TIPOS_ELEMENTO = {COLUMNA: 'Columnas', VIGA: 'Vigas'}
+PARTIDAS = ('concreto', 'encofrado', 'acero')
+
+
+def _agrupar(valores, tipo, piso, n_pisos):
+    """Suma (..., n_el) → (..., 2, n_pisos) por tipo de elemento y piso con una matriz indicadora"""
+    grupo = tipo * n_pisos + (piso - 1)
+    indicadora = np.zeros((len(tipo), 2 * n_pisos))
+    indicadora[np.arange(len(tipo)), grupo] = 1.0
+    return (valores @ indicadora).reshape(valores.shape[:-1] + (2, n_pisos))
+
+
+def calcular_cantidades(portico, n_barras, barra, n_estribos=0, barra_estribo=0, b=None, h=None,
+                        longitud_barras=None, recubrimiento=4.0, espesor_losa=0.0):
+    """
+    Cantidades por elemento y resumen por tipo y piso
+
+    n_barras, barra: barras longitudinales por elemento, (..., n_el) o (..., n_el, n_grupos),
+    con barra como índice del catálogo; longitud_barras (m) por defecto la longitud del elemento
+    n_estribos, barra_estribo: número e índice de estribos por elemento
+    b, h: secciones (cm), por defecto las del pórtico; con eje inicial para alternativas
+    espesor_losa: peralte de losa (cm) que no se encofra en los costados de vigas
+    """
+    b = portico['b'] if b is None else np.asarray(b, dtype=float)
+    h = portico['h'] if h is None else np.asarray(h, dtype=float)
+    b, h = np.broadcast_arrays(b, h)
+    tipo, piso, n_pisos = portico['tipo'], portico['piso'], portico['num_pisos']
+    columnas = tipo == COLUMNA
+    L = portico['L']
+
+    # 1. Longitud neta de vigas (entre caras de columnas del mismo piso)
+    h_col = np.where(columnas, h, 0.0)
+    conteo = np.bincount(piso[columnas], minlength=n_pisos + 1)
+    h_col_piso = _agrupar(h_col, tipo, piso, n_pisos)[..., COLUMNA, :] / np.maximum(conteo[1:], 1)
+    longitud = np.where(columnas, L, L - h_col_piso[..., piso - 1])
+
+    # 2. Concreto y encofrado
+    concreto = b * h * longitud / 1e6
+    encofrado = np.where(columnas, 2 * (b + h), 2 * (h - espesor_losa) + b) * longitud / 1e4
+
+    # 3. Acero longitudinal y estribos con el peso por metro de la tabla de barras
+    n_barras = np.asarray(n_barras, dtype=float)
+    barra = np.asarray(barra)
+    if not (n_barras.ndim >= 2 and n_barras.shape[-2] == len(tipo)):
+        n_barras, barra = np.broadcast_arrays(n_barras, barra)
+        n_barras, barra = n_barras[..., None], barra[..., None]
+    largo = (L / 100)[:, None] if longitud_barras is None else np.asarray(longitud_barras, dtype=float)
+    acero_longitudinal = (n_barras * largo * PESOS[barra]).sum(axis=-1)
+
+    barra_estribo = np.broadcast_to(np.asarray(barra_estribo), b.shape)
+    db = DIAMETROS[barra_estribo]
+    perimetro = 2 * (b + h - 4 * recubrimiento) + 2 * 10 * db
+    acero_estribos = np.asarray(n_estribos, dtype=float) * perimetro / 100 * PESOS[barra_estribo]
+    acero = acero_longitudinal + acero_estribos
+
+    cantidades = {
+        'concreto': concreto,
+        'encofrado': encofrado,
+        'acero_longitudinal': acero_longitudinal,
+        'acero_estribos': acero_estribos,
+        'acero': acero,
+    }
+    resumen = {clave: _agrupar(valor, tipo, piso, n_pisos) for clave, valor in cantidades.items()}
+    return {
+        'por_elemento': cantidades,
+        'por_tipo_piso': resumen,
+        'totales': {clave: valor.sum(axis=(-2, -1)) for clave, valor in resumen.items()},
+        'cuantia_acero': resumen['acero'].sum(axis=(-2, -1)) / resumen['concreto'].sum(axis=(-2, -1)),
+    }
+
+
+def calcular_presupuesto(cantidades, precios):
+    """
+    Costo por partida, tipo de elemento y piso con precios unitarios del usuario
+
+    precios: {'concreto': S/ por m³, 'encofrado': S/ por m², 'acero': S/ por kg}
+    Retorna costos (..., 2, n_pisos) por partida, su suma y el total por alternativa
+    """
+    resumen = cantidades['por_tipo_piso']
+    costos = {partida: resumen[partida] * precios.get(partida, 0.0) for partida in PARTIDAS}
+    por_tipo_piso = sum(costos.values())
+    return {
+        'por_partida': {partida: costo.sum(axis=(-2, -1)) for partida, costo in costos.items()},
+        'por_tipo': {nombre: por_tipo_piso[..., t, :].sum(axis=-1) for t, nombre in TIPOS_ELEMENTO.items()},
+        'por_piso': por_tipo_piso.sum(axis=-2),
+        'por_tipo_piso': por_tipo_piso,
+        'total': por_tipo_piso.sum(axis=(-2, -1)),
+    }
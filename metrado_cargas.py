@@ -0,0 +1,131 @@
+"""
+Metrado de Cargas de Gravedad - CONSORCIO DEJ
+Áreas tributarias de columnas en una malla rectangular y acumulación de cargas
+axiales piso por piso con reducción de carga viva (E.020)
+Unidades: m, kg/m², kg, kg/cm²
+"""
+
+import numpy as np
+
+ESQUINA = "esquina"
+BORDE = "borde"
+INTERIOR = "interior"
+
+
+def calcular_areas_tributarias(luces_x, luces_y):
+    """
+    Calcula el área tributaria de todas las columnas de una malla rectangular
+
+    luces_x: Luces de los vanos en dirección X (m)
+    luces_y: Luces de los vanos en dirección Y (m)
+    Las columnas se numeran fila por fila: columna = iy * (nx + 1) + ix
+    """
+    luces_x = np.atleast_1d(np.asarray(luces_x, dtype=float))
+    luces_y = np.atleast_1d(np.asarray(luces_y, dtype=float))
+
+    # Ancho tributario de cada eje: mitad de los vanos adyacentes
+    ancho_x = np.zeros(len(luces_x) + 1)
+    ancho_x[:-1] += luces_x / 2
+    ancho_x[1:] += luces_x / 2
+    ancho_y = np.zeros(len(luces_y) + 1)
+    ancho_y[:-1] += luces_y / 2
+    ancho_y[1:] += luces_y / 2
+
+    area = np.outer(ancho_y, ancho_x)
+
+    # Clasificación según el número de ejes extremos que toca la columna
+    borde_x = np.zeros(len(ancho_x), dtype=int)
+    borde_x[[0, -1]] = 1
+    borde_y = np.zeros(len(ancho_y), dtype=int)
+    borde_y[[0, -1]] = 1
+    n_bordes = borde_y[:, None] + borde_x[None, :]
+    tipo = np.where(n_bordes >= 2, ESQUINA, np.where(n_bordes == 1, BORDE, INTERIOR))
+
+    eje_y, eje_x = np.indices(area.shape)
+    return {
+        'area': area.ravel(),
+        'ancho_x': np.broadcast_to(ancho_x, area.shape).ravel(),
+        'ancho_y': np.broadcast_to(ancho_y[:, None], area.shape).ravel(),
+        'eje_x': eje_x.ravel(),
+        'eje_y': eje_y.ravel(),
+        'tipo': tipo.ravel(),
+        'forma_malla': area.shape,
+    }
+
+
+def factor_reduccion_carga_viva(area_tributaria, num_pisos_soportados, k=2.0):
+    """
+    Factor de reducción de carga viva para columnas según E.020:
+    Lr = Lo·(0.25 + 4.6/√Ai), Ai = k·At ≥ 40 m²,
+    con mínimo 0.5 para un piso y 0.4 para varios pisos
+    """
+    area_influencia = k * np.asarray(area_tributaria, dtype=float)
+    factor = 0.25 + 4.6 / np.sqrt(np.maximum(area_influencia, 1e-9))
+    minimo = np.where(np.asarray(num_pisos_soportados) <= 1, 0.5, 0.4)
+    factor = np.clip(factor, minimo, 1.0)
+    return np.where(area_influencia >= 40, factor, 1.0)
+
+
+def calcular_metrado_cargas(luces_x, luces_y, num_pisos, CM, CV, CV_azotea=None, reduccion_cv=True,
+                            h_piso=None, area_columna=None, gamma_concreto=2400):
+    """
+    Acumula las cargas axiales de gravedad de todas las columnas piso por piso
+
+    CM, CV: Carga muerta y viva (kg/m²) - escalar o un valor por piso (de abajo hacia arriba)
+    CV_azotea: Carga viva del último nivel (kg/m²), no se reduce; por defecto CV
+    h_piso, area_columna: Para incluir el peso propio de columnas (m, m²)
+    Retorna arreglos (pisos × columnas); la fila k es la carga en la columna del piso k+1
+    """
+    num_pisos = int(num_pisos)
+    tributaria = calcular_areas_tributarias(luces_x, luces_y)
+    A = tributaria['area']
+
+    qD = np.broadcast_to(np.asarray(CM, dtype=float), (num_pisos,)).copy()
+    qL = np.broadcast_to(np.asarray(CV, dtype=float), (num_pisos,)).copy()
+    if CV_azotea is not None:
+        qL[-1] = CV_azotea
+    qL_azotea = qL[-1]
+    qL[-1] = 0.0
+
+    # 1. Acumulación desde el último piso hacia abajo
+    D_acumulada = np.cumsum(qD[::-1])[::-1]
+    L_acumulada = np.cumsum(qL[::-1])[::-1]
+    pisos_soportados = np.arange(num_pisos, 0, -1)
+
+    P_muerta = D_acumulada[:, None] * A[None, :]
+    if h_piso is not None and area_columna is not None:
+        peso_columna = gamma_concreto * np.broadcast_to(np.asarray(area_columna, dtype=float), A.shape) * h_piso
+        P_muerta = P_muerta + pisos_soportados[:, None] * peso_columna[None, :]
+
+    # 2. Reducción de carga viva por área de influencia acumulada (sin incluir la azotea)
+    pisos_tipicos = pisos_soportados - 1
+    if reduccion_cv:
+        area_acumulada = pisos_tipicos[:, None] * A[None, :]
+        factor = factor_reduccion_carga_viva(area_acumulada, pisos_tipicos[:, None])
+    else:
+        factor = np.ones((num_pisos, len(A)))
+    P_viva = factor * L_acumulada[:, None] * A[None, :] + qL_azotea * A[None, :]
+
+    return {
+        'area_tributaria': A,
+        'tipo': tributaria['tipo'],
+        'eje_x': tributaria['eje_x'],
+        'eje_y': tributaria['eje_y'],
+        'factor_reduccion': factor,
+        'P_muerta': P_muerta,
+        'P_viva': P_viva,
+        'P_servicio': P_muerta + P_viva,
+        'P_mayorada': 1.2 * P_muerta + 1.6 * P_viva,
+    }
+
+
+def predimensionar_columnas(P_servicio, P_mayorada, fc):
+    """
+    Área y lado de columna para cada carga axial (mismo criterio que calcular_predimensionamiento)
+
+    P_servicio, P_mayorada: Cargas axiales (kg), arreglos de cualquier forma
+    """
+    A_col_servicio = np.asarray(P_servicio, dtype=float) / (0.45 * fc)
+    A_col_resistencia = np.asarray(P_mayorada, dtype=float) / (0.65 * 0.8 * fc)
+    A_columna = np.maximum(A_col_servicio, A_col_resistencia)
+    return {'A_columna': A_columna, 'lado_columna': np.sqrt(A_columna)}
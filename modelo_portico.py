@@ -0,0 +1,266 @@
+"""
+Modelo de Pórtico Plano - CONSORCIO DEJ
+Matriz de rigidez de pórticos regulares de concreto armado (3 GDL por nudo)
+Unidades internas: kg, cm
+"""
+
+import numpy as np
+
+from calculos_estructurales import calcular_propiedades_concreto
+
+# Tipos de elemento
+COLUMNA = 0
+VIGA = 1
+
+
+def crear_portico_regular(num_pisos, num_vanos, L_viga, h_piso, b_viga, h_viga, b_col, h_col, fc):
+    """
+    Genera la geometría, conectividad y propiedades de un pórtico plano regular
+
+    L_viga: Luz de los vanos (m)
+    h_piso: Altura de entrepiso (m)
+    b_viga, h_viga: Sección de vigas (cm) - escalar o un valor por piso
+    b_col, h_col: Sección de columnas (cm) - escalar o un valor por piso
+    fc: Resistencia del concreto (kg/cm²)
+    """
+    num_pisos = int(num_pisos)
+    num_vanos = int(num_vanos)
+    n_ejes = num_vanos + 1
+
+    # 1. Nudos: nudo = piso * n_ejes + eje (piso 0 = base)
+    piso_nudo, eje_nudo = np.divmod(np.arange((num_pisos + 1) * n_ejes), n_ejes)
+    coords = np.column_stack([eje_nudo * L_viga * 100.0, piso_nudo * h_piso * 100.0])
+
+    # 2. Columnas (de abajo hacia arriba) y vigas (de izquierda a derecha)
+    pisos = np.arange(1, num_pisos + 1)
+    p_col, e_col = np.meshgrid(pisos, np.arange(n_ejes), indexing='ij')
+    p_col, e_col = p_col.ravel(), e_col.ravel()
+    nodos_col = np.column_stack([(p_col - 1) * n_ejes + e_col, p_col * n_ejes + e_col])
+
+    p_vig, v_vig = np.meshgrid(pisos, np.arange(num_vanos), indexing='ij')
+    p_vig, v_vig = p_vig.ravel(), v_vig.ravel()
+    nodos_vig = np.column_stack([p_vig * n_ejes + v_vig, p_vig * n_ejes + v_vig + 1])
+
+    nodos = np.vstack([nodos_col, nodos_vig])
+    tipo = np.concatenate([np.full(len(p_col), COLUMNA), np.full(len(p_vig), VIGA)])
+    piso = np.concatenate([p_col, p_vig])
+    posicion = np.concatenate([e_col, v_vig])
+
+    # 3. Secciones por piso (escalares o arreglos de longitud num_pisos)
+    b_viga = np.broadcast_to(np.asarray(b_viga, dtype=float), (num_pisos,))
+    h_viga = np.broadcast_to(np.asarray(h_viga, dtype=float), (num_pisos,))
+    b_col = np.broadcast_to(np.asarray(b_col, dtype=float), (num_pisos,))
+    h_col = np.broadcast_to(np.asarray(h_col, dtype=float), (num_pisos,))
+    b = np.where(tipo == COLUMNA, b_col[piso - 1], b_viga[piso - 1])
+    h = np.where(tipo == COLUMNA, h_col[piso - 1], h_viga[piso - 1])
+
+    # 4. Propiedades geométricas y de material
+    Ec = calcular_propiedades_concreto(fc)['Ec']
+    delta = coords[nodos[:, 1]] - coords[nodos[:, 0]]
+    L = np.hypot(delta[:, 0], delta[:, 1])
+
+    portico = {
+        'num_pisos': num_pisos,
+        'num_vanos': num_vanos,
+        'coords': coords,
+        'piso_nudo': piso_nudo,
+        'nodos': nodos,
+        'tipo': tipo,
+        'piso': piso,
+        'posicion': posicion,
+        'b': b,
+        'h': h,
+        'E': np.full(len(tipo), Ec),
+        'A': b * h,
+        'I': b * h**3 / 12,
+        'L': L,
+        'cos': delta[:, 0] / L,
+        'sin': delta[:, 1] / L,
+        'fc': fc,
+    }
+    _numerar_gdl(portico)
+    return portico
+
+
+def actualizar_secciones(portico, b, h):
+    """
+    Devuelve una copia del pórtico con nuevas secciones por elemento (cm),
+    conservando la numeración de GDL y el patrón de ensamblaje ya calculados
+    """
+    nuevo = dict(portico)
+    nuevo['b'] = np.asarray(b, dtype=float)
+    nuevo['h'] = np.asarray(h, dtype=float)
+    nuevo['A'] = nuevo['b'] * nuevo['h']
+    nuevo['I'] = nuevo['b'] * nuevo['h']**3 / 12
+    return nuevo
+
+
+def _numerar_gdl(portico):
+    """Numera GDL (ux, uy, rz por nudo), restringe la base y precalcula el patrón de ensamblaje"""
+    n_nudos = len(portico['coords'])
+    n_gdl = 3 * n_nudos
+    restringido = np.zeros(n_gdl, dtype=bool)
+    base = np.flatnonzero(portico['piso_nudo'] == 0)
+    restringido[(3 * base[:, None] + np.arange(3)).ravel()] = True
+
+    mapa = np.full(n_gdl, -1)
+    libres = np.flatnonzero(~restringido)
+    mapa[libres] = np.arange(len(libres))
+
+    nodos = portico['nodos']
+    gdl_elem = np.hstack([3 * nodos[:, [0]] + np.arange(3), 3 * nodos[:, [1]] + np.arange(3)])
+    gdl_red = mapa[gdl_elem]
+
+    # Patrón simbólico de ensamblaje (se calcula una sola vez)
+    n = len(libres)
+    filas = np.repeat(gdl_red[:, :, None], 6, axis=2)
+    cols = np.repeat(gdl_red[:, None, :], 6, axis=1)
+    valido = (filas >= 0) & (cols >= 0)
+
+    portico['n_gdl'] = n_gdl
+    portico['libres'] = libres
+    portico['mapa_gdl'] = mapa
+    portico['gdl_elem'] = gdl_elem
+    portico['gdl_red'] = gdl_red
+    portico['patron'] = {
+        'n': n,
+        'indice': (filas * n + cols)[valido],
+        'valido': valido,
+    }
+
+
+def rigidez_local(E, A, I, L):
+    """Matrices de rigidez locales de elementos de pórtico plano, forma (n_el, 6, 6)"""
+    E, A, I, L = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (E, A, I, L)))
+    k = np.zeros(E.shape + (6, 6))
+    ea = E * A / L
+    ei1 = 12 * E * I / L**3
+    ei2 = 6 * E * I / L**2
+    ei3 = 4 * E * I / L
+    ei4 = 2 * E * I / L
+
+    k[..., 0, 0] = k[..., 3, 3] = ea
+    k[..., 0, 3] = k[..., 3, 0] = -ea
+    k[..., 1, 1] = k[..., 4, 4] = ei1
+    k[..., 1, 4] = k[..., 4, 1] = -ei1
+    k[..., 1, 2] = k[..., 2, 1] = k[..., 1, 5] = k[..., 5, 1] = ei2
+    k[..., 2, 4] = k[..., 4, 2] = k[..., 4, 5] = k[..., 5, 4] = -ei2
+    k[..., 2, 2] = k[..., 5, 5] = ei3
+    k[..., 2, 5] = k[..., 5, 2] = ei4
+    return k
+
+
+def transformacion(c, s):
+    """Matrices de transformación global → local, forma (n_el, 6, 6)"""
+    c = np.asarray(c, dtype=float)
+    s = np.asarray(s, dtype=float)
+    T = np.zeros(c.shape + (6, 6))
+    for i in (0, 3):
+        T[..., i, i] = c
+        T[..., i, i + 1] = s
+        T[..., i + 1, i] = -s
+        T[..., i + 1, i + 1] = c
+        T[..., i + 2, i + 2] = 1.0
+    return T
+
+
+def rigidez_elementos(portico):
+    """Rigideces locales de todos los elementos del pórtico"""
+    return rigidez_local(portico['E'], portico['A'], portico['I'], portico['L'])
+
+
+def ensamblar_rigidez(portico, k_local=None):
+    """
+    Ensambla la matriz de rigidez global reducida (solo GDL libres)
+    usando el patrón de ensamblaje precalculado del pórtico
+    """
+    if k_local is None:
+        k_local = rigidez_elementos(portico)
+    T = transformacion(portico['cos'], portico['sin'])
+    k_global = np.einsum('eji,ejk,ekl->eil', T, k_local, T)
+
+    patron = portico['patron']
+    n = patron['n']
+    K = np.bincount(patron['indice'], weights=k_global[patron['valido']], minlength=n * n)
+    return K.reshape(n, n)
+
+
+def cargas_gravedad(portico, w_vigas):
+    """
+    Fuerzas de empotramiento y cargas nodales equivalentes por carga distribuida en vigas
+
+    w_vigas: Carga distribuida de gravedad en vigas (kg/m) - escalar o un valor por elemento
+    Retorna (F_reducido, f_empotramiento_local)
+    """
+    n_el = len(portico['tipo'])
+    w = np.broadcast_to(np.asarray(w_vigas, dtype=float), (n_el,)) / 100.0  # kg/cm
+    w = np.where(portico['tipo'] == VIGA, w, 0.0)
+    L = portico['L']
+
+    # Reacciones de empotramiento en ejes locales (las vigas son horizontales)
+    f_emp = np.zeros((n_el, 6))
+    f_emp[:, 1] = w * L / 2
+    f_emp[:, 2] = w * L**2 / 12
+    f_emp[:, 4] = w * L / 2
+    f_emp[:, 5] = -w * L**2 / 12
+
+    T = transformacion(portico['cos'], portico['sin'])
+    f_glob = np.einsum('eji,ej->ei', T, -f_emp)
+    F = np.zeros(portico['n_gdl'])
+    np.add.at(F, portico['gdl_elem'], f_glob)
+    return F[portico['libres']], f_emp
+
+
+def cargas_laterales(portico, fuerzas_piso):
+    """
+    Vector de cargas reducido para fuerzas laterales por piso (kg),
+    repartidas por igual entre los nudos de cada nivel
+    """
+    fuerzas_piso = np.asarray(fuerzas_piso, dtype=float)
+    n_ejes = portico['num_vanos'] + 1
+    F = np.zeros(portico['n_gdl'])
+    nudos = np.flatnonzero(portico['piso_nudo'] > 0)
+    F[3 * nudos] = fuerzas_piso[portico['piso_nudo'][nudos] - 1] / n_ejes
+    return F[portico['libres']]
+
+
+def expandir_desplazamientos(portico, u_red):
+    """Vector completo de desplazamientos (ceros en los GDL restringidos)"""
+    u = np.zeros(portico['n_gdl'])
+    u[portico['libres']] = u_red
+    return u
+
+
+def fuerzas_elementos(portico, u_red, k_local=None, f_empotramiento=None):
+    """Fuerzas de extremo en ejes locales [N_i, V_i, M_i, N_j, V_j, M_j] por elemento"""
+    if k_local is None:
+        k_local = rigidez_elementos(portico)
+    u = expandir_desplazamientos(portico, u_red)
+    T = transformacion(portico['cos'], portico['sin'])
+    u_local = np.einsum('eij,ej->ei', T, u[portico['gdl_elem']])
+    f = np.einsum('eij,ej->ei', k_local, u_local)
+    if f_empotramiento is not None:
+        f = f + f_empotramiento
+    return f
+
+
+def resolver_portico(portico, F_red, K=None):
+    """Resuelve K·u = F para el pórtico (desplazamientos reducidos en cm y rad)"""
+    if K is None:
+        K = ensamblar_rigidez(portico)
+    return np.linalg.solve(K, F_red)
+
+
+def desplazamientos_piso(portico, u_red):
+    """Desplazamiento lateral promedio de cada piso (cm)"""
+    u = expandir_desplazamientos(portico, u_red)
+    piso_nudo = portico['piso_nudo']
+    nudos = np.flatnonzero(piso_nudo > 0)
+    suma = np.bincount(piso_nudo[nudos] - 1, weights=u[3 * nudos], minlength=portico['num_pisos'])
+    return suma / (portico['num_vanos'] + 1)
+
+
+def gdl_techo(portico):
+    """Índice reducido del GDL horizontal del nudo izquierdo del último piso"""
+    nudo = portico['num_pisos'] * (portico['num_vanos'] + 1)
+    return portico['mapa_gdl'][3 * nudo]
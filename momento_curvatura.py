@@ -0,0 +1,282 @@
+"""
+Análisis Momento-Curvatura por Fibras - CONSORCIO DEJ
+Sección discretizada en fibras de concreto confinado y no confinado (Mander) y barras
+de acero con endurecimiento; las fuerzas de todas las fibras y todos los pasos de
+curvatura se integran a la vez y el equilibrio axial se resuelve con Newton vectorizado
+Unidades: kg, cm (momentos en kg·cm, curvaturas en 1/cm, compresión positiva)
+"""
+
+import numpy as np
+
+from diagrama_interaccion import ES
+
+EPS_CO = 0.002     # Deformación en la resistencia máxima del concreto no confinado
+EPS_SP = 0.005     # Deformación de desprendimiento del recubrimiento
+EPS_SH = 0.01      # Inicio del endurecimiento del acero
+EPS_SU = 0.09      # Deformación última del acero
+RAZON_FU_FY = 1.5  # fu/fy del acero ASTM A615 grado 60
+
+
+def parametros_mander(fc, fyh, rho_s, forma='rectangular'):
+    """
+    Concreto confinado de Mander: f'cc, εcc y εcu con presión lateral efectiva
+    f'l = ½·ke·ρs·fyh (ke = 0.75 rectangular, 0.95 circular)
+    """
+    ke = 0.95 if forma == 'circular' else 0.75
+    fl = 0.5 * ke * rho_s * fyh
+    fcc = fc * (-1.254 + 2.254 * np.sqrt(1 + 7.94 * fl / fc) - 2 * fl / fc)
+    eps_cc = EPS_CO * (1 + 5 * (fcc / fc - 1))
+    eps_cu = 0.004 + 1.4 * rho_s * fyh * EPS_SU / fcc
+    return {'fcc': fcc, 'eps_cc': eps_cc, 'eps_cu': eps_cu, 'fl': fl}
+
+
+def _mander(eps, fcc, eps_cc, Ec):
+    """Esfuerzo y módulo tangente de Mander; sin tracción"""
+    r = Ec / (Ec - fcc / eps_cc)
+    x = np.maximum(eps, 0) / eps_cc
+    denominador = r - 1 + x**r
+    sigma = fcc * r * x / denominador
+    tangente = fcc * r * (r - 1) * (1 - x**r) / denominador**2 / eps_cc
+    return np.where(eps > 0, sigma, 0.0), np.where(eps > 0, tangente, 0.0)
+
+
+def _concreto_no_confinado(eps, fc, Ec):
+    """Mander sin confinamiento hasta 2εco y descenso lineal hasta εsp (recubrimiento)"""
+    sigma, tangente = _mander(np.minimum(eps, 2 * EPS_CO), fc, EPS_CO, Ec)
+    sigma_2co = _mander(np.array(2 * EPS_CO), fc, EPS_CO, Ec)[0]
+    pendiente = -sigma_2co / (EPS_SP - 2 * EPS_CO)
+    descenso = eps > 2 * EPS_CO
+    sigma = np.where(descenso, np.maximum(sigma_2co + pendiente * (eps - 2 * EPS_CO), 0), sigma)
+    tangente = np.where(descenso, np.where(eps < EPS_SP, pendiente, 0.0), tangente)
+    return sigma, tangente
+
+
+def _acero(eps, fy):
+    """Elastoplástico con endurecimiento parabólico entre εsh y εsu, simétrico en compresión"""
+    ey = fy / ES
+    fu = RAZON_FU_FY * fy
+    e = np.abs(eps)
+    t = np.clip((EPS_SU - e) / (EPS_SU - EPS_SH), 0, 1)
+    sigma = np.where(e <= ey, ES * e, np.where(e <= EPS_SH, fy, fu - (fu - fy) * t**2))
+    tangente = np.where(e <= ey, ES, np.where((e > EPS_SH) & (e < EPS_SU),
+                                               2 * (fu - fy) * t / (EPS_SU - EPS_SH), 0.0))
+    return np.sign(eps) * sigma, tangente
+
+
+def discretizar_seccion(seccion, eje='x', n_fibras=200, recubrimiento=4.0):
+    """
+    Fibras horizontales de la sección de diagrama_interaccion (rectangular o circular)
+
+    Cada franja se divide en concreto de recubrimiento y núcleo confinado (hasta el eje del
+    estribo, a 'recubrimiento' de las caras). Retorna profundidades desde la cara comprimida
+    y áreas de cada tipo de fibra, más las barras
+    """
+    if eje == 'x':
+        profundidad, ancho, y_barras = seccion['h'], seccion['b'], np.array(seccion['barras_y'])
+    else:
+        profundidad, ancho, y_barras = seccion['b'], seccion['h'], np.array(seccion['barras_x'])
+    espesor = profundidad / n_fibras
+    y = (np.arange(n_fibras) + 0.5) * espesor
+
+    if seccion['forma'] == 'circular':
+        R, Rc = profundidad / 2, profundidad / 2 - recubrimiento
+        total = 2 * np.sqrt(np.maximum(R**2 - (y - R)**2, 0))
+        nucleo = 2 * np.sqrt(np.maximum(Rc**2 - (y - R)**2, 0))
+    else:
+        total = np.full(n_fibras, ancho)
+        en_nucleo = (y > recubrimiento) & (y < profundidad - recubrimiento)
+        nucleo = np.where(en_nucleo, ancho - 2 * recubrimiento, 0.0)
+
+    return {
+        'profundidad': profundidad,
+        'y': y,
+        'A_recubrimiento': (total - nucleo) * espesor,
+        'A_nucleo': nucleo * espesor,
+        'y_barras': y_barras,
+        'As_barras': np.array(seccion['barras_As']),
+    }
+
+
+def cuantia_volumetrica(seccion, As_estribo, s, recubrimiento=4.0):
+    """ρs de un estribo cerrado (rectangular) o espiral (circular) medido al eje del estribo"""
+    if seccion['forma'] == 'circular':
+        ds = seccion['h'] - 2 * recubrimiento
+        return 4 * As_estribo / (ds * s)
+    bc, dc = seccion['b'] - 2 * recubrimiento, seccion['h'] - 2 * recubrimiento
+    return As_estribo * 2 * (bc + dc) / (bc * dc * s)
+
+
+def calcular_momento_curvatura(seccion, fc, fy, P=0.0, eje='x', n_fibras=200, n_puntos=500,
+                               As_estribo=0.71, s_estribo=10.0, fyh=None, recubrimiento=4.0,
+                               phi_max=None, n_tabla=20001, tolerancia=1e-6, max_iteraciones=60):
+    """
+    Curva M-φ de la sección bajo carga axial P (kg, compresión positiva)
+
+    Para cada curvatura φk la deformación es ε(y) = ε0 + φk·(h/2 - y); ε0 se obtiene de
+    ΣσA = P con Newton en todos los pasos a la vez, protegido con bisección cuando la
+    tangente es no positiva o el paso sale del intervalo que encierra la raíz
+    Retorna la curva completa y los puntos de fluencia, nominal y último
+    """
+    fyh = fy if fyh is None else fyh
+    fibras = discretizar_seccion(seccion, eje, n_fibras, recubrimiento)
+    rho_s = cuantia_volumetrica(seccion, As_estribo, s_estribo, recubrimiento)
+    mander = parametros_mander(fc, fyh, rho_s, seccion['forma'])
+    Ec = 15000 * np.sqrt(fc)
+    centro = fibras['profundidad'] / 2
+
+    # 1. Fibras agrupadas por material: recubrimiento, núcleo y barras
+    z_c = centro - fibras['y']
+    z_s = centro - fibras['y_barras']
+    A_rec, A_nuc, As = fibras['A_recubrimiento'], fibras['A_nucleo'], fibras['As_barras']
+    areas_c = np.column_stack([A_rec, A_nuc])
+    y_ext = fibras['y_barras'].max()
+    eps_y = fy / ES
+
+    if phi_max is None:
+        phi_max = 2 * mander['eps_cu'] / (0.1 * fibras['profundidad'])
+    phi = np.linspace(0, phi_max, n_puntos)
+
+    # Los dos concretos se tabulan una vez en la misma malla de deformaciones; cada fibra
+    # se evalúa con un índice y una interpolación lineal, cuya pendiente es la tangente exacta
+    eps_tabla = np.linspace(0, phi_max * fibras['profundidad'], n_tabla)
+    paso_tabla = eps_tabla[1]
+    sigma_tabla = np.column_stack([_concreto_no_confinado(eps_tabla, fc, Ec)[0],
+                                   _mander(eps_tabla, mander['fcc'], mander['eps_cc'], Ec)[0]])
+    pendiente_tabla = np.diff(sigma_tabla, axis=0, append=sigma_tabla[-1:]) / paso_tabla
+    # Fila extra para deformaciones fuera de la tabla: esfuerzo nulo en tracción y constante
+    # más allá del extremo, ambos con tangente nula
+    tabla = np.vstack([np.hstack([sigma_tabla, pendiente_tabla]), np.zeros(4)])
+    tabla[-2, 2:] = 0.0
+
+    def concreto(eps):
+        x = eps / paso_tabla
+        i = np.where(eps > 0, np.minimum(x, n_tabla - 1).astype(int), n_tabla)
+        fila = tabla[i]
+        dx = np.where(eps > 0, eps - i * paso_tabla, 0.0)[..., None]
+        return fila[..., :2] + dx * fila[..., 2:], fila[..., 2:]
+
+    def fuerzas(eps0, phi):
+        eps_c = eps0[:, None] + phi[:, None] * z_c
+        eps_s = eps0[:, None] + phi[:, None] * z_s
+        sigma_c, tangente_c = concreto(eps_c)
+        s_bar, t_bar = _acero(eps_s, fy)
+        # El concreto desplazado por las barras se descuenta con el esfuerzo del núcleo
+        sigma_d, tangente_d = concreto(eps_s)
+        f_c = np.einsum('kfm,fm->kf', sigma_c, areas_c)
+        f_s = (s_bar - sigma_d[..., 1]) * As
+        N = f_c.sum(axis=1) + f_s.sum(axis=1)
+        K = np.einsum('kfm,fm->k', tangente_c, areas_c) + ((t_bar - tangente_d[..., 1]) * As).sum(axis=1)
+        M = f_c @ z_c + f_s @ z_s
+        return N, K, M
+
+    # 2. Newton vectorizado sobre ε0 con intervalo de respaldo; cada iteración evalúa solo
+    #    los pasos que aún no convergen
+    EA = Ec * (A_rec.sum() + A_nuc.sum()) + (ES - Ec) * As.sum()
+    limite = tolerancia * max(abs(P), EA * 1e-3)
+
+    def equilibrio(eps0, phi):
+        eps0 = eps0.copy()
+        inferior = np.full(len(phi), -np.inf)
+        superior = np.full(len(phi), np.inf)
+        convergido = np.zeros(len(phi), dtype=bool)
+        activos = np.arange(len(phi))
+        for _ in range(max_iteraciones):
+            e = eps0[activos]
+            N, K, _ = fuerzas(e, phi[activos])
+            residuo = N - P
+            listo = np.abs(residuo) <= limite
+            convergido[activos[listo]] = True
+            bajo = np.where(residuo < 0, np.maximum(inferior[activos], e), inferior[activos])
+            alto = np.where(residuo > 0, np.minimum(superior[activos], e), superior[activos])
+            with np.errstate(divide='ignore', invalid='ignore'):
+                newton = e - residuo / np.where(K > 0, K, np.nan)
+                medio = (bajo + alto) / 2
+            valido = np.isfinite(newton) & (newton > bajo) & (newton < alto)
+            # Sin tangente útil ni intervalo cerrado se avanza con la rigidez elástica
+            respaldo = np.where(np.isfinite(medio), medio, e - residuo / EA)
+            inferior[activos], superior[activos] = bajo, alto
+            eps0[activos] = np.where(listo, e, np.where(valido, newton, respaldo))
+            activos = activos[~listo]
+            if len(activos) == 0:
+                break
+        return eps0, convergido
+
+    # Primero una malla gruesa de curvaturas; su solución interpolada arranca la malla fina
+    gruesa = np.unique(np.linspace(0, n_puntos - 1, max(n_puntos // 10, 2)).astype(int))
+    eps0_gruesa, _ = equilibrio(np.full(len(gruesa), P / EA), phi[gruesa])
+    eps0, convergido = equilibrio(np.interp(phi, phi[gruesa], eps0_gruesa), phi)
+    N, K, M = fuerzas(eps0, phi)
+
+    # 3. Deformaciones de control en cada paso
+    eps_superior = eps0 + phi * centro
+    eps_nucleo = eps0 + phi * (centro - recubrimiento)
+    eps_acero = -(eps0 + phi * (centro - y_ext))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        c = np.where(phi > 0, eps_superior / phi, np.nan)
+
+    def cruce(valores, limite):
+        """Curvatura y momento interpolados donde 'valores' alcanza 'limite' por primera vez"""
+        k = np.argmax(valores >= limite)
+        if valores[k] < limite:
+            return np.nan, np.nan, len(valores) - 1
+        if k == 0:
+            return phi[0], M[0], 0
+        t = (limite - valores[k - 1]) / (valores[k] - valores[k - 1])
+        return phi[k - 1] + t * (phi[k] - phi[k - 1]), M[k - 1] + t * (M[k] - M[k - 1]), k
+
+    # 4. Primera fluencia (acero en εy o concreto en 0.002), nominal (εc = 0.004 o εs = 0.015)
+    #    y último (εcu confinado, rotura del acero o caída al 80% del momento máximo)
+    candidatos_y = [cruce(eps_acero, eps_y), cruce(eps_superior, EPS_CO)]
+    phi_y1, My1, _ = min(candidatos_y, key=lambda v: v[2])
+    candidatos_n = [cruce(eps_acero, 0.015), cruce(eps_superior, 0.004)]
+    _, Mn, _ = min(candidatos_n, key=lambda v: v[2])
+    caida = np.maximum.accumulate(M) - M
+    candidatos_u = [cruce(eps_nucleo, mander['eps_cu']), cruce(eps_acero, EPS_SU),
+                    cruce(caida / max(M.max(), 1e-12), 0.2)]
+    phi_u, Mu, k_u = min(candidatos_u, key=lambda v: v[2])
+    if np.isnan(Mn):
+        Mn = Mu if np.isfinite(Mu) else M.max()
+    phi_y = phi_y1 * Mn / My1 if My1 > 0 else np.nan
+
+    return {
+        'phi': phi,
+        'M': M,
+        'N': N,
+        'eps0': eps0,
+        'c': c,
+        'eps_concreto': eps_superior,
+        'eps_acero': eps_acero,
+        'convergido': convergido,
+        'valido': convergido & (np.arange(n_puntos) <= k_u),
+        'phi_y_primera': phi_y1,
+        'My_primera': My1,
+        'phi_y': phi_y,
+        'Mn': Mn,
+        'phi_u': phi_u,
+        'Mu': Mu,
+        'ductilidad': phi_u / phi_y,
+        'EI_efectiva': Mn / phi_y,
+        'confinamiento': mander,
+        'rho_s': rho_s,
+    }
+
+
+def rotula_plastica(curva, L, db, fy):
+    """
+    Rótula para el pushover a partir de la curva M-φ (Priestley): longitud plástica
+    Lp = 0.08·L + 0.022·fy·db (fy en MPa) ≥ 0.044·fy·db, giros de fluencia y plástico
+
+    L: distancia de la rótula al punto de inflexión (cm); db: diámetro de barra (cm)
+    Mp (kg·cm) alimenta directamente calcular_pushover
+    """
+    fy_mpa = fy * 0.0980665
+    Lp = np.maximum(0.08 * L + 0.022 * fy_mpa * db, 0.044 * fy_mpa * db)
+    theta_y = curva['phi_y'] * L / 3
+    theta_p = (curva['phi_u'] - curva['phi_y']) * Lp
+    return {
+        'Mp': curva['Mn'],
+        'Lp': Lp,
+        'theta_y': theta_y,
+        'theta_p': theta_p,
+        'ductilidad_giro': 1 + theta_p / theta_y,
+    }
@@ -0,0 +1,304 @@
+"""
+Muro de Contención en Voladizo - CONSORCIO DEJ
+Cálculos del muro de APP1.py separados de la interfaz Streamlit; las funciones
+elementales de numeros_duales aceptan números, arreglos o duales, así que las
+mismas fórmulas entregan también las derivadas exactas de cada resultado.
+La estabilidad se evalúa sobre arreglos: muchos tramos de muro en una sola llamada,
+con empuje estático de Coulomb y, en modo sísmico, de Mononobe-Okabe
+Unidades: t, m (esfuerzos del concreto y acero en kg/cm²)
+"""
+
+import numpy as np
+
+from calculos_estructurales import FACTORES_ZONA
+from numeros_duales import ceil, cos, maximum, radians, sin, sqrt, tan
+
+
+def calcular_diseno_fuste(resultados, datos_entrada):
+    """
+    Calcula el diseño y verificación del fuste del muro según PARTE 2.2.py
+    """
+    # Datos del fuste
+    h1 = datos_entrada['h1']
+    gamma_relleno = datos_entrada['gamma_relleno']
+    phi_relleno = datos_entrada['phi_relleno']
+    cohesion = datos_entrada['cohesion']
+    Df = datos_entrada['Df']
+    fc = datos_entrada['fc']
+    fy = datos_entrada['fy']
+    b = resultados['b']
+    
+    # 1. Cálculo del coeficiente pasivo
+    phi_rad = radians(phi_relleno)
+    kp = (1 + sin(phi_rad)) / (1 - sin(phi_rad))
+    
+    # 2. Empuje pasivo en el intradós
+    Ep = 0.5 * kp * (gamma_relleno/1000) * Df**2 + 2 * cohesion * Df * sqrt(kp)
+    Ep_kg_m = Ep * 1000  # Convertir a kg/m
+    
+    # 3. Altura de aplicación del empuje pasivo
+    yt = Df / 3
+    
+    # 4. Momentos volcadores y estabilizadores
+    # Empuje activo total (componentes horizontales, inclinado δ si hay fricción muro-relleno)
+    ka = resultados['ka']
+    cos_delta = cos(radians(datos_entrada.get('delta', 0)))
+    Ea_relleno = 0.5 * ka * (gamma_relleno/1000) * h1**2 * cos_delta
+    Ea_sobrecarga = ka * (datos_entrada['qsc']/1000) * h1 * cos_delta
+    # Incremento sísmico (Mononobe-Okabe) cuando analizar_muro lo incluye
+    Ea_total = Ea_relleno + Ea_sobrecarga + resultados.get('Ea_sismico', 0)
+    
+    # Momentos volcadores
+    Mvol_relleno = Ea_relleno * h1 / 3
+    Mvol_sobrecarga = Ea_sobrecarga * h1 / 2
+    Mvol_estatico = Mvol_relleno + Mvol_sobrecarga
+    Mvol_total = Mvol_estatico + resultados.get('M_sismico_fuste', 0)
+    
+    # Momentos estabilizadores (simplificado)
+    W_muro = b * h1 * (datos_entrada['gamma_concreto']/1000)
+    W_zapata = resultados['Bz'] * resultados['hz'] * (datos_entrada['gamma_concreto']/1000)
+    W_relleno = resultados['t'] * h1 * (gamma_relleno/1000)
+    
+    # Brazos de momento
+    x_muro = resultados['r'] + b/2
+    x_zapata = resultados['Bz']/2
+    x_relleno = resultados['r'] + b + resultados['t']/2
+    
+    Mr_muro = W_muro * x_muro
+    Mr_zapata = W_zapata * x_zapata
+    Mr_relleno = W_relleno * x_relleno
+    Mr_pasivo = Ep * yt
+    Mesta_total = Mr_muro + Mr_zapata + Mr_relleno + Mr_pasivo
+    
+    # 5. Factores de seguridad
+    FSv = Mesta_total / Mvol_total
+    FSd = (tan(phi_rad) * (W_muro + W_zapata + W_relleno) + Ep) / Ea_total
+    
+    # 6. Ubicación de la resultante y excentricidad
+    W_total = W_muro + W_zapata + W_relleno
+    sum_momentos = Mr_muro + Mr_zapata + Mr_relleno
+    x_barra = sum_momentos / W_total
+    e = abs(x_barra - resultados['Bz']/2)
+    
+    # 7. Cálculo del peralte efectivo
+    # Momento de diseño
+    Mu = 1.4 * Mvol_estatico  # Factor de carga
+    if 'M_sismico_fuste' in resultados:
+        # Combinación sísmica 1.25·(D + L) + 1.0·E, con el sismo sin amplificar
+        Mu = maximum(Mu, 1.25 * Mvol_estatico + resultados['M_sismico_fuste'])
+    
+    # Resistencia del concreto
+    fc_kg_cm2 = fc
+    fy_kg_cm2 = fy
+    
+    # Peralte efectivo requerido
+    dreq = sqrt(Mu * 100000 / (0.9 * 0.85 * fc_kg_cm2 * b * 100 * 0.59))
+    hreq = dreq + 9  # Recubrimiento + diámetro de barra
+    dreal = resultados['hz'] * 100 - 9  # Peralte real en cm
+    
+    # 8. Área de acero
+    As = Mu * 100000 / (0.9 * fy_kg_cm2 * dreal)
+    Asmin = 0.0033 * b * 100 * dreal  # Cuantía mínima
+    
+    # 9. Distribución del acero
+    # Usar barras de 5/8" (1.98 cm²)
+    area_barra = 1.98
+    num_barras = ceil(As / area_barra)
+    As_proporcionado = num_barras * area_barra
+    separacion = (b * 100 - 6) / (num_barras - 1)  # 3cm de recubrimiento
+    
+    # 10. Verificación de cuantías
+    rho_real = As_proporcionado / (b * 100 * dreal)
+    rho_min = 0.0033
+    rho_max = 0.0163
+    
+    # 11. Acero por retracción y temperatura
+    As_retraccion = 0.002 * b * 100 * resultados['hz'] * 100
+    num_barras_retraccion = ceil(As_retraccion / 1.27)  # Barras de 1/2"
+    As_retraccion_proporcionado = num_barras_retraccion * 1.27
+    
+    return {
+        'kp': kp,
+        'Ep_kg_m': Ep_kg_m,
+        'yt': yt,
+        'Mvol_total': Mvol_total,
+        'Mesta_total': Mesta_total,
+        'FSv': FSv,
+        'FSd': FSd,
+        'x_barra': x_barra,
+        'e': e,
+        'dreq': dreq,
+        'hreq': hreq,
+        'dreal': dreal,
+        'As': As,
+        'Asmin': Asmin,
+        'num_barras': num_barras,
+        'As_proporcionado': As_proporcionado,
+        'separacion': separacion,
+        'rho_real': rho_real,
+        'As_retraccion': As_retraccion,
+        'num_barras_retraccion': num_barras_retraccion,
+        'As_retraccion_proporcionado': As_retraccion_proporcionado
+    }
+
+
+# Factores de seguridad mínimos y coeficiente kc del predimensionamiento de APP1.py
+FS_VOLCAMIENTO_MIN = 2.0
+FS_DESLIZAMIENTO_MIN = 1.5
+KC_CONCRETO = 14.28   # Para fc = 210 kg/cm²
+
+
+def coeficiente_mononobe_okabe(phi, kh=0.0, kv=0.0, delta=0.0, beta=0.0, theta=0.0):
+    """
+    Coeficiente de empuje activo sísmico KAE de Mononobe-Okabe para arreglos
+
+    phi: fricción del relleno; delta: fricción muro-relleno; beta: pendiente del relleno;
+    theta: inclinación del trasdós respecto de la vertical (ángulos en grados)
+    kh, kv: coeficientes sísmicos horizontal y vertical (kv > 0 hacia arriba)
+    El empuje es EAE = ½·γ·H²·(1 - kv)·KAE, inclinado delta respecto de la normal al trasdós;
+    sin equilibrio posible (phi < beta + ψ) el coeficiente es nan
+    """
+    phi, delta, beta, theta = (np.radians(np.asarray(v, dtype=float)) for v in (phi, delta, beta, theta))
+    psi = np.arctan(np.asarray(kh, dtype=float) / (1 - np.asarray(kv, dtype=float)))
+    with np.errstate(invalid='ignore'):
+        raiz = np.sqrt(np.sin(phi + delta) * np.sin(phi - beta - psi)
+                       / (np.cos(delta + theta + psi) * np.cos(beta - theta)))
+    return (np.cos(phi - theta - psi)**2
+            / (np.cos(psi) * np.cos(theta)**2 * np.cos(delta + theta + psi) * (1 + raiz)**2))
+
+
+def coeficiente_coulomb(phi, delta=0.0, beta=0.0, theta=0.0):
+    """Coeficiente de empuje activo de Coulomb (KAE sin sismo); con delta = beta = theta = 0 es el de Rankine"""
+    return coeficiente_mononobe_okabe(phi, 0.0, 0.0, delta, beta, theta)
+
+
+def coeficiente_sismico_zona(zona_sismica, fraccion=0.5):
+    """kh = fraccion·Z con el factor de zona de E.030 (la mitad de Z para muros que admiten desplazamiento)"""
+    return fraccion * FACTORES_ZONA[zona_sismica]
+
+
+def dimensionar_muro(h1, Df, hm, gamma_relleno, phi_relleno, qsc):
+    """
+    Proporciones empíricas del muro (Bz, hz, b, r, t en m, redondeadas al cm) para arreglos
+
+    Mismas fórmulas del predimensionamiento de APP1.py con Rankine para Ka
+    """
+    h1, Df, hm, gamma_relleno, phi_relleno, qsc = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(v, dtype=float)) for v in (h1, Df, hm, gamma_relleno, phi_relleno, qsc)))
+    ka = np.tan(np.radians(45 - phi_relleno / 2))**2
+    hs = qsc / gamma_relleno
+    H = h1 + Df
+
+    Bz = np.rint(H * (1 + hs / H) * np.sqrt(ka) * 100) / 100
+    hz = np.maximum(0.4, np.rint(np.sqrt(H**2 * (1 + hs / H) / (9 * KC_CONCRETO)) * 100) / 100)
+    b = np.maximum(0.35, np.rint(np.sqrt((h1 + hm)**2 * (1 + hs / (h1 + hm)) / (10 * KC_CONCRETO)) * 100) / 100)
+    r = np.maximum(0.7, np.rint((2 * Bz - 3 * b) / 6 * 100) / 100)
+    t = np.rint((Bz - r - b) * 100) / 100
+    return {'ka': ka, 'hs': hs, 'Bz': Bz, 'hz': hz, 'b': b, 'r': r, 't': t}
+
+
+def analizar_muro(h1, Df, hm, gamma_relleno, phi_relleno, gamma_cimentacion, phi_cimentacion, cohesion, qsc,
+                  fc=210, fy=4200, sigma_adm=2.5, gamma_concreto=2400, Bz=None, hz=None, b=None, r=None, t=None,
+                  kh=0.0, kv=0.0, delta=0.0, beta=0.0):
+    """
+    Estabilidad del muro en voladizo para muchos casos a la vez (p. ej. tramos de un corte)
+
+    Todas las entradas aceptan arreglos con formas compatibles; alturas en m, pesos
+    específicos y sobrecarga en kg/m³ y kg/m², ángulos en grados, cohesión en t/m²
+    Bz, hz, b, r, t: proporciones dadas (m); si se omiten se usan las de dimensionar_muro
+    kh, kv: modo sísmico (p. ej. kh = coeficiente_sismico_zona('Z4')); delta y beta: fricción
+    muro-relleno y pendiente del relleno en grados, con Coulomb en el caso estático
+    Con kh o kv no nulos la excentricidad usa el momento volcador completo (empujes estáticos,
+    incremento dinámico e inercias), no solo las cargas verticales como el caso estático
+    Retorna arreglos con las claves de los resultados de APP1.py, el diseño del fuste
+    y las máscaras de cada verificación
+    """
+    h1, Df, hm, gamma_relleno, phi_relleno, gamma_cimentacion, phi_cimentacion, cohesion, qsc, fc, fy, \
+        sigma_adm, gamma_concreto, kh, kv, delta, beta = np.broadcast_arrays(*(
+            np.atleast_1d(np.asarray(v, dtype=float)) for v in (
+                h1, Df, hm, gamma_relleno, phi_relleno, gamma_cimentacion, phi_cimentacion, cohesion, qsc, fc, fy,
+                sigma_adm, gamma_concreto, kh, kv, delta, beta)))
+
+    # 1. Proporciones: empíricas o las dadas
+    dimensiones = dimensionar_muro(h1, Df, hm, gamma_relleno, phi_relleno, qsc)
+    for clave, valor in (('Bz', Bz), ('hz', hz), ('b', b), ('r', r), ('t', t)):
+        if valor is not None:
+            dimensiones[clave] = np.asarray(valor, dtype=float)
+    hs = dimensiones['hs']
+    Bz, hz, b, r, t = np.broadcast_arrays(*(dimensiones[clave] + 0 * h1 for clave in ('Bz', 'hz', 'b', 'r', 't')))
+
+    # 2. Coeficientes de empuje: Coulomb estático (Rankine si delta = beta = 0) y Mononobe-Okabe
+    ka = coeficiente_coulomb(phi_relleno, delta, beta)
+    kae = coeficiente_mononobe_okabe(phi_relleno, kh, kv, delta, beta)
+    cos_delta = np.cos(np.radians(delta))
+
+    # 3. Empujes activo (componentes horizontales de relleno + sobrecarga) y pasivo, en t/m
+    Ea_relleno = 0.5 * ka * (gamma_relleno / 1000) * h1**2 * cos_delta
+    Ea_sobrecarga = ka * (qsc / 1000) * h1 * cos_delta
+    kp = np.tan(np.radians(45 + phi_cimentacion / 2))**2
+    Ep = 0.5 * kp * (gamma_cimentacion / 1000) * Df**2
+
+    # 4. Incremento dinámico: EAE - EA del relleno a 0.6·h1 y de la sobrecarga a h1/2
+    dE_relleno = 0.5 * ((1 - kv) * kae - ka) * (gamma_relleno / 1000) * h1**2
+    dE_sobrecarga = ((1 - kv) * kae - ka) * (qsc / 1000) * h1
+    Ea_sismico = (dE_relleno + dE_sobrecarga) * cos_delta
+    Ea_total = Ea_relleno + Ea_sobrecarga + Ea_sismico
+    # Componente vertical del empuje inclinado delta, aplicada en el talón
+    Ea_vertical = (Ea_relleno + Ea_sobrecarga + Ea_sismico) * np.tan(np.radians(delta))
+
+    # 5. Pesos (reducidos por kv), fuerzas de inercia y momentos respecto de la punta
+    W_muro = b * h1 * (gamma_concreto / 1000)
+    W_zapata = Bz * hz * (gamma_concreto / 1000)
+    W_relleno = t * h1 * (gamma_relleno / 1000)
+    W_total = W_muro + W_zapata + W_relleno
+    N = (1 - kv) * W_total + Ea_vertical
+    F_inercia = kh * W_total
+    Mr_verticales = (1 - kv) * (W_muro * (r + b / 2) + W_zapata * Bz / 2 + W_relleno * (r + b + t / 2)) \
+        + Ea_vertical * Bz
+    M_sismico_fuste = (dE_relleno * 0.6 * h1 + dE_sobrecarga * h1 / 2) * cos_delta + kh * W_muro * h1 / 2
+    M_sismico = M_sismico_fuste + kh * W_relleno * h1 / 2 + kh * W_zapata * hz / 2
+    M_estabilizador = Mr_verticales + Ep * Df / 3
+    M_volcador = Ea_relleno * h1 / 3 + Ea_sobrecarga * h1 / 2 + M_sismico
+
+    # 6. Factores de seguridad
+    FS_volcamiento = M_estabilizador / M_volcador
+    FS_deslizamiento = (np.tan(np.radians(phi_cimentacion)) * N + Ep) / (Ea_total + F_inercia)
+
+    # 7. Presiones sobre el suelo: en el caso estático con la resultante de las cargas verticales
+    # (criterio de APP1.py); con sismo, con el momento volcador completo
+    sismico = (kh != 0) | (kv != 0)
+    e = np.abs(np.where(sismico, Mr_verticales - M_volcador, Mr_verticales) / N - Bz / 2)
+    q_max = N / Bz * (1 + 6 * e / Bz)
+    q_min = N / Bz * (1 - 6 * e / Bz)
+    tension = q_min < 0
+
+    resultado = {
+        'ka': ka, 'kp': kp, 'hs': hs, 'Bz': Bz, 'hz': hz, 'b': b, 'r': r, 't': t,
+        'hm': hm, 'h1': h1, 'Df': Df, 'qsc': qsc,
+        'Ea_relleno': Ea_relleno, 'Ea_sobrecarga': Ea_sobrecarga, 'Ea_total': Ea_total, 'Ep': Ep,
+        'W_muro': W_muro, 'W_zapata': W_zapata, 'W_relleno': W_relleno, 'W_total': W_total,
+        'M_volcador': M_volcador, 'M_estabilizador': M_estabilizador,
+        'FS_volcamiento': FS_volcamiento, 'FS_deslizamiento': FS_deslizamiento,
+        'q_max_kg_cm2': q_max * 0.1, 'q_min_kg_cm2': q_min * 0.1, 'e': e, 'tension': tension,
+        'kh': kh, 'kv': kv, 'kae': kae, 'Ea_sismico': Ea_sismico, 'Ea_vertical': Ea_vertical,
+        'F_inercia': F_inercia, 'M_sismico': M_sismico, 'M_sismico_fuste': M_sismico_fuste,
+    }
+
+    # 8. Fuste con las mismas fórmulas de calcular_diseno_fuste, ahora sobre arreglos
+    datos_entrada = {'h1': h1, 'gamma_relleno': gamma_relleno, 'phi_relleno': phi_relleno, 'cohesion': cohesion,
+                     'Df': Df, 'fc': fc, 'fy': fy, 'gamma_concreto': gamma_concreto, 'qsc': qsc, 'delta': delta}
+    with np.errstate(divide='ignore', invalid='ignore'):
+        fuste = calcular_diseno_fuste(resultado, datos_entrada)
+    resultado['fuste'] = fuste
+
+    # 9. Máscaras de verificación (mismo criterio del resumen final de APP1.py)
+    resultado['cumple_volcamiento'] = FS_volcamiento >= FS_VOLCAMIENTO_MIN
+    resultado['cumple_deslizamiento'] = FS_deslizamiento >= FS_DESLIZAMIENTO_MIN
+    resultado['cumple_presion'] = q_max * 0.1 <= sigma_adm
+    resultado['cumple_excentricidad'] = e <= Bz / 6
+    resultado['cumple_peralte'] = fuste['dreal'] >= fuste['dreq']
+    resultado['cumple_acero'] = fuste['As_proporcionado'] >= fuste['As']
+    resultado['cumple'] = (resultado['cumple_volcamiento'] & resultado['cumple_deslizamiento']
+                           & resultado['cumple_presion'] & ~tension & resultado['cumple_excentricidad']
+                           & resultado['cumple_peralte'] & resultado['cumple_acero'])
+    return resultado
@@ -0,0 +1,229 @@
+"""
+Diseño de Muros Estructurales - CONSORCIO DEJ
+Diagrama P-M en el plano de muros rectangulares, L y T con acero distribuido en el
+alma, necesidad de elementos de borde (método de desplazamientos y de esfuerzos) y
+cortante con amplificación por capacidad (E.060 cap. 21 / ACI 318-2025 18.10),
+verificados en todos los pisos y combinaciones a la vez
+Unidades: kg, cm (momentos en kg·cm)
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from diagrama_interaccion import ECU, ES, factor_phi, razon_demanda_capacidad
+from diseno_estribos import PHI_CORTANTE
+from flexion_biaxial import momento_resistente
+from flexion_vectorizada import calcular_beta1
+from seleccion_barras import AREAS
+
+CUANTIA_MINIMA_MURO = 0.0025
+DERIVA_MINIMA_BORDE = 0.005  # δu/hw mínimo del método de desplazamientos
+
+
+def crear_muro(lw, tw, rho_vertical=CUANTIA_MINIMA_MURO, s_vertical=20.0, As_extremo=0.0,
+               x_extremo=15.0, ala_inicio=None, ala_fin=None, recubrimiento=4.0):
+    """
+    Sección de muro en planta: alma de largo lw y espesor tw (cm) con alas opcionales
+    (ancho, espesor) en el extremo inicial o final; T y L coinciden para flexión en el
+    plano del alma. El acero vertical distribuido (ρ en dos capas a s_vertical) cubre alma
+    y alas; As_extremo (cm²) se concentra a x_extremo de cada borde
+    """
+    rectangulos = []
+    inicio = 0.0 if ala_inicio is None else float(ala_inicio[1])
+    fin = float(lw) if ala_fin is None else float(lw) - float(ala_fin[1])
+    if ala_inicio is not None:
+        rectangulos.append((0.0, float(ala_inicio[1]), float(ala_inicio[0])))
+    rectangulos.append((inicio, fin - inicio, float(tw)))
+    if ala_fin is not None:
+        rectangulos.append((fin, float(ala_fin[1]), float(ala_fin[0])))
+
+    # Barras distribuidas: una fila cada s_vertical a lo largo de cada rectángulo, con el
+    # área de dos capas (o de las filas del ala) repartida según su ancho
+    barras_x, barras_As = [], []
+    for x0, largo, ancho in rectangulos:
+        n = max(int(np.ceil(largo / s_vertical)), 1)
+        x = x0 + (np.arange(n) + 0.5) * largo / n
+        barras_x.extend(x)
+        barras_As.extend(np.full(n, rho_vertical * ancho * largo / n))
+    if As_extremo > 0:
+        barras_x.extend([x_extremo, lw - x_extremo])
+        barras_As.extend([As_extremo, As_extremo])
+    return {
+        'lw': float(lw),
+        'tw': float(tw),
+        'rectangulos': tuple(rectangulos),
+        'barras_x': tuple(float(v) for v in barras_x),
+        'barras_As': tuple(float(v) for v in barras_As),
+        'recubrimiento': float(recubrimiento),
+    }
+
+
+def propiedades_muro(muro):
+    """Área, centroide desde el extremo inicial, inercia bruta en el plano y Acv del alma"""
+    x0, largo, ancho = np.array(muro['rectangulos']).T
+    area = largo * ancho
+    Ag = area.sum()
+    x_c = (area * (x0 + largo / 2)).sum() / Ag
+    Ig = (ancho * largo**3 / 12 + area * (x0 + largo / 2 - x_c)**2).sum()
+    return {'Ag': Ag, 'x_centroide': x_c, 'Ig': Ig, 'Acv': muro['lw'] * muro['tw']}
+
+
+def _bloque_rectangulos(x0, largo, ancho, a):
+    """Área y primer momento (desde el borde comprimido) del bloque de profundidad a"""
+    tramo = np.clip(a[:, None] - x0[None, :], 0, largo[None, :])
+    area = (ancho * tramo).sum(axis=1)
+    momento = (ancho * tramo * (x0 + tramo / 2)).sum(axis=1)
+    return area, momento
+
+
+@lru_cache(maxsize=256)
+def _diagrama_muro_cacheado(firma, n_puntos):
+    lw, rectangulos, bx, bAs, fc, fy = firma
+    x0, largo, ancho = np.array(rectangulos).T
+    x = np.array(bx)
+    As = np.array(bAs)
+    Ast = As.sum()
+    Ag = (largo * ancho).sum()
+    x_c = (largo * ancho * (x0 + largo / 2)).sum() / Ag
+    beta1 = calcular_beta1(fc)
+    ey = fy / ES
+
+    P0 = 0.85 * fc * (Ag - Ast) + fy * Ast
+    Pn_max = 0.80 * P0
+    Pnt = -fy * Ast
+    c = lw * np.concatenate([np.geomspace(1e-3, 1.0, n_puntos // 2, endpoint=False),
+                             np.linspace(1.0, 4.0, n_puntos - n_puntos // 2)])
+
+    resultado = {}
+    curvas = []
+    # Sentido positivo: comprimido el extremo inicial; negativo: el final (coordenadas espejo)
+    for signo, xr0, xb, centro in ((1, x0, x, x_c), (-1, lw - x0 - largo, lw - x, lw - x_c)):
+        eps = ECU * (c[:, None] - xb[None, :]) / c[:, None]
+        fs = np.clip(ES * eps, -fy, fy)
+        a = beta1 * c
+        area_c, momento_c = _bloque_rectangulos(xr0, largo, ancho, a)
+        desplazado = (xb[None, :] < a[:, None]) * 0.85 * fc
+        fuerza_barras = As[None, :] * (fs - desplazado)
+        Cc = 0.85 * fc * area_c
+        Pn = Cc + fuerza_barras.sum(axis=1)
+        Mn = Cc * centro - 0.85 * fc * momento_c + (fuerza_barras * (centro - xb[None, :])).sum(axis=1)
+        eps_t = ECU * (xb.max() - c) / c
+        phi = factor_phi(eps_t, ey)
+        curvas.append((Pn, signo * Mn, phi))
+        clave = 'pos' if signo > 0 else 'neg'
+        # Eje neutro en función de la carga axial (Pn crece con c) para el método de desplazamientos
+        resultado[f'c_{clave}'] = c
+        resultado[f'Pn_{clave}'] = np.maximum.accumulate(Pn)
+
+    (Pp, Mp, phip), (Pm, Mm, phim) = curvas
+    Pn = np.concatenate([[Pnt], Pp, [P0], Pm[::-1], [Pnt]])
+    Mn = np.concatenate([[0.0], Mp, [0.0], Mm[::-1], [0.0]])
+    phi = np.concatenate([[0.90], phip, [0.65], phim[::-1], [0.90]])
+    resultado.update({
+        'Pn': Pn, 'Mn': Mn, 'phi': phi,
+        'phiPn': np.minimum(phi * Pn, 0.65 * Pn_max), 'phiMn': phi * Mn,
+        'P0': P0, 'Pn_max': Pn_max, 'Pnt': Pnt,
+    })
+    for valor in resultado.values():
+        if isinstance(valor, np.ndarray):
+            valor.setflags(write=False)
+    return resultado
+
+
+def calcular_diagrama_muro(muro, fc, fy, n_puntos=80):
+    """Diagrama de interacción en el plano del muro, en caché por firma de sección y materiales"""
+    firma = (muro['lw'], muro['rectangulos'], muro['barras_x'], muro['barras_As'], float(fc), float(fy))
+    return _diagrama_muro_cacheado(firma, int(n_puntos))
+
+
+def coeficiente_alfa_c(hw_lw):
+    """αc del cortante de muros: 0.80 para hw/lw ≤ 1.5, 0.53 para hw/lw ≥ 2 e interpolado"""
+    return np.interp(hw_lw, [1.5, 2.0], [0.80, 0.53])
+
+
+def verificar_muros(muros, indice_muro, fc, fy, Pu, Mu, Vu, hw, delta_u=None, R=6.0,
+                    barra_horizontal=1, limite_esfuerzo=0.2):
+    """
+    Flexocompresión, elementos de borde y cortante de muros en todos los pisos y combinaciones
+
+    muros: lista de secciones de crear_muro; indice_muro: sección de cada caso (broadcast con Pu)
+    Pu, Mu, Vu: fuerzas últimas (kg, kg·cm) de forma (..., ) p. ej. (n_pisos, n_combinaciones);
+    Mu con signo: positivo comprime el extremo inicial
+    hw: altura total del muro (cm); delta_u: desplazamiento inelástico de diseño en el techo (cm)
+    para el método de desplazamientos (si es None solo se aplica el de esfuerzos)
+    Vu se amplifica por Mn/Mu (≤ R) según E.060 21.9.5.3
+    """
+    Pu, Mu, Vu = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (Pu, Mu, Vu)))
+    indice = np.broadcast_to(np.asarray(indice_muro), Pu.shape)
+    campos = ('razon', 'Mn', 'c', 'lw', 'tw', 'Ag', 'Ig', 'x_centroide', 'Acv')
+    r = {campo: np.zeros(Pu.shape) for campo in campos}
+
+    # 1. Curvas por sección (en caché) y consultas vectorizadas por grupo
+    for k in np.unique(indice):
+        grupo = indice == k
+        muro = muros[k]
+        diagrama = calcular_diagrama_muro(muro, fc, fy)
+        props = propiedades_muro(muro)
+        P, M = Pu[grupo], Mu[grupo]
+        r['razon'][grupo] = razon_demanda_capacidad(diagrama['phiMn'], diagrama['phiPn'], M, P)
+        M_pos, M_neg = momento_resistente(diagrama['Mn'], diagrama['Pn'], P)
+        r['Mn'][grupo] = np.where(M >= 0, M_pos, -M_neg)
+        c_pos = np.interp(P, diagrama['Pn_pos'], diagrama['c_pos'])
+        c_neg = np.interp(P, diagrama['Pn_neg'], diagrama['c_neg'])
+        r['c'][grupo] = np.where(M >= 0, c_pos, c_neg)
+        r['lw'][grupo], r['tw'][grupo] = muro['lw'], muro['tw']
+        for campo in ('Ag', 'Ig', 'x_centroide', 'Acv'):
+            r[campo][grupo] = props[campo]
+
+    lw, c = r['lw'], r['c']
+    # 2. Elementos de borde: desplazamientos (c ≥ lw / (600·δu/hw)) y esfuerzos (σ > 0.2 f'c)
+    if delta_u is None:
+        requiere_desplazamiento = np.zeros(Pu.shape, dtype=bool)
+    else:
+        deriva = np.maximum(np.asarray(delta_u, dtype=float) / hw, DERIVA_MINIMA_BORDE)
+        requiere_desplazamiento = c >= lw / (600 * deriva)
+    y_extremo = np.where(Mu >= 0, r['x_centroide'], lw - r['x_centroide'])
+    sigma = Pu / r['Ag'] + np.abs(Mu) * y_extremo / r['Ig']
+    requiere_esfuerzo = sigma > limite_esfuerzo * fc
+    requiere_borde = requiere_desplazamiento | requiere_esfuerzo
+    with np.errstate(divide='ignore', invalid='ignore'):
+        altura_borde = np.maximum(lw, np.where(Vu != 0, np.abs(Mu) / (4 * np.abs(Vu)), 0.0))
+    longitud_borde = np.maximum(c - 0.1 * lw, c / 2)
+
+    # 3. Cortante: Vu amplificado por capacidad y Vn = Acv·(αc·√f'c + ρh·fy) ≤ 2.6·√f'c·Acv
+    with np.errstate(divide='ignore', invalid='ignore'):
+        amplificacion = np.clip(np.where(Mu != 0, r['Mn'] / np.abs(Mu), 1.0), 1.0, R)
+    Vu_diseno = np.abs(Vu) * amplificacion
+    alfa_c = coeficiente_alfa_c(hw / lw)
+    Acv = r['Acv']
+    rho_h = (Vu_diseno / (PHI_CORTANTE * Acv) - alfa_c * np.sqrt(fc)) / fy
+    rho_h_minimo = np.where(Vu_diseno > 0.27 * np.sqrt(fc) * Acv, CUANTIA_MINIMA_MURO, 0.002)
+    rho_h = np.maximum(rho_h, rho_h_minimo)
+    Vn_maximo = 2.6 * np.sqrt(fc) * Acv
+    phiVn = PHI_CORTANTE * np.minimum(Acv * (alfa_c * np.sqrt(fc) + rho_h * fy), Vn_maximo)
+    # ρv ≥ 0.0025 + 0.5·(2.5 - hw/lw)·(ρh - 0.0025) (E.060 11.10.10.4)
+    rho_v_minimo = np.maximum(CUANTIA_MINIMA_MURO + 0.5 * (2.5 - hw / lw) * (rho_h - CUANTIA_MINIMA_MURO),
+                              CUANTIA_MINIMA_MURO)
+    rho_v_minimo = np.minimum(rho_v_minimo, rho_h)
+    s_maximo = np.minimum(3 * r['tw'], 40.0)
+    s_horizontal = np.minimum(2 * AREAS[barra_horizontal] / (rho_h * r['tw']), s_maximo)
+
+    return {
+        'razon_flexion': r['razon'],
+        'cumple_flexion': r['razon'] <= 1.0,
+        'Mn': r['Mn'],
+        'c': c,
+        'requiere_borde_desplazamiento': requiere_desplazamiento,
+        'sigma_compresion': sigma,
+        'requiere_borde_esfuerzo': requiere_esfuerzo,
+        'requiere_borde': requiere_borde,
+        'longitud_borde': np.where(requiere_borde, longitud_borde, 0.0),
+        'altura_borde': np.where(requiere_desplazamiento, altura_borde, 0.0),
+        'Vu_diseno': Vu_diseno,
+        'phiVn': phiVn,
+        'rho_h': rho_h,
+        'rho_v_minimo': rho_v_minimo,
+        's_horizontal': s_horizontal,
+        'cumple_cortante': Vu_diseno <= PHI_CORTANTE * Vn_maximo,
+    }
@@ -0,0 +1,277 @@
+"""
+Números Duales - CONSORCIO DEJ
+Diferenciación automática en modo directo: un valor lleva junto el vector de sus
+derivadas respecto de todas las entradas, de modo que una sola evaluación de las
+funciones de cálculo entrega los resultados y su jacobiano exacto, sin diferencias finitas
+Las funciones sqrt, sin, ... aceptan números, arreglos de NumPy o duales
+"""
+
+import math
+
+import numpy as np
+
+
+class Dual:
+    """Valor (número o arreglo) con derivadas respecto de n entradas, forma valor.shape + (n,)"""
+
+    __slots__ = ('valor', 'derivadas')
+    __array_ufunc__ = None   # NumPy delega las operaciones mixtas en los métodos reflejados
+    __hash__ = None
+
+    def __init__(self, valor, derivadas):
+        self.valor = valor
+        self.derivadas = np.asarray(derivadas, dtype=float)
+
+    def _cadena(self, valor, derivada_local):
+        """Regla de la cadena para una función de un solo argumento"""
+        return Dual(valor, np.asarray(derivada_local, dtype=float)[..., None] * self.derivadas)
+
+    def __add__(self, otro):
+        if isinstance(otro, Dual):
+            return Dual(self.valor + otro.valor, self.derivadas + otro.derivadas)
+        return Dual(self.valor + otro, self.derivadas)
+
+    __radd__ = __add__
+
+    def __sub__(self, otro):
+        if isinstance(otro, Dual):
+            return Dual(self.valor - otro.valor, self.derivadas - otro.derivadas)
+        return Dual(self.valor - otro, self.derivadas)
+
+    def __rsub__(self, otro):
+        return Dual(otro - self.valor, -self.derivadas)
+
+    def __mul__(self, otro):
+        if isinstance(otro, Dual):
+            return Dual(self.valor * otro.valor,
+                        np.asarray(otro.valor)[..., None] * self.derivadas
+                        + np.asarray(self.valor)[..., None] * otro.derivadas)
+        return Dual(self.valor * otro, np.asarray(otro)[..., None] * self.derivadas)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, otro):
+        if isinstance(otro, Dual):
+            return self * otro._inverso()
+        return Dual(self.valor / otro, self.derivadas / np.asarray(otro)[..., None])
+
+    def __rtruediv__(self, otro):
+        return otro * self._inverso()
+
+    def _inverso(self):
+        return self._cadena(1 / self.valor, -1 / np.asarray(self.valor)**2)
+
+    def __pow__(self, exponente):
+        if isinstance(exponente, Dual):
+            return exp(exponente * log(self))
+        return self._cadena(self.valor**exponente, exponente * np.asarray(self.valor, dtype=float)**(exponente - 1))
+
+    def __rpow__(self, base):
+        valor = base**self.valor
+        return self._cadena(valor, np.log(base) * valor)
+
+    def __neg__(self):
+        return Dual(-self.valor, -self.derivadas)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return self._cadena(abs(self.valor), np.sign(self.valor))
+
+    # Las comparaciones usan solo el valor: las ramas de max, min e if siguen al valor actual
+    def __lt__(self, otro):
+        return self.valor < _valor(otro)
+
+    def __le__(self, otro):
+        return self.valor <= _valor(otro)
+
+    def __gt__(self, otro):
+        return self.valor > _valor(otro)
+
+    def __ge__(self, otro):
+        return self.valor >= _valor(otro)
+
+    def __eq__(self, otro):
+        return self.valor == _valor(otro)
+
+    def __ne__(self, otro):
+        return self.valor != _valor(otro)
+
+    def __float__(self):
+        return float(self.valor)
+
+    def __format__(self, formato):
+        return format(self.valor, formato)
+
+    def __repr__(self):
+        return f"Dual({self.valor!r}, {self.derivadas!r})"
+
+
+def _valor(x):
+    return x.valor if isinstance(x, Dual) else x
+
+
+def _unaria(funcion_math, funcion_numpy, derivada):
+    """Función elemental que acepta números, arreglos o duales"""
+    def aplicar(x):
+        if isinstance(x, Dual):
+            return x._cadena(aplicar(x.valor), derivada(np.asarray(x.valor, dtype=float)))
+        if isinstance(x, np.ndarray):
+            return funcion_numpy(x)
+        return funcion_math(x)
+    aplicar.__name__ = funcion_math.__name__
+    aplicar.__doc__ = f"{funcion_math.__name__} para números, arreglos y duales"
+    return aplicar
+
+
+sqrt = _unaria(math.sqrt, np.sqrt, lambda v: 0.5 / np.sqrt(v))
+exp = _unaria(math.exp, np.exp, np.exp)
+log = _unaria(math.log, np.log, lambda v: 1 / v)
+sin = _unaria(math.sin, np.sin, np.cos)
+cos = _unaria(math.cos, np.cos, lambda v: -np.sin(v))
+tan = _unaria(math.tan, np.tan, lambda v: 1 / np.cos(v)**2)
+atan = _unaria(math.atan, np.arctan, lambda v: 1 / (1 + v**2))
+radians = _unaria(math.radians, np.radians, lambda v: np.full_like(v, math.pi / 180))
+# Funciones escalonadas: derivada nula casi en todas partes
+ceil = _unaria(math.ceil, np.ceil, np.zeros_like)
+floor = _unaria(math.floor, np.floor, np.zeros_like)
+
+
+def maximum(a, b):
+    """Máximo elemento a elemento para números, arreglos o duales; la derivada es la del mayor"""
+    if not isinstance(a, Dual) and not isinstance(b, Dual):
+        return np.maximum(a, b)
+    n = (a if isinstance(a, Dual) else b).derivadas.shape[-1]
+    a, b = (x if isinstance(x, Dual) else Dual(x, np.zeros(np.shape(x) + (n,))) for x in (a, b))
+    mayor = a.valor >= b.valor
+    if np.ndim(mayor) == 0:
+        return a if mayor else b
+    return Dual(np.where(mayor, a.valor, b.valor), np.where(mayor[..., None], a.derivadas, b.derivadas))
+
+
+def _es_variable(valor):
+    return isinstance(valor, (int, float, np.integer, np.floating)) and not isinstance(valor, (bool, np.bool_))
+
+
+def _nombres_entradas(entradas, prefijo=''):
+    """Nombres de las entradas numéricas, con 'dict.clave' para los diccionarios anidados"""
+    nombres = []
+    for clave, valor in entradas.items():
+        if isinstance(valor, dict):
+            nombres.extend(_nombres_entradas(valor, f"{prefijo}{clave}."))
+        elif _es_variable(valor):
+            nombres.append(f"{prefijo}{clave}")
+    return nombres
+
+
+def _sembrar(entradas, indice, n, prefijo=''):
+    """Copia de las entradas con cada variable convertida en dual con derivada unitaria"""
+    sembradas = {}
+    for clave, valor in entradas.items():
+        nombre = f"{prefijo}{clave}"
+        if isinstance(valor, dict):
+            sembradas[clave] = _sembrar(valor, indice, n, f"{nombre}.")
+        elif nombre in indice:
+            semilla = np.zeros(n)
+            semilla[indice[nombre]] = 1.0
+            sembradas[clave] = Dual(float(valor), semilla)
+        else:
+            sembradas[clave] = valor
+    return sembradas
+
+
+def _separar(salida, nombres):
+    """Valores y derivadas (por nombre de entrada) de una salida o de un diccionario de salidas"""
+    if isinstance(salida, dict):
+        partes = {clave: _separar(valor, nombres) for clave, valor in salida.items()}
+        return ({clave: parte[0] for clave, parte in partes.items()},
+                {clave: parte[1] for clave, parte in partes.items() if parte[1] is not None})
+    if isinstance(salida, Dual):
+        return salida.valor, dict(zip(nombres, np.moveaxis(salida.derivadas, -1, 0)))
+    return salida, None
+
+
+def derivar(funcion, respecto_a=None, **entradas):
+    """
+    Evalúa funcion(**entradas) una sola vez con duales y devuelve valores y jacobiano
+
+    Las entradas numéricas (también dentro de diccionarios, como 'datos_entrada.h1') son
+    variables; respecto_a limita la lista. Retorna {'valores', 'derivadas', 'entradas'} con
+    derivadas[salida][entrada] para cada salida que depende de alguna variable
+    """
+    nombres = _nombres_entradas(entradas)
+    if respecto_a is not None:
+        nombres = [nombre for nombre in nombres if nombre in set(respecto_a)]
+    indice = {nombre: i for i, nombre in enumerate(nombres)}
+    valores, derivadas = _separar(funcion(**_sembrar(entradas, indice, len(nombres))), nombres)
+    return {'valores': valores, 'derivadas': derivadas, 'entradas': nombres}
+
+
+def sensibilidades(funcion, salida, respecto_a=None, **entradas):
+    """
+    Derivadas y elasticidades (cambio % de la salida por 1 % de cada entrada) de una salida
+    Útil para ordenar qué datos gobiernan un resultado
+    """
+    resultado = derivar(funcion, respecto_a, **entradas)
+    valor = resultado['valores'][salida] if isinstance(resultado['valores'], dict) else resultado['valores']
+    derivadas = resultado['derivadas'][salida] if isinstance(resultado['valores'], dict) else resultado['derivadas']
+
+    def entrada(nombre):
+        contenedor = entradas
+        *rutas, clave = nombre.split('.')
+        for ruta in rutas:
+            contenedor = contenedor[ruta]
+        return contenedor[clave]
+
+    elasticidades = {nombre: d * entrada(nombre) / valor if valor != 0 else np.nan
+                     for nombre, d in derivadas.items()}
+    return {'valor': valor, 'derivadas': derivadas, 'elasticidades': elasticidades}
+
+
+def minimizar(funcion, inicial, limites=None, max_iteraciones=200, tolerancia=1e-10, **fijos):
+    """
+    Minimiza funcion(**variables, **fijos) con gradiente proyectado en una caja de límites
+
+    inicial: {variable: valor}; limites: {variable: (mínimo, máximo)}
+    Cada evaluación entrega a la vez el valor y el gradiente exacto; las variables se escalan
+    por su valor inicial, el paso es de Barzilai-Borwein con retroceso de Armijo
+    """
+    nombres = list(inicial)
+    limites = limites or {}
+    inferior = np.array([limites.get(nombre, (-np.inf, np.inf))[0] for nombre in nombres], dtype=float)
+    superior = np.array([limites.get(nombre, (-np.inf, np.inf))[1] for nombre in nombres], dtype=float)
+    x = np.clip(np.array([inicial[nombre] for nombre in nombres], dtype=float), inferior, superior)
+    escala = np.where(np.abs(x) > 0, np.abs(x), 1.0)
+    identidad = np.eye(len(nombres))
+
+    def evaluar(z):
+        """Objetivo y gradiente respecto de las variables escaladas z = x / escala"""
+        variables = {nombre: Dual(valor, identidad[i]) for i, (nombre, valor) in enumerate(zip(nombres, z * escala))}
+        objetivo = funcion(**variables, **fijos)
+        if not isinstance(objetivo, Dual):
+            return float(objetivo), np.zeros(len(nombres))
+        return float(objetivo.valor), objetivo.derivadas * escala
+
+    z, z_min, z_max = x / escala, inferior / escala, superior / escala
+    f, g = evaluar(z)
+    # Primer paso: mover a lo sumo una vez la escala; luego pasos de Barzilai-Borwein
+    alfa = 1 / max(np.abs(g).max(), 1e-300)
+    iteraciones = 0
+    for iteraciones in range(1, max_iteraciones + 1):
+        while True:
+            z_nuevo = np.clip(z - alfa * g, z_min, z_max)
+            f_nuevo, g_nuevo = evaluar(z_nuevo)
+            if f_nuevo <= f + 1e-4 * g @ (z_nuevo - z) or alfa * np.abs(g).max() < 1e-14:
+                break
+            alfa /= 2
+        if f_nuevo > f:
+            break
+        s, y = z_nuevo - z, g_nuevo - g
+        convergido = abs(f - f_nuevo) <= tolerancia * max(abs(f), 1.0) or np.abs(s).max() <= 1e-12
+        z, f, g = z_nuevo, f_nuevo, g_nuevo
+        if convergido:
+            break
+        alfa = s @ s / (s @ y) if s @ y > 0 else 1 / max(np.abs(g).max(), 1e-300)
+    return {'x': dict(zip(nombres, z * escala)), 'objetivo': f, 'gradiente': dict(zip(nombres, g / escala)),
+            'iteraciones': iteraciones}
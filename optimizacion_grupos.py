@@ -0,0 +1,353 @@
+"""
+Optimización de Grupos de Elementos - CONSORCIO DEJ
+Asignación de secciones de vigas y columnas por tramos de pisos con costo mínimo
+(concreto + acero), sujeta a resistencia (E.060) y deriva (E.030) con el análisis
+del pórtico; cada lote de movimientos candidatos se reanaliza refactorizando solo
+los valores numéricos de una factorización por bloques cuya estructura se arma una vez
+Unidades: kg, cm (momentos en kg·cm), cargas en vigas en kg/m, precios en S/ por m³ y por kg
+"""
+
+import numpy as np
+
+from diagrama_interaccion import (calcular_diagrama_interaccion, crear_seccion_rectangular,
+                                  distribucion_perimetral, razon_demanda_capacidad)
+from diseno_estribos import PHI_CORTANTE
+from flexion_vectorizada import calcular_cuantias
+from modelo_portico import (COLUMNA, VIGA, actualizar_secciones, cargas_gravedad, cargas_laterales,
+                            rigidez_local, transformacion)
+from optimizacion_secciones import PESO_ACERO, costo_por_metro
+
+# Deriva inelástica máxima de concreto armado (E.030 Tabla N° 11)
+DERIVA_MAXIMA = 0.007
+
+# Cuantías de columnas evaluadas, de menor a mayor (E.060 21.6.3: 1% a 6%)
+CUANTIAS_COLUMNA = (0.01, 0.015, 0.02, 0.025, 0.03, 0.04)
+
+# Factores [muerta, viva, sismo] de las combinaciones de diseño (E.060 9.2)
+COMBINACIONES = np.array([
+    [1.40, 1.70, 0.0],
+    [1.25, 1.25, 1.0],
+    [1.25, 1.25, -1.0],
+    [0.90, 0.0, 1.0],
+    [0.90, 0.0, -1.0],
+])
+
+
+def _catalogo(b_valores, h_valores, relacion_min=0.0):
+    """Pares (b, h) ordenados por área; a igual área primero el más peraltado"""
+    B, H = np.meshgrid(np.asarray(b_valores, dtype=float), np.asarray(h_valores, dtype=float), indexing='ij')
+    B, H = B.ravel(), H.ravel()
+    valido = B >= relacion_min * H
+    B, H = B[valido], H[valido]
+    orden = np.lexsort((-H, B * H))
+    return np.column_stack([B[orden], H[orden]])
+
+
+def _tramos_pisos(num_pisos, tramos):
+    """Tramo (grupo de pisos) de cada piso: tramos es pisos por tramo o la lista de pisos de cada tramo"""
+    if np.ndim(tramos) == 0:
+        return np.arange(num_pisos) // int(tramos)
+    tramo = np.repeat(np.arange(len(tramos)), np.asarray(tramos, dtype=int))
+    if len(tramo) != num_pisos:
+        raise ValueError("Los tramos deben sumar el número de pisos")
+    return tramo
+
+
+def preparar_modelo(portico, tramos, w_muerta, w_viva, fuerzas_sismo):
+    """
+    Parte simbólica del reanálisis, calculada una sola vez por pórtico
+
+    Los GDL libres numerados por pisos dan una rigidez tridiagonal por bloques (un bloque
+    por piso). Como la rigidez de cada elemento es A·ka + I·ki, se ensamblan por grupo
+    (tipo × tramo) las contribuciones unitarias de A e I directamente en los bloques;
+    cada configuración se arma luego con una combinación lineal de esos bloques
+    """
+    n_pisos = portico['num_pisos']
+    tipo, piso = portico['tipo'], portico['piso']
+    tramo_piso = _tramos_pisos(n_pisos, tramos)
+    n_tramos = tramo_piso.max() + 1
+    grupo = tipo * n_tramos + tramo_piso[piso - 1]
+    n_grupos = 2 * n_tramos
+
+    # 1. Matrices unitarias por elemento en coordenadas globales
+    E, L = portico['E'], portico['L']
+    T = transformacion(portico['cos'], portico['sin'])
+    ka = rigidez_local(E, 1.0, 0.0, L)
+    ki = rigidez_local(E, 0.0, 1.0, L)
+    unitarias = np.stack([np.einsum('eji,ejk,ekl->eil', T, k, T) for k in (ka, ki)], axis=1)
+
+    # 2. Ubicación de cada término del patrón de ensamblaje en los bloques por piso
+    m = 3 * (portico['num_vanos'] + 1)
+    gdl = portico['gdl_red']
+    filas = np.repeat(gdl[:, :, None], 6, axis=2)
+    cols = np.repeat(gdl[:, None, :], 6, axis=1)
+    bf, bc = filas // m, cols // m
+    valido = (filas >= 0) & (cols >= 0)
+    diagonal = valido & (bf == bc)
+    inferior = valido & (bf == bc + 1)
+    e_idx = np.broadcast_to(np.arange(len(tipo))[:, None, None], filas.shape)
+
+    bloques = {}
+    for nombre, mascara, bloque in (('D', diagonal, bf), ('S', inferior, bc)):
+        destino = ((grupo[e_idx[mascara]] * n_pisos + bloque[mascara]) * m + filas[mascara] % m) * m + cols[mascara] % m
+        bloques[nombre] = np.stack([
+            np.bincount(destino, unitarias[:, q][mascara], minlength=n_grupos * n_pisos * m * m)
+            .reshape(n_grupos, n_pisos, m, m) for q in range(2)
+        ], axis=1)
+
+    # 3. Estados de carga básicos: muerta, viva y sismo (no dependen de las secciones)
+    F_D, f_D = cargas_gravedad(portico, w_muerta)
+    F_L, f_L = cargas_gravedad(portico, w_viva)
+    F_S = cargas_laterales(portico, fuerzas_sismo)
+    w = np.stack([np.where(tipo == VIGA, np.broadcast_to(np.asarray(v, dtype=float), tipo.shape), 0.0) / 100
+                  for v in (w_muerta, w_viva, 0.0)])
+
+    return {
+        'portico': portico,
+        'n_tramos': n_tramos,
+        'tramo_piso': tramo_piso,
+        'grupo': grupo,
+        'm': m,
+        'D': bloques['D'],
+        'S': bloques['S'],
+        'F': np.stack([F_D, F_L, F_S], axis=-1).reshape(n_pisos, m, 3),
+        'f_empotramiento': np.stack([f_D, f_L, np.zeros_like(f_D)]),
+        'w': w,
+        'T': T,
+        'ka': ka,
+        'ki': ki,
+    }
+
+
+def _resolver_lote(modelo, A, I):
+    """
+    Refactorización numérica y solución de los estados de carga para un lote de configuraciones
+
+    A, I: área e inercia por grupo, forma (n_config, n_grupos)
+    Retorna los desplazamientos reducidos (n_config, n, 3)
+    """
+    propiedades = np.stack([A, I], axis=-1)
+    D = np.einsum('cgq,gqpij->cpij', propiedades, modelo['D'])
+    S = np.einsum('cgq,gqpij->cpij', propiedades, modelo['S'])
+    F = modelo['F']
+    n_config, n_pisos = D.shape[:2]
+
+    # Cholesky por bloques en lote: L_p·L_pᵀ = D_p - W_p·W_pᵀ, W_p = S_(p-1)·L_(p-1)⁻ᵀ
+    L = np.empty_like(D)
+    W = np.zeros_like(S)
+    for p in range(n_pisos):
+        L[:, p] = np.linalg.cholesky(D[:, p] - W[:, p - 1] @ np.swapaxes(W[:, p - 1], 1, 2) if p > 0 else D[:, p])
+        if p < n_pisos - 1:
+            W[:, p] = np.swapaxes(np.linalg.solve(L[:, p], np.swapaxes(S[:, p], 1, 2)), 1, 2)
+    y = np.empty((n_config, n_pisos) + F.shape[1:])
+    for p in range(n_pisos):
+        y[:, p] = np.linalg.solve(L[:, p], F[p] - (W[:, p - 1] @ y[:, p - 1] if p > 0 else 0))
+    x = np.empty_like(y)
+    for p in range(n_pisos - 1, -1, -1):
+        x[:, p] = np.linalg.solve(np.swapaxes(L[:, p], 1, 2),
+                                  y[:, p] - (np.swapaxes(W[:, p], 1, 2) @ x[:, p + 1] if p < n_pisos - 1 else 0))
+    return x.reshape(n_config, -1, 3)
+
+
+def _fuerzas_lote(modelo, u, A_el, I_el):
+    """Fuerzas de extremo en ejes locales por estado de carga, forma (n_config, 3, n_el, 6)"""
+    portico = modelo['portico']
+    u = np.concatenate([u, np.zeros((u.shape[0], 1, 3))], axis=1)
+    u_elem = u[:, portico['gdl_red'], :]          # Los GDL restringidos (-1) toman la fila de ceros
+    u_local = np.einsum('eij,cejr->crei', modelo['T'], u_elem)
+    f = (A_el[:, None, :, None] * np.einsum('eij,crej->crei', modelo['ka'], u_local)
+         + I_el[:, None, :, None] * np.einsum('eij,crej->crei', modelo['ki'], u_local))
+    return f + modelo['f_empotramiento'][None]
+
+
+def _diagramas_columna(b, h, fc, fy, recubrimiento):
+    """Diagramas de diseño (en caché) de una sección de columna con cada cuantía, 12 barras perimetrales"""
+    diagramas = []
+    for rho in CUANTIAS_COLUMNA:
+        x, y, As = distribucion_perimetral(b, h, 4, 4, rho * b * h / 12, recubrimiento)
+        diagrama = calcular_diagrama_interaccion(crear_seccion_rectangular(b, h, x, y, As), fc, fy)
+        diagramas.append((diagrama['phiMn'], diagrama['phiPn']))
+    return diagramas
+
+
+def evaluar_configuraciones(modelo, indices, catalogo_vigas, catalogo_columnas, fc, fy, precio_concreto,
+                            precio_acero, R=8.0, factor_deriva=0.75, deriva_maxima=DERIVA_MAXIMA,
+                            recubrimiento=6.0, Av_estribo=1.42):
+    """
+    Costo y verificaciones de un lote de configuraciones
+
+    indices: (n_config, 2·n_tramos) índices de catálogo, primero columnas y luego vigas por tramo
+    La deriva inelástica es factor_deriva·R por la deriva elástica del estado de sismo
+    Retorna arreglos por configuración (costo, cumple, deriva) y por elemento (cuantías, acero)
+    """
+    portico = modelo['portico']
+    indices = np.atleast_2d(np.asarray(indices, dtype=int))
+    n_config = len(indices)
+    n_tramos = modelo['n_tramos']
+    tipo, L = portico['tipo'], portico['L']
+    es_col = tipo == COLUMNA
+
+    # 1. Secciones por grupo y por elemento
+    secciones = np.where((np.arange(2 * n_tramos) < n_tramos)[None, :, None],
+                         catalogo_columnas[np.minimum(indices, len(catalogo_columnas) - 1)],
+                         catalogo_vigas[np.minimum(indices, len(catalogo_vigas) - 1)])
+    b_g, h_g = secciones[..., 0], secciones[..., 1]
+    b, h = b_g[:, modelo['grupo']], h_g[:, modelo['grupo']]
+
+    # 2. Reanálisis y fuerzas de las combinaciones de diseño
+    u = _resolver_lote(modelo, b_g * h_g, b_g * h_g**3 / 12)
+    f = np.einsum('kr,crei->ckei', COMBINACIONES, _fuerzas_lote(modelo, u, b * h, b * h**3 / 12))
+
+    # 3. Deriva inelástica por piso con el estado de sismo
+    m = modelo['m']
+    desplazamiento = u[:, :, 2].reshape(n_config, -1, m)[:, :, 0::3].mean(axis=2)
+    h_piso = np.diff(np.unique(portico['coords'][:, 1]))
+    deriva = factor_deriva * R * np.abs(np.diff(desplazamiento, axis=1, prepend=0.0)) / h_piso
+    cumple_deriva = (deriva <= deriva_maxima).all(axis=1)
+
+    # 4. Vigas: momentos en caras y a medio vano, cortante y costo con el diseño de secciones
+    vigas = ~es_col
+    fv = f[:, :, vigas]
+    wv = np.einsum('kr,re->ke', COMBINACIONES, modelo['w'][:, vigas])
+    Lv = L[vigas]
+    M_i, M_j = -fv[..., 2], fv[..., 5]
+    M_centro = -fv[..., 2] + fv[..., 1] * Lv / 2 - wv * Lv**2 / 8
+    Mu_neg = np.maximum(-np.minimum(M_i, M_j), 0).max(axis=1)
+    Mu_pos = np.maximum(np.maximum(np.maximum(M_i, M_j), M_centro), 0).max(axis=1)
+    Vu = np.maximum(np.abs(fv[..., 1]), np.abs(fv[..., 4])).max(axis=1)
+    bv, hv = b[:, vigas], h[:, vigas]
+    d = hv - recubrimiento
+    rho_max = calcular_cuantias(fc, fy)['rho_max']
+    Ru_max = 0.9 * rho_max * fy * (1 - 0.59 * rho_max * fy / fc)
+    cumple_vigas = ((np.maximum(Mu_pos, Mu_neg) <= Ru_max * bv * d**2)
+                    & (Vu <= PHI_CORTANTE * (0.53 + 2.1) * np.sqrt(fc) * bv * d)).all(axis=1)
+    with np.errstate(invalid='ignore'):
+        costo_metro, As_pos, As_neg, _ = costo_por_metro(bv, hv, Mu_pos, Mu_neg, Vu, fc, fy, precio_concreto,
+                                                         precio_acero, recubrimiento, Av_estribo)
+    costo_vigas = np.where(cumple_vigas[:, None], costo_metro, np.inf) * Lv / 100
+
+    # 5. Columnas: menor cuantía del catálogo que cubre todas las combinaciones de cada elemento
+    fc_col = f[:, :, es_col]
+    Pu, Mu = fc_col[..., 0], np.maximum(np.abs(fc_col[..., 2]), np.abs(fc_col[..., 5]))
+    indice_col = indices[:, modelo['grupo'][es_col]]
+    cuantia = np.full(indice_col.shape, np.nan)
+    for j in np.unique(indice_col):
+        pendientes = np.argwhere(indice_col == j)
+        b_j, h_j = catalogo_columnas[j]
+        for rho, (curva_M, curva_P) in zip(CUANTIAS_COLUMNA, _diagramas_columna(b_j, h_j, fc, fy, recubrimiento)):
+            c, e = pendientes[:, 0], pendientes[:, 1]
+            razon = razon_demanda_capacidad(curva_M, curva_P, Mu[c, :, e].ravel(), Pu[c, :, e].ravel())
+            cumple = razon.reshape(len(c), -1).max(axis=1) <= 1.0
+            cuantia[c[cumple], e[cumple]] = rho
+            pendientes = pendientes[~cumple]
+            if len(pendientes) == 0:
+                break
+    bc, hc, Lc = b[:, es_col], h[:, es_col], L[es_col]
+    cumple_columnas = np.isfinite(cuantia).all(axis=1)
+    costo_columnas = (bc * hc * Lc / 1e6 * precio_concreto
+                      + np.nan_to_num(cuantia, nan=np.inf) * bc * hc * Lc * PESO_ACERO * precio_acero)
+
+    cumple = cumple_deriva & cumple_vigas & cumple_columnas
+    costo = np.where(cumple, costo_vigas.sum(axis=1) + costo_columnas.sum(axis=1), np.inf)
+    return {
+        'costo': costo,
+        'cumple': cumple,
+        'cumple_deriva': cumple_deriva,
+        'cumple_vigas': cumple_vigas,
+        'cumple_columnas': cumple_columnas,
+        'deriva': deriva,
+        'cuantia_columnas': cuantia,
+        'As_pos_vigas': As_pos,
+        'As_neg_vigas': As_neg,
+        'b': b,
+        'h': h,
+    }
+
+
+def _movimientos(estado, tamanos, saltos):
+    """Vecinos del estado: bajar un grupo varios pasos, o bajar uno y subir otro un paso"""
+    n = len(estado)
+    candidatos = []
+    for v in range(n):
+        for salto in saltos:
+            candidatos.append(np.where(np.arange(n) == v, estado - salto, estado))
+        for w in range(n):
+            if w != v:
+                candidatos.append(estado - (np.arange(n) == v) + (np.arange(n) == w))
+    candidatos = np.unique(np.array(candidatos), axis=0)
+    dentro = ((candidatos >= 0) & (candidatos < tamanos)).all(axis=1)
+    return candidatos[dentro]
+
+
+def optimizar_grupos(portico, tramos, w_muerta, w_viva, fuerzas_sismo, fc, fy, precio_concreto, precio_acero,
+                     catalogo_vigas=None, catalogo_columnas=None, R=8.0, factor_deriva=0.75,
+                     deriva_maxima=DERIVA_MAXIMA, recubrimiento=6.0, Av_estribo=1.42, saltos=(1, 2, 4, 8),
+                     max_iteraciones=100):
+    """
+    Secciones de vigas y columnas por tramos de pisos con el menor costo total
+
+    tramos: pisos por tramo (entero) o lista con los pisos de cada tramo, de abajo hacia arriba
+    w_muerta, w_viva: cargas de servicio en vigas (kg/m); fuerzas_sismo: fuerzas por piso (kg) del
+    análisis sísmico reducido por R
+    catalogo_vigas, catalogo_columnas: pares (b, h) en cm ordenados de menor a mayor; por defecto
+    vigas en una malla de 5 cm con b ≥ 0.3·h y columnas cuadradas de 30 a 100 cm
+    Parte de las secciones mayores y, en cada iteración, evalúa en un solo lote todos los
+    movimientos vecinos; acepta el de menor costo que cumple y se detiene en un óptimo local
+    """
+    if catalogo_vigas is None:
+        catalogo_vigas = _catalogo(np.arange(25, 45, 5), np.arange(35, 95, 5), relacion_min=0.3)
+    if catalogo_columnas is None:
+        catalogo_columnas = np.repeat(np.arange(30, 105, 5, dtype=float)[:, None], 2, axis=1)
+    catalogo_vigas = np.asarray(catalogo_vigas, dtype=float)
+    catalogo_columnas = np.asarray(catalogo_columnas, dtype=float)
+
+    # 1. Estructura del reanálisis (una sola vez)
+    modelo = preparar_modelo(portico, tramos, w_muerta, w_viva, fuerzas_sismo)
+    n_tramos = modelo['n_tramos']
+    tamanos = np.repeat([len(catalogo_columnas), len(catalogo_vigas)], n_tramos)
+
+    def evaluar(indices):
+        return evaluar_configuraciones(modelo, indices, catalogo_vigas, catalogo_columnas, fc, fy,
+                                       precio_concreto, precio_acero, R, factor_deriva, deriva_maxima,
+                                       recubrimiento, Av_estribo)
+
+    # 2. Punto de partida: las secciones mayores del catálogo
+    estado = tamanos - 1
+    actual = evaluar(estado)
+    historial = [actual['costo'][0]]
+    evaluadas = 1
+
+    # 3. Descenso por lotes de movimientos
+    iteraciones = 0
+    while actual['cumple'][0] and iteraciones < max_iteraciones:
+        candidatos = _movimientos(estado, tamanos, saltos)
+        lote = evaluar(candidatos)
+        evaluadas += len(candidatos)
+        mejor = np.argmin(lote['costo'])
+        if not lote['costo'][mejor] < actual['costo'][0] * (1 - 1e-9):
+            break
+        estado = candidatos[mejor]
+        actual = evaluar(estado)
+        historial.append(actual['costo'][0])
+        iteraciones += 1
+
+    columnas = catalogo_columnas[estado[:n_tramos]]
+    vigas = catalogo_vigas[estado[n_tramos:]]
+    return {
+        'b_columnas': columnas[:, 0],
+        'h_columnas': columnas[:, 1],
+        'b_vigas': vigas[:, 0],
+        'h_vigas': vigas[:, 1],
+        'tramo_piso': modelo['tramo_piso'],
+        'indices': estado,
+        'costo': actual['costo'][0],
+        'cumple': bool(actual['cumple'][0]),
+        'deriva': actual['deriva'][0],
+        'cuantia_columnas': actual['cuantia_columnas'][0],
+        'As_pos_vigas': actual['As_pos_vigas'][0],
+        'As_neg_vigas': actual['As_neg_vigas'][0],
+        'historial_costo': np.array(historial),
+        'iteraciones': iteraciones,
+        'configuraciones_evaluadas': evaluadas,
+        'portico': actualizar_secciones(portico, actual['b'][0], actual['h'][0]),
+    }
@@ -0,0 +1,92 @@
+"""
+Optimización de Proporciones de Muros de Contención - CONSORCIO DEJ
+Búsqueda en una malla densa (Bz, hz, b, r) del muro en voladizo de menor volumen de
+concreto que cumple volcamiento, deslizamiento, presión admisible, excentricidad
+y peralte del fuste, con las verificaciones vectorizadas de muro_contencion
+Unidades: t, m (volumen en m³ por metro de muro)
+"""
+
+import numpy as np
+
+from muro_contencion import FS_DESLIZAMIENTO_MIN, analizar_muro, calcular_diseno_fuste, dimensionar_muro
+
+
+def _malla(inicio, fin, paso=0.05):
+    """Valores múltiplos de paso entre inicio y fin"""
+    return np.round(np.arange(np.ceil(inicio / paso - 1e-9), np.floor(fin / paso + 1e-9) + 1) * paso, 4)
+
+
+def optimizar_muro(h1, Df, hm, gamma_relleno, phi_relleno, gamma_cimentacion, phi_cimentacion, cohesion, qsc,
+                   fc=210, fy=4200, sigma_adm=2.5, gamma_concreto=2400, Bz_valores=None, hz_valores=None,
+                   b_valores=None, r_valores=None, tamano_bloque=200000):
+    """
+    Proporciones de menor volumen de concreto (b·h1 + Bz·hz) que cumplen todas las verificaciones
+
+    Bz_valores, hz_valores, b_valores, r_valores: mallas en m; por defecto pasos de 5 cm con
+    hz ≥ 0.40 m y b ≥ 0.25 m, hasta 1.5 veces el predimensionamiento empírico; el talón es t = Bz - r - b
+    Las podas usan condiciones necesarias baratas sobre toda la malla (talón no negativo,
+    peralte del fuste, deslizamiento); los sobrevivientes se verifican por bloques en orden
+    de volumen creciente y la búsqueda termina en el primer bloque con un diseño que cumple
+    """
+    H = h1 + Df
+    empirico = dimensionar_muro(h1, Df, hm, gamma_relleno, phi_relleno, qsc)
+    if Bz_valores is None:
+        Bz_valores = _malla(0.30 * H, 1.20 * H)
+    if hz_valores is None:
+        hz_valores = _malla(0.40, max(1.0, 1.5 * float(empirico['hz'][0])))
+    if b_valores is None:
+        b_valores = _malla(0.25, max(0.60, 1.5 * float(empirico['b'][0])))
+    if r_valores is None:
+        r_valores = _malla(0.0, 0.6 * H)
+    Bz, hz, b, r = np.meshgrid(*(np.asarray(v, dtype=float) for v in (Bz_valores, hz_valores, b_valores,
+                                                                        r_valores)), indexing='ij', sparse=True)
+    candidatos_malla = Bz.size * hz.size * b.size * r.size
+
+    # 1. Talón no negativo
+    t = Bz - r - b
+    posible = np.broadcast_to(t >= 0, (Bz.size, hz.size, b.size, r.size))
+
+    # 2. Peralte del fuste: solo depende de hz (dreal) y de b (dreq)
+    ka = empirico['ka'][0]
+    datos = {'h1': h1, 'gamma_relleno': gamma_relleno, 'phi_relleno': phi_relleno, 'cohesion': cohesion, 'Df': Df,
+             'fc': fc, 'fy': fy, 'gamma_concreto': gamma_concreto, 'qsc': qsc}
+    # Bz, r y t no intervienen en dreq ni dreal; se pasan solo para completar el cálculo
+    fuste = calcular_diseno_fuste({'ka': ka, 'b': b[0, 0], 'hz': hz[0], 'Bz': 1.0, 'r': 0.0, 't': 0.0}, datos)
+    posible = posible & (fuste['dreal'] >= fuste['dreq'])[None]
+
+    # 3. Deslizamiento: depende solo del peso total, que crece con cada dimensión
+    Ea_total = ka * (gamma_relleno / 1000) * h1**2 / 2 + ka * (qsc / 1000) * h1
+    kp = np.tan(np.radians(45 + phi_cimentacion / 2))**2
+    Ep = 0.5 * kp * (gamma_cimentacion / 1000) * Df**2
+    W_total = (b * h1 + Bz * hz) * (gamma_concreto / 1000) + np.maximum(t, 0) * h1 * (gamma_relleno / 1000)
+    posible = posible & (np.tan(np.radians(phi_cimentacion)) * W_total + Ep >= FS_DESLIZAMIENTO_MIN * Ea_total)
+
+    # 4. Sobrevivientes ordenados por volumen y verificados por bloques
+    iBz, ihz, ib, ir = np.nonzero(posible)
+    Bz_c, hz_c, b_c, r_c = Bz.ravel()[iBz], hz.ravel()[ihz], b.ravel()[ib], r.ravel()[ir]
+    volumen = b_c * h1 + Bz_c * hz_c
+    orden = np.argsort(volumen, kind='stable')
+    evaluados = 0
+    mejor = None
+    for inicio in range(0, len(orden), tamano_bloque):
+        k = orden[inicio:inicio + tamano_bloque]
+        r_bloque = analizar_muro(h1, Df, hm, gamma_relleno, phi_relleno, gamma_cimentacion, phi_cimentacion,
+                                 cohesion, qsc, fc, fy, sigma_adm, gamma_concreto, Bz=Bz_c[k], hz=hz_c[k], b=b_c[k],
+                                 r=r_c[k], t=Bz_c[k] - r_c[k] - b_c[k])
+        evaluados += len(k)
+        cumple = np.flatnonzero(r_bloque['cumple'])
+        if len(cumple):
+            mejor = k[cumple[0]]
+            break
+
+    resultado = {'candidatos_malla': candidatos_malla, 'candidatos_podados': candidatos_malla - len(orden),
+                 'candidatos_evaluados': evaluados, 'cumple': bool(mejor is not None)}
+    if mejor is None:
+        return resultado
+    diseno = analizar_muro(h1, Df, hm, gamma_relleno, phi_relleno, gamma_cimentacion, phi_cimentacion, cohesion,
+                           qsc, fc, fy, sigma_adm, gamma_concreto, Bz=Bz_c[mejor], hz=hz_c[mejor], b=b_c[mejor],
+                           r=r_c[mejor], t=Bz_c[mejor] - r_c[mejor] - b_c[mejor])
+    resultado.update({clave: valor[0] for clave, valor in diseno.items() if clave != 'fuste'})
+    resultado['fuste'] = {clave: valor[0] for clave, valor in diseno['fuste'].items()}
+    resultado['volumen'] = volumen[mejor]
+    return resultado
@@ -0,0 +1,114 @@
+"""
+Optimización de Secciones de Vigas - CONSORCIO DEJ
+Búsqueda en una malla b × h (pasos de 5 cm) con verificación vectorizada de
+flexión, cortante, peralte mínimo por deflexiones y dimensiones mínimas (E.060)
+Unidades: kg, cm (Mu en kg·cm), L en m, precios en S/ por m³ y por kg
+"""
+
+import numpy as np
+
+from diseno_estribos import PHI_CORTANTE
+from flexion_vectorizada import calcular_cuantias, calcular_rho_requerido
+
+PESO_ACERO = 7850e-6   # kg/cm³
+
+# Peralte mínimo sin cálculo de deflexiones (E.060 Tabla 9.1)
+PERALTE_MINIMO = {
+    'simplemente_apoyada': 16.0,
+    'un_extremo_continuo': 18.5,
+    'ambos_continuos': 21.0,
+    'voladizo': 8.0,
+}
+
+
+def costo_por_metro(b, h, Mu_pos, Mu_neg, Vu, fc, fy, precio_concreto, precio_acero, recubrimiento, Av_estribo):
+    """Costo por metro de viga: concreto + acero longitudinal superior e inferior + estribos"""
+    d = h - recubrimiento
+    rho_min = calcular_cuantias(fc, fy)['rho_min']
+    As_pos = np.maximum(calcular_rho_requerido(fc, fy, b, d, Mu_pos)[0], rho_min) * b * d
+    As_neg = np.maximum(calcular_rho_requerido(fc, fy, b, d, Mu_neg)[0], rho_min) * b * d
+
+    Vc = 0.53 * np.sqrt(fc) * b * d
+    Vs = np.maximum(Vu / PHI_CORTANTE - Vc, 0.0)
+    Av_s = np.maximum(Vs / (fy * d), 3.5 * b / fy)
+    s = np.clip(Av_estribo / Av_s, 5.0, np.minimum(d / 2, 60))
+    perimetro_estribo = 2 * (b + h - 4 * recubrimiento) + 20
+
+    volumen_acero = (As_pos + As_neg) * 100 + Av_estribo / 2 * perimetro_estribo * 100 / s
+    costo = b * h / 1e4 * precio_concreto + volumen_acero * PESO_ACERO * precio_acero
+    return costo, As_pos, As_neg, s
+
+
+def optimizar_seccion_viga(Mu_pos, Mu_neg, Vu, L, fc, fy, precio_concreto, precio_acero,
+                           b_min=25, b_max=60, h_min=30, h_max=120, paso=5,
+                           condicion_apoyo='ambos_continuos', recubrimiento=6.0, Av_estribo=1.42):
+    """
+    Sección de menor costo por metro para uno o varios grupos de vigas
+
+    Mu_pos, Mu_neg: Momentos últimos positivo y negativo (kg·cm, magnitudes)
+    Vu: Cortante último (kg); L: luz (m) - un valor por grupo
+    precio_concreto: S/ por m³; precio_acero: S/ por kg
+    Las restricciones se evalúan sobre toda la malla y todos los grupos a la vez;
+    los tamaños dominados se descartan antes de calcular el costo completo
+    """
+    Mu_pos, Mu_neg, Vu, L = np.broadcast_arrays(*(np.atleast_1d(np.asarray(v, dtype=float))
+                                                  for v in (Mu_pos, Mu_neg, Vu, L)))
+    n_grupos = Mu_pos.shape[0]
+    b_valores = np.arange(b_min, b_max + paso / 2, paso, dtype=float)
+    h_valores = np.arange(h_min, h_max + paso / 2, paso, dtype=float)
+    B, H = np.meshgrid(b_valores, h_valores, indexing='ij')
+    B, H = B.ravel(), H.ravel()
+
+    # 1. Dimensiones mínimas (independientes de las cargas): b ≥ 25 cm, b ≥ 0.3·h
+    geometrico = (B >= 25) & (B >= 0.3 * H)
+    B, H = B[geometrico], H[geometrico]
+
+    # Ejes: grupo × candidato
+    g, k = np.meshgrid(np.arange(n_grupos), np.arange(len(B)), indexing='ij')
+    g, k = g.ravel(), k.ravel()
+    b, h = B[k], H[k]
+    d = h - recubrimiento
+
+    # 2. Peralte mínimo por deflexiones
+    cumple_deflexion = h >= L[g] * 100 / PERALTE_MINIMO[condicion_apoyo]
+
+    # 3. Flexión con acero simple: Mu ≤ Ru,max·b·d² (equivale a ρ ≤ ρmax)
+    rho_max = calcular_cuantias(fc, fy)['rho_max']
+    Ru_max = 0.9 * rho_max * fy * (1 - 0.59 * rho_max * fy / fc)
+    cumple_flexion = np.maximum(Mu_pos[g], Mu_neg[g]) <= Ru_max * b * d**2
+
+    # 4. Cortante: Vu ≤ φ·(Vc + Vs,max) = φ·(0.53 + 2.1)·√f'c·b·d
+    cumple_cortante = Vu[g] <= PHI_CORTANTE * (0.53 + 2.1) * np.sqrt(fc) * b * d
+
+    factible = cumple_deflexion & cumple_flexion & cumple_cortante
+    g, k, b, h = g[factible], k[factible], b[factible], h[factible]
+
+    # 5. Poda por cota: el costo de la sección factible con menos concreto de cada grupo
+    #    acota el óptimo; se descartan candidatos cuyo concreto ya supera esa cota
+    costo_concreto = b * h / 1e4 * precio_concreto
+    orden = np.lexsort((costo_concreto, g))
+    grupos_factibles, primero = np.unique(g[orden], return_index=True)
+    referencia = orden[primero]
+    cota = np.full(n_grupos, np.inf)
+    cota[grupos_factibles] = costo_por_metro(b[referencia], h[referencia], Mu_pos[grupos_factibles],
+                                             Mu_neg[grupos_factibles], Vu[grupos_factibles], fc, fy,
+                                             precio_concreto, precio_acero, recubrimiento, Av_estribo)[0]
+    vivo = costo_concreto <= cota[g]
+    g, k, b, h = g[vivo], k[vivo], b[vivo], h[vivo]
+
+    # 6. Costo completo de los sobrevivientes y mínimo por grupo
+    costo, As_pos, As_neg, s = costo_por_metro(b, h, Mu_pos[g], Mu_neg[g], Vu[g], fc, fy, precio_concreto,
+                                               precio_acero, recubrimiento, Av_estribo)
+    orden = np.lexsort((costo, g))
+    grupos_factibles, primero = np.unique(g[orden], return_index=True)
+    mejor = orden[primero]
+
+    resultado = {clave: np.full(n_grupos, np.nan) for clave in ('b', 'h', 'As_pos', 'As_neg', 's_estribos',
+                                                                'costo_por_metro')}
+    for clave, valores in (('b', b), ('h', h), ('As_pos', As_pos), ('As_neg', As_neg), ('s_estribos', s),
+                           ('costo_por_metro', costo)):
+        resultado[clave][grupos_factibles] = valores[mejor]
+    resultado['cumple'] = np.isfinite(resultado['costo_por_metro'])
+    resultado['candidatos_evaluados'] = len(costo)
+    resultado['candidatos_malla'] = n_grupos * len(B)
+    return resultado
@@ -0,0 +1,137 @@
+"""
+Selección de Barras de Refuerzo - CONSORCIO DEJ
+Catálogo de barras corrugadas e índice precalculado de combinaciones factibles
+(hasta dos diámetros, una o dos capas) para elegir el As con menor exceso
+Unidades: cm, cm², kg/m
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+# Tabla de propiedades del acero corrugado (misma tabla mostrada en APP1.py)
+CATALOGO_BARRAS = {
+    'Barra N°': ['3', '4', '5', '6', '7'],
+    'Diámetro (pulg)': ['3/8', '1/2', '5/8', '3/4', '7/8'],
+    'Diámetro (cm)': [0.98, 1.27, 1.59, 1.91, 2.22],
+    'Peso (kg/m)': [0.559, 0.993, 1.552, 2.235, 3.042],
+    'Área (cm²)': [0.71, 1.27, 1.98, 2.85, 3.85],
+    'Perímetro (cm)': [2.99, 3.99, 4.99, 5.98, 6.98]
+}
+
+DIAMETROS = np.array(CATALOGO_BARRAS['Diámetro (cm)'])
+AREAS = np.array(CATALOGO_BARRAS['Área (cm²)'])
+PESOS = np.array(CATALOGO_BARRAS['Peso (kg/m)'])
+DESIGNACION = np.array(CATALOGO_BARRAS['Diámetro (pulg)'])
+
+
+def separacion_libre_minima(db, tamano_agregado=2.54):
+    """Separación libre mínima entre barras paralelas: máx(2.5 cm, db, 4/3·agregado)"""
+    return np.maximum(np.maximum(2.5, db), 4 / 3 * tamano_agregado)
+
+
+@lru_cache(maxsize=256)
+def construir_indice_combinaciones(b, recubrimiento=4.0, d_estribo=0.95, tamano_agregado=2.54,
+                                   max_capas=2, max_barras=20, max_salto=2):
+    """
+    Enumera todas las combinaciones factibles de barras para un ancho de sección b (cm)
+
+    Cada combinación tiene n1 barras del diámetro mayor y n2 (≥ 0) de otro diámetro
+    hasta max_salto números menor. Las barras mayores van primero en la capa inferior.
+    Retorna un diccionario de arreglos ordenados por As (y por número de barras y capas)
+    """
+    b_libre = b - 2 * (recubrimiento + d_estribo)
+    registros = []
+
+    for i in range(len(DIAMETROS)):
+        for j in range(max(i - max_salto, 0), i + 1):
+            d1, d2 = DIAMETROS[i], DIAMETROS[j]
+            s = separacion_libre_minima(d1, tamano_agregado)
+            n1, n2 = np.meshgrid(np.arange(2, max_barras + 1), np.arange(0, max_barras + 1) if j < i else [0],
+                                 indexing='ij')
+            n1, n2 = n1.ravel(), n2.ravel()
+
+            # 1. Barras que caben en la capa inferior (mayores primero)
+            cap1 = np.floor((b_libre + s) / (d1 + s)).astype(int)
+            m1 = np.minimum(n1, cap1)
+            holgura = b_libre - m1 * d1 - (m1 - 1) * s
+            m2 = np.where(n1 <= cap1, np.clip(np.floor(holgura / (d2 + s)).astype(int), 0, None), 0)
+            m2 = np.minimum(m2, n2)
+
+            # 2. Barras restantes en la segunda capa
+            r1, r2 = n1 - m1, n2 - m2
+            ancho2 = r1 * d1 + r2 * d2 + np.maximum(r1 + r2 - 1, 0) * s
+            capas = np.where(r1 + r2 > 0, 2, 1)
+            factible = (m1 >= 2) & (ancho2 <= b_libre) & (capas <= max_capas) & ((r1 + r2 == 0) | (r1 + r2 >= 2))
+
+            # 3. Posición del centroide sobre el eje de la capa inferior (separación vertical 2.5 cm)
+            db_capa2 = np.where(r1 > 0, d1, d2)
+            y2 = d1 / 2 + 2.5 + db_capa2 / 2
+            As = n1 * AREAS[i] + n2 * AREAS[j]
+            y_centroide = (r1 * AREAS[i] + r2 * AREAS[j]) * y2 / As
+
+            registros.append(np.column_stack([
+                As, n1, np.full(n1.shape, i), n2, np.full(n1.shape, j), capas, y_centroide,
+            ])[factible])
+
+    tabla = np.vstack(registros)
+    # Diámetros iguales con n2 = 0 se repiten entre pares; se eliminan duplicados
+    tabla[:, 4] = np.where(tabla[:, 3] == 0, tabla[:, 2], tabla[:, 4])
+    tabla = np.unique(tabla, axis=0)
+    orden = np.lexsort((tabla[:, 5], tabla[:, 1] + tabla[:, 3], tabla[:, 0]))
+    tabla = tabla[orden]
+
+    indice = {
+        'As': tabla[:, 0],
+        'n1': tabla[:, 1].astype(int),
+        'barra1': tabla[:, 2].astype(int),
+        'n2': tabla[:, 3].astype(int),
+        'barra2': tabla[:, 4].astype(int),
+        'capas': tabla[:, 5].astype(int),
+        'y_centroide': tabla[:, 6],
+    }
+    for valores in indice.values():
+        valores.setflags(write=False)
+    return indice
+
+
+def seleccionar_barras(As_requerido, b, **opciones):
+    """
+    Elige para cada As requerido (cm²) la combinación factible con menor exceso
+
+    As_requerido, b: arreglos (o escalares) con formas compatibles
+    opciones: parámetros de construir_indice_combinaciones (recubrimiento, d_estribo, ...)
+    Retorna un diccionario de arreglos; 'cumple' es False si ninguna combinación alcanza As
+    """
+    As_requerido, b = np.broadcast_arrays(np.asarray(As_requerido, dtype=float), np.asarray(b, dtype=float))
+    forma = As_requerido.shape
+    As_req = As_requerido.ravel()
+    anchos, grupo = np.unique(b.ravel(), return_inverse=True)
+
+    posicion = np.full(As_req.shape, -1)
+    resultado = {clave: np.zeros(As_req.shape, dtype=int) for clave in ('n1', 'barra1', 'n2', 'barra2', 'capas')}
+    resultado['As_proporcionado'] = np.full(As_req.shape, np.nan)
+    resultado['y_centroide'] = np.full(As_req.shape, np.nan)
+
+    # Búsqueda binaria sobre el índice de cada ancho
+    for g, ancho in enumerate(anchos):
+        indice = construir_indice_combinaciones(float(ancho), **opciones)
+        en_grupo = np.flatnonzero(grupo.ravel() == g)
+        k = np.searchsorted(indice['As'], As_req[en_grupo], side='left')
+        valido = k < len(indice['As'])
+        filas, k = en_grupo[valido], k[valido]
+        posicion[filas] = k
+        for clave in ('n1', 'barra1', 'n2', 'barra2', 'capas'):
+            resultado[clave][filas] = indice[clave][k]
+        resultado['As_proporcionado'][filas] = indice['As'][k]
+        resultado['y_centroide'][filas] = indice['y_centroide'][k]
+
+    cumple = posicion >= 0
+    resultado['cumple'] = cumple
+    resultado['exceso'] = resultado['As_proporcionado'] - As_req
+    designacion = np.char.add(DESIGNACION, '"').astype(object)
+    descripcion = resultado['n1'].astype(str).astype(object) + ' Ø ' + designacion[resultado['barra1']]
+    segunda = ' + ' + resultado['n2'].astype(str).astype(object) + ' Ø ' + designacion[resultado['barra2']]
+    descripcion = np.where(resultado['n2'] > 0, descripcion + segunda, descripcion)
+    resultado['descripcion'] = np.where(cumple, descripcion, 'NO CUMPLE')
+    return {clave: valor.reshape(forma) for clave, valor in resultado.items()}
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Script de prueba para las ayudas de diseño precalculadas (tablas Ru–ρ)
+"""
+
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+import ayudas_diseno
+from ayudas_diseno import (cargar_tablas, curva_diseno, diseno_flexion_tabla, limites_tabla,
+                           Ru_desde_rho, rho_desde_Ru)
+from flexion_vectorizada import calcular_cuantias, calcular_rho_requerido
+
+RUTA = os.path.join(tempfile.mkdtemp(), 'ayudas_diseno.npz')
+
+
+def test_carga_perezosa():
+    """Las tablas se generan una vez, se mapean en memoria y se reutilizan"""
+    tablas = cargar_tablas(RUTA)
+    assert os.path.exists(RUTA)
+    assert isinstance(tablas['Ru'], np.memmap)
+    assert cargar_tablas(RUTA) is tablas
+    ayudas_diseno.cargar_tablas.cache_clear()
+    assert np.array_equal(cargar_tablas(RUTA)['Ru'], tablas['Ru'])
+
+    # Solo se cargan los arreglos del .npz; una extracción concurrente ya terminada se respeta
+    directorio = ayudas_diseno._directorio_cache(RUTA)
+    (firma,) = [nombre for nombre in os.listdir(directorio) if not nombre.startswith('.')]
+    np.save(os.path.join(directorio, firma, 'obsoleto.npy'), np.zeros(3))
+    ayudas_diseno.cargar_tablas.cache_clear()
+    assert 'obsoleto' not in cargar_tablas(RUTA)
+    with ThreadPoolExecutor(4) as grupo:
+        destinos = set(grupo.map(lambda _: ayudas_diseno._extraer(RUTA, directorio + '_hilos', firma), range(4)))
+    assert len(destinos) == 1 and os.listdir(directorio + '_hilos') == [firma]
+
+
+def test_consultas_forma_cerrada():
+    """Ru, ρ y límites interpolados coinciden con las fórmulas cerradas"""
+    tablas = cargar_tablas(RUTA)
+    assert np.isclose(Ru_desde_rho(210, 4200, 0.01, tablas),
+                      0.9 * 0.01 * 4200 * (1 - 0.59 * 0.01 * 4200 / 210), rtol=1e-4)
+    limites = limites_tabla(280, 4200, tablas)
+    exactos = calcular_cuantias(280, 4200)
+    for clave in ('beta1', 'rho_b', 'rho_min', 'rho_max'):
+        assert np.isclose(limites[clave], exactos[clave])
+
+    rng = np.random.default_rng(0)
+    fc = rng.uniform(175, 560, 5000)
+    fy = rng.uniform(2800, 5600, 5000)
+    Mu = rng.uniform(1e5, 4e6, 5000)
+    rho = rho_desde_Ru(fc, fy, Mu / (30 * 54**2), tablas)
+    exacto, posible = calcular_rho_requerido(fc, fy, 30, 54, Mu)
+    assert np.array_equal(np.isfinite(rho), posible)
+    assert np.allclose(rho[posible], exacto[posible], rtol=5e-3)
+
+
+def test_diseno_y_curva():
+    """Diseño por tablas con cuantía mínima y curva ascendente para graficar"""
+    tablas = cargar_tablas(RUTA)
+    diseno = diseno_flexion_tabla(210, 4200, 30, 54, np.array([1e4, 20e5]), tablas)
+    assert np.isclose(diseno['rho'][0], diseno['rho_min'])
+    assert diseno['As'][1] > diseno['rho_min'] * 30 * 54
+    curva = curva_diseno(210, 4200, tablas)
+    assert np.all(np.diff(curva['Ru']) > 0)
+    assert curva['rho'][-1] > curva['rho_max']
+
+
+def main():
+    """Ejecutar todas las pruebas"""
+    print("🧪 Pruebas de ayudas de diseño")
+    test_carga_perezosa()
+    test_consultas_forma_cerrada()
+    test_diseno_y_curva()
+    print("✅ Todas las pruebas pasaron")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Script de prueba para el análisis de confiabilidad de muros de contención
+"""
+
+from statistics import NormalDist
+
+import numpy as np
+
+from confiabilidad_muro import _matriz_correlacion, _muestrear, analizar_confiabilidad
+from muro_contencion import analizar_muro
+
+DATOS = dict(h1=4.0, Df=1.2, hm=1.0, gamma_relleno=1800, phi_relleno=30, gamma_cimentacion=1700,
+             phi_cimentacion=25, cohesion=1.0, qsc=1000, fc=210, fy=4200, sigma_adm=2.5)
+
+
+def test_probabilidad_exacta():
+    """Con una sola variable normal, la probabilidad de deslizamiento coincide con la exacta"""
+    # Muro angosto para que el deslizamiento gobierne: FS decrece con la sobrecarga
+    geometria = dict(Bz=2.2, hz=0.45, b=0.35, r=0.5, t=1.35)
+    qsc = np.linspace(0, 6000, 600001)
+    FS = analizar_muro(**dict(DATOS, qsc=qsc), **geometria)['FS_deslizamiento']
+    q_critica = qsc[np.argmax(FS < 1.0)]
+    exacta = 1 - NormalDist(1000, 1000 * 0.8).cdf(q_critica)
+
+    r = analizar_confiabilidad({'qsc': ('normal', 1000, 0.8)}, 200_000, semilla=3, **DATOS, **geometria)
+    p = r['probabilidad_falla']['deslizamiento']
+    assert abs(p - exacta) < 4 * r['error_estandar']['deslizamiento']
+    assert np.isclose(r['indice_confiabilidad']['deslizamiento'], -NormalDist().inv_cdf(p))
+    assert r['fallas']['sistema'] >= r['fallas']['deslizamiento']
+
+
+def test_reproducible_en_procesos():
+    """La misma semilla da el mismo resultado en serie, por bloques distintos de procesos"""
+    variables = {'phi_relleno': ('lognormal', 30, 0.10), 'phi_cimentacion': ('lognormal', 25, 0.15),
+                 'cohesion': ('lognormal', 1.0, 0.3), 'qsc': ('normal', 1000, 0.5), 'fc': ('lognormal', 210, 0.15)}
+    correlacion = {('phi_relleno', 'phi_cimentacion'): 0.5}
+    serie = analizar_confiabilidad(variables, 60_000, correlacion, semilla=7, tamano_bloque=20_000, **DATOS)
+    paralelo = analizar_confiabilidad(variables, 60_000, correlacion, semilla=7, tamano_bloque=20_000, procesos=2,
+                                      **DATOS)
+    assert serie['fallas'] == paralelo['fallas']
+    assert serie['FS_volcamiento_medio'] == paralelo['FS_volcamiento_medio']
+    otra = analizar_confiabilidad(variables, 60_000, correlacion, semilla=8, tamano_bloque=20_000, **DATOS)
+    assert otra['FS_volcamiento_medio'] != serie['FS_volcamiento_medio']
+
+
+def test_muestreo_correlacionado():
+    """Medias, dispersión y correlación de las muestras; correlaciones inválidas se rechazan"""
+    nombres = ['phi_relleno', 'gamma_relleno']
+    distribuciones = {'phi_relleno': ('lognormal', 30, 0.1), 'gamma_relleno': ('normal', 1800, 0.05)}
+    L = _matriz_correlacion(nombres, {('phi_relleno', 'gamma_relleno'): 0.6})
+    m = _muestrear(np.random.default_rng(0), 400_000, nombres, distribuciones, L)
+    assert np.isclose(m['phi_relleno'].mean(), 30, rtol=2e-3) and np.isclose(m['phi_relleno'].std() / 30, 0.1, rtol=1e-2)
+    assert np.isclose(m['gamma_relleno'].std() / 1800, 0.05, rtol=1e-2)
+    assert np.isclose(np.corrcoef(np.log(m['phi_relleno']), m['gamma_relleno'])[0, 1], 0.6, atol=5e-3)
+    for variables, correlacion in (({'phi_relleno': ('uniforme', 30, 0.1)}, None),
+                                   ({'altura': ('normal', 3, 0.1)}, None),
+                                   ({'qsc': ('normal', 1000, 0.2), 'fc': ('normal', 210, 0.1),
+                                     'cohesion': ('normal', 1, 0.2)},
+                                    {('qsc', 'fc'): 0.9, ('qsc', 'cohesion'): 0.9, ('fc', 'cohesion'): -0.9})):
+        try:
+            analizar_confiabilidad(variables, 1000, correlacion, **DATOS)
+            assert False
+        except ValueError:
+            pass
+
+
+def main():
+    """Ejecutar todas las pruebas"""
+    print("🧪 Pruebas de confiabilidad de muros")
+    test_probabilidad_exacta()
+    test_reproducible_en_procesos()
+    test_muestreo_correlacionado()
+    print("✅ Todas las pruebas pasaron")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Script de prueba para el corte y anclaje de barras longitudinales
+"""
+
+import time
+
+import numpy as np
+
+from corte_barras import calcular_cortes, cortar_negativos, momentos_resistentes_por_barra
+
+
+def _viga_simple(L, w, n=121):
+    x = np.linspace(0, L, n)
+    return x, w * x * (L - x) / 2 * 100
+
+
+def _capacidad_en_estaciones(r, x, phiMn, L):
+    """φMn disponible en cada estación con los grupos elegidos"""
+    presentes = np.full(x.shape, float(r['n_continuas'][0]))
+    for grupo in ('grupo1', 'grupo2'):
+        dentro = (x >= r[f'{grupo}_izq'][0] - 1e-9) & (x <= r[f'{grupo}_der'][0] + 1e-9)
+        presentes += np.where(dentro, r[f'n_{grupo}'][0], 0)
+    return phiMn[0, presentes.astype(int)]
+
+
+def test_envolvente_cubierta():
+    """En cada estación las barras presentes resisten M(x); el peso baja respecto a no cortar"""
+    x, M = _viga_simple(6.0, 4000)
+    r = calcular_cortes(x, M, 210, 4200, 30, 54, 6, 2)
+    phiMn = momentos_resistentes_por_barra(210, 4200, np.array([30.0]), np.array([54.0]), np.array([6]),
+                                           np.array([2]))
+    assert r['cubre_envolvente'][0]
+    assert np.all(_capacidad_en_estaciones(r, x, phiMn, 6.0) >= M)
+    assert r['peso'][0] < r['peso_sin_cortes'][0]
+    assert r['n_continuas'][0] >= 2
+
+
+def test_extensiones():
+    """El punto real se aleja del teórico al menos máx(d, 12db) salvo en los apoyos"""
+    x, M = _viga_simple(6.0, 4000)
+    r = calcular_cortes(x, M, 210, 4200, 30, 54, 6, 2)
+    interior = (r['x_real_izq'][0] > 0) & np.isfinite(r['x_teorico_izq'][0])
+    assert np.all(r['x_teorico_izq'][0][interior] - r['x_real_izq'][0][interior] >= 0.54 - 1e-9)
+
+
+def test_negativos_y_edificio():
+    """Acero negativo en ambos apoyos y miles de vigas en una llamada"""
+    L, w = 6.0, 4000
+    x = np.linspace(0, L, 121)
+    M_neg = np.maximum(w * L**2 / 12 - w * x * (L - x) / 2, 0) * 100
+    r = cortar_negativos(x, M_neg, 210, 4200, 30, 54, 4, 2)
+    assert np.isclose(r['izquierdo']['grupo1_der'][0], L - r['derecho']['grupo1_izq'][0])
+
+    rng = np.random.default_rng(0)
+    n = 3000
+    luces = rng.uniform(4, 9, n)
+    xs = np.linspace(0, 1, 101)[None, :] * luces[:, None]
+    Ms = rng.uniform(2e3, 6e3, n)[:, None] * xs * (luces[:, None] - xs) / 2 * 100
+    inicio = time.perf_counter()
+    r = calcular_cortes(xs, Ms, 210, 4200, 30, 54, rng.integers(3, 8, n), rng.integers(1, 4, n))
+    assert time.perf_counter() - inicio < 1.0
+    assert np.all(r['peso'] <= r['peso_sin_cortes'] + 1e-9)
+
+
+def main():
+    """Ejecutar todas las pruebas"""
+    print("🧪 Pruebas de corte de barras")
+    test_envolvente_cubierta()
+    print("✅ Envolvente cubierta")
+    test_extensiones()
+    print("✅ Extensiones d y 12db")
+    test_negativos_y_edificio()
+    print("✅ Acero negativo y edificio completo")
+
+
+if __name__ == "__main__":
+    main()
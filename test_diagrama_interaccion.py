@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Script de prueba para el diagrama de interacción P-M de columnas
+"""
+
+import numpy as np
+
+from calculos_estructurales import calcular_diseno_columna
+from diagrama_interaccion import (
+    crear_seccion_rectangular,
+    crear_seccion_circular,
+    distribucion_perimetral,
+    calcular_diagrama_interaccion,
+    verificar_columna,
+)
+
+
+def _columna_40x60():
+    x, y, As = distribucion_perimetral(40, 60, 3, 4, 5.07)
+    return crear_seccion_rectangular(40, 60, x, y, As)
+
+
+def test_compresion_pura():
+    """La capacidad axial máxima de diseño coincide con calcular_diseno_columna"""
+    seccion = _columna_40x60()
+    diagrama = calcular_diagrama_interaccion(seccion, 280, 4200)
+    Ast = sum(seccion['barras_As'])
+    assert np.isclose(diagrama['phiPn_max'], calcular_diseno_columna(280, 4200, 40 * 60, Ast, 0)['phiPn'])
+    assert np.isclose(diagrama['Pnt'], -4200 * Ast)
+
+
+def test_simetria_y_phi():
+    """Sección simétrica: momentos positivos y negativos iguales; φ entre 0.65 y 0.90"""
+    diagrama = calcular_diagrama_interaccion(_columna_40x60(), 280, 4200)
+    assert np.isclose(diagrama['Mn'].max(), -diagrama['Mn'].min())
+    assert diagrama['phi'].min() >= 0.65 and diagrama['phi'].max() <= 0.90
+
+    circular = calcular_diagrama_interaccion(crear_seccion_circular(60, 8, 5.07), 280, 4200)
+    assert circular['phi'].min() >= 0.75
+
+
+def test_cache_y_verificacion():
+    """El diagrama se reutiliza por firma y la verificación clasifica los puntos"""
+    seccion = _columna_40x60()
+    assert calcular_diagrama_interaccion(seccion, 280, 4200) is calcular_diagrama_interaccion(_columna_40x60(), 280, 4200)
+    r = verificar_columna(seccion, 280, 4200, [100e3, 600e3, 0.0], [20e5, 80e5, 0.0])
+    assert r['cumple'].tolist() == [True, False, True]
+
+    rng = np.random.default_rng(2)
+    r = verificar_columna(seccion, 280, 4200, rng.uniform(-1e5, 5e5, 10000), rng.uniform(-8e6, 8e6, 10000))
+    assert r['razon'].shape == (10000,)
+
+
+def main():
+    """Ejecutar todas las pruebas"""
+    print("🧪 Pruebas del diagrama de interacción")
+    test_compresion_pura()
+    print("✅ Compresión y tracción pura")
+    test_simetria_y_phi()
+    print("✅ Simetría y factor φ")
+    test_cache_y_verificacion()
+    print("✅ Caché y verificación de cargas")
+
+
+if __name__ == "__main__":
+    main()
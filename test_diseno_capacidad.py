@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Script de prueba para columna fuerte - viga débil y cortante en nudos
+"""
+
+import numpy as np
+
+from modelo_portico import COLUMNA, VIGA, crear_portico_regular, actualizar_secciones
+from diseno_capacidad import momentos_vigas, verificar_nudos
+
+
+def _portico():
+    return crear_portico_regular(30, 6, 6.0, 3.0, 30, 60, 60, 60, 280)
+
+
+def test_suma_por_nudo():
+    """Las sumas vectorizadas coinciden con un recorrido nudo por nudo"""
+    portico = _portico()
+    Mn_col = np.where(portico['tipo'] == COLUMNA, np.linspace(8e6, 2e6, len(portico['tipo'])), 0.0)
+    r = verificar_nudos(portico, 280, 4200, 15.0, 10.0, Mn_col)
+    Mn_neg, Mn_pos = momentos_vigas(portico, 280, 4200, 15.0, 10.0)
+
+    nodos, tipo = portico['nodos'], portico['tipo']
+    for nudo in np.flatnonzero(r['aplica'])[::37]:
+        columnas = np.flatnonzero((tipo == COLUMNA) & ((nodos[:, 0] == nudo) | (nodos[:, 1] == nudo)))
+        derecha = np.flatnonzero((tipo == VIGA) & (nodos[:, 0] == nudo))
+        izquierda = np.flatnonzero((tipo == VIGA) & (nodos[:, 1] == nudo))
+        vigas = max(Mn_neg[derecha].sum() + Mn_pos[izquierda].sum(), Mn_pos[derecha].sum() + Mn_neg[izquierda].sum())
+        assert np.isclose(r['suma_columnas'][nudo], Mn_col[columnas].sum())
+        assert np.isclose(r['suma_vigas'][nudo], vigas)
+    assert r['aplica'].sum() == 29 * 7
+
+
+def test_columna_debil():
+    """Columnas con poca resistencia o vigas muy armadas no cumplen"""
+    portico = _portico()
+    Mn_col = np.where(portico['tipo'] == COLUMNA, 2e6, 0.0)
+    r = verificar_nudos(portico, 280, 4200, 25.0, 15.0, Mn_col)
+    assert not r['cumple_columna_fuerte'][r['aplica']].any()
+    r = verificar_nudos(portico, 280, 4200, 60.0, 40.0, np.where(portico['tipo'] == COLUMNA, 5e7, 0.0))
+    assert not r['cumple_cortante_nudo'][r['aplica']].all()
+
+
+def test_cambio_de_seccion():
+    """Al cambiar secciones se reutiliza la topología y cambia la resistencia del nudo"""
+    portico = _portico()
+    Mn_col = np.where(portico['tipo'] == COLUMNA, 2e7, 0.0)
+    r = verificar_nudos(portico, 280, 4200, 15.0, 10.0, Mn_col)
+    nuevo = actualizar_secciones(portico, portico['b'], portico['h'] + 10 * (portico['tipo'] == COLUMNA))
+    assert nuevo['topologia_nudos'] is portico['topologia_nudos']
+    r2 = verificar_nudos(nuevo, 280, 4200, 15.0, 10.0, Mn_col)
+    assert np.all(r2['phiVn'][r['aplica']] > r['phiVn'][r['aplica']])
+
+
+def main():
+    """Ejecutar todas las pruebas"""
+    print("🧪 Pruebas de diseño por capacidad en nudos")
+    test_suma_por_nudo()
+    print("✅ Sumas por nudo")
+    test_columna_debil()
+    print("✅ Columnas débiles y nudos sobreesforzados")
+    test_cambio_de_seccion()
+    print("✅ Cambio de sección")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Script de prueba para el diseño de estribos a lo largo de la viga
+"""
+
+import numpy as np
+
+from calculos_estructurales import calcular_diseno_cortante
+from diseno_estribos import disenar_estribos, cuadro_estribos
+
+
+def _viga_simple(L, w, n=100):
+    x = np.linspace(0, L, n)
+    return x, w * L / 2 - w * x
+
+
+def test_coincide_con_seccion_unica():
+    """En el apoyo, Vc y Vs coinciden con calcular_diseno_cortante"""
+    x, V = _viga_simple(6.0, 6000)
+    r = disenar_estribos(x, V, 210, 4200, 30, 54, 60)
+    unico = calcular_diseno_cortante(210, 4200, 30, 54, V[0])
+    assert np.isclose(r['Vc'][0, 0], unico['Vc'])
+    assert np.isclose(r['Vs_requerido'][0, 0], unico['Vs_requerido'])
+
+
+def test_zonas_practicas():
+    """Zonas simétricas, confinamiento en 2h y separación creciente hacia el centro"""
+    x, V = _viga_simple(6.0, 6000)
+    r = disenar_estribos(x, V, 210, 4200, 30, 54, 60)
+    zonas = r['zonas']
+    assert np.allclose(zonas['s'], zonas['s'][::-1])
+    assert zonas['s'][0] <= 54 / 4 and zonas['s'][len(zonas['s']) // 2] <= 54 / 2
+    assert np.all(r['s_practico'][r['zona_confinamiento']] <= 54 / 4)
+    assert np.all(r['s_practico'] <= r['s_requerido'] + 1e-9)
+    assert cuadro_estribos(r).startswith("1@5cm, ")
+    assert r['verificacion'][0]
+
+
+def test_muchas_vigas():
+    """Muchas vigas de distinta luz en una sola llamada; las sobrecargadas no cumplen"""
+    rng = np.random.default_rng(0)
+    L = rng.uniform(4, 9, 500)
+    w = rng.uniform(2e3, 8e3, 500)
+    w[0] = 1e5
+    x = np.linspace(0, 1, 101)[None, :] * L[:, None]
+    V = w[:, None] * (L[:, None] / 2 - x)
+    r = disenar_estribos(x, V, 210, 4200, 30, 54, 60)
+    assert r['s_practico'].shape == (500, 101)
+    assert not r['verificacion'][0] and r['verificacion'][1:].all()
+    assert np.all(np.bincount(r['zonas']['viga']) >= 1)
+
+
+def main():
+    """Ejecutar todas las pruebas"""
+    print("🧪 Pruebas del diseño de estribos")
+    test_coincide_con_seccion_unica()
+    print("✅ Coincide con el diseño en una sección")
+    test_zonas_practicas()
+    print("✅ Zonas de separación práctica")
+    test_muchas_vigas()
+    print("✅ Muchas vigas a la vez")
+
+
+if __name__ == "__main__":
+    main()
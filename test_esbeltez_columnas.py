@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Script de prueba para esbeltez de columnas y magnificación de momentos
+"""
+
+import numpy as np
+
+from diagrama_interaccion import crear_seccion_rectangular, distribucion_perimetral
+from modelo_portico import COLUMNA, crear_portico_regular
+from esbeltez_columnas import (
+    factor_k_arriostrado,
+    factor_k_no_arriostrado,
+    analizar_esbeltez,
+    magnificar_momentos,
+    verificar_columnas_esbeltas,
+)
+
+
+def test_nomogramas():
+    """Valores conocidos de los nomogramas de Jackson-Moreland"""
+    assert np.allclose(factor_k_arriostrado([1.0, 1e-6, 1e6], [1.0, 1e-6, 1e6]), [0.774, 0.5, 1.0], atol=2e-3)
+    assert np.allclose(factor_k_no_arriostrado([1.0, 1e-6], [1.0, 1e-6]), [1.317, 1.0], atol=2e-3)
+    k = factor_k_no_arriostrado(np.linspace(0.1, 10, 50), 2.0)
+    assert np.all(np.diff(k) > 0)
+
+
+def _portico_esbelto():
+    portico = crear_portico_regular(6, 2, 6.0, 4.0, 25, 40, 30, 30, 210)
+    n_col = np.count_nonzero(portico['tipo'] == COLUMNA)
+    Pu = np.full(n_col, 80e3)
+    fuerzas = np.array([2.0, 4.0, 6.0, 8.0, 10.0, 12.0]) * 1e3
+    return portico, Pu, fuerzas
+
+
+def test_piso_no_arriostrado():
+    """Un pórtico flexible con carga alta se clasifica no arriostrado y amplifica M_s"""
+    portico, Pu, fuerzas = _portico_esbelto()
+    esbeltez = analizar_esbeltez(portico, fuerzas, Pu)
+    assert not esbeltez['arriostrado_piso'].all()
+    assert np.all(esbeltez['k'][~esbeltez['arriostrado']] > 1.0)
+
+    m = magnificar_momentos(esbeltez, Pu, 1e5, -1e5, 4e5, 4e5)
+    no_arriostradas = ~esbeltez['arriostrado']
+    assert np.all(m['delta_s'][no_arriostradas] > 1.0)
+    assert np.all(m['Mc'] >= np.abs(m['M2']) - 1e-6)
+
+
+def test_combinaciones_y_verificacion():
+    """Combinaciones × columnas en una llamada y verificación con el diagrama P-M"""
+    portico, Pu, fuerzas = _portico_esbelto()
+    esbeltez = analizar_esbeltez(portico, fuerzas, Pu)
+    factores = np.array([0.5, 1.0, 1.5])[:, None]
+    m = magnificar_momentos(esbeltez, Pu * factores, 1e5, -1e5, 3e5 * factores, 3e5 * factores)
+    assert m['Mc'].shape == (3, len(Pu))
+    assert np.all(np.diff(m['delta_s'], axis=0) >= 0)
+
+    x, y, As = distribucion_perimetral(30, 30, 3, 3, 2.85)
+    seccion = crear_seccion_rectangular(30, 30, x, y, As)
+    r = verificar_columnas_esbeltas(esbeltez, [seccion], 0, 210, 4200, Pu * factores, m)
+    assert r['razon'].shape == (3, len(Pu))
+    assert np.all(np.diff(r['razon'], axis=0) > 0)
+
+
+def main():
+    """Ejecutar todas las pruebas"""
+    print("🧪 Pruebas de esbeltez de columnas")
+    test_nomogramas()
+    print("✅ Nomogramas de longitud efectiva")
+    test_piso_no_arriostrado()
+    print("✅ Pisos no arriostrados")
+    test_combinaciones_y_verificacion()
+    print("✅ Combinaciones y verificación")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Script de prueba para la verificación biaxial de columnas
+"""
+
+import numpy as np
+
+from diagrama_interaccion import crear_seccion_rectangular, distribucion_perimetral, crear_seccion_circular
+from flexion_biaxial import verificar_flexion_biaxial, calcular_superficie_interaccion
+
+
+def _columna_50x50():
+    x, y, As = distribucion_perimetral(50, 50, 4, 4, 5.07)
+    return crear_seccion_rectangular(50, 50, x, y, As)
+
+
+def test_uniaxial_coincide():
+    """Con Muy = 0, la superficie 3D y el contorno de carga dan la misma razón"""
+    seccion = _columna_50x50()
+    Pu = np.array([100e3, 200e3, 300e3])
+    Mux = np.array([30e5, 20e5, 10e5])
+    contorno = verificar_flexion_biaxial([seccion], 0, 280, 4200, Pu, Mux, 0.0, metodo='contorno')
+    superficie = verificar_flexion_biaxial([seccion], 0, 280, 4200, Pu, Mux, 0.0, metodo='superficie')
+    assert np.allclose(contorno['razon'], superficie['razon'], rtol=0.05)
+
+
+def test_bresler_conservador():
+    """El método de carga recíproca es más conservador que el contorno lineal a carga alta"""
+    seccion = _columna_50x50()
+    Pu, Mux, Muy = np.array([250e3]), np.array([15e5]), np.array([15e5])
+    bresler = verificar_flexion_biaxial([seccion], 0, 280, 4200, Pu, Mux, Muy, metodo='bresler')
+    superficie = verificar_flexion_biaxial([seccion], 0, 280, 4200, Pu, Mux, Muy, metodo='superficie')
+    assert bresler['razon'][0] >= superficie['razon'][0] * 0.95
+
+
+def test_todas_las_combinaciones():
+    """Combinaciones × columnas en una sola llamada con varias secciones"""
+    secciones = [_columna_50x50(), crear_seccion_circular(60, 8, 5.07)]
+    rng = np.random.default_rng(3)
+    forma = (12, 500)  # combinaciones × columnas
+    indice = np.broadcast_to(rng.integers(0, 2, forma[1]), forma)
+    Pu = rng.uniform(0, 3e5, forma)
+    Mux = rng.uniform(-2e6, 2e6, forma)
+    Muy = rng.uniform(-2e6, 2e6, forma)
+    for metodo in ('bresler', 'contorno', 'superficie'):
+        r = verificar_flexion_biaxial(secciones, indice, 280, 4200, Pu, Mux, Muy, metodo=metodo)
+        assert r['razon'].shape == forma
+    assert calcular_superficie_interaccion(secciones[0], 280, 4200) is calcular_superficie_interaccion(
+        _columna_50x50(), 280, 4200)
+
+
+def main():
+    """Ejecutar todas las pruebas"""
+    print("🧪 Pruebas de flexión biaxial")
+    test_uniaxial_coincide()
+    print("✅ Caso uniaxial")
+    test_bresler_conservador()
+    print("✅ Carga recíproca de Bresler")
+    test_todas_las_combinaciones()
+    print("✅ Todas las combinaciones de todas las columnas")
+
+
+if __name__ == "__main__":
+    main()
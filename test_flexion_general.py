@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Script de prueba para el diseño por flexión de secciones T y doblemente reforzadas
+"""
+
+import numpy as np
+
+from flexion_vectorizada import calcular_diseno_flexion_vectorizado
+from flexion_general import (
+    ancho_efectivo_ala,
+    calcular_diseno_flexion_general,
+    calcular_resistencia_flexion,
+)
+
+
+def test_rectangular_coincide():
+    """Sección rectangular con acero simple: mismo As que la solución cerrada"""
+    Mu = np.array([20e5, 35e5])
+    general = calcular_diseno_flexion_general(210, 4200, 30, 54, Mu)
+    cerrada = calcular_diseno_flexion_vectorizado(210, 4200, 30, 54, Mu)
+    assert np.allclose(general['As'], cerrada['As'])
+    assert not general['doblemente_reforzada'].any()
+
+
+def test_doblemente_reforzada():
+    """Más allá de c/d = 0.375 se agrega A's y la resistencia recalculada iguala Mu"""
+    Mu = np.array([50e5, 70e5])
+    r = calcular_diseno_flexion_general(210, 4200, 30, 54, Mu)
+    assert r['doblemente_reforzada'].all() and np.all(r['As_prima'] > 0)
+    assert np.allclose(r['c_d'], 0.375) and np.allclose(r['phi'], 0.9)
+    resistencia = calcular_resistencia_flexion(210, 4200, 30, 54, r['As'], r['As_prima'])
+    assert np.allclose(resistencia['phiMn'], Mu, rtol=1e-6)
+
+
+def test_seccion_t():
+    """La viga T necesita menos acero que la rectangular y no requiere A's"""
+    bf = ancho_efectivo_ala(30, 20, 600, 400)
+    assert np.isclose(bf, 30 + 2 * 75)
+    Mu = np.array([35e5, 50e5])
+    t = calcular_diseno_flexion_general(210, 4200, 30, 54, Mu, bf=bf, hf=20)
+    rect = calcular_diseno_flexion_general(210, 4200, 30, 54, Mu)
+    assert np.all(t['As'] < rect['As']) and not t['doblemente_reforzada'].any()
+    resistencia = calcular_resistencia_flexion(210, 4200, 30, 54, t['As'], bf=bf, hf=20)
+    assert np.allclose(resistencia['phiMn'], Mu, rtol=1e-6)
+
+    # Ala delgada: el bloque de compresión entra al alma
+    delgada = calcular_diseno_flexion_general(210, 4200, 30, 54, 60e5, bf=80, hf=5)
+    assert delgada['ala_en_compresion']
+
+
+def main():
+    """Ejecutar todas las pruebas"""
+    print("🧪 Pruebas de flexión general")
+    test_rectangular_coincide()
+    print("✅ Sección rectangular")
+    test_doblemente_reforzada()
+    print("✅ Sección doblemente reforzada")
+    test_seccion_t()
+    print("✅ Secciones T")
+
+
+if __name__ == "__main__":
+    main()
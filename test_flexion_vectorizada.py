@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Script de prueba para el diseño por flexión vectorizado
+"""
+
+import time
+import numpy as np
+
+from calculos_estructurales import calcular_diseno_flexion
+from flexion_vectorizada import calcular_diseno_flexion_vectorizado
+
+
+def test_coincide_con_funcion_escalar():
+    """Para Mu = φMn de la función escalar se recupera la misma cuantía"""
+    for fc, fy, b, d in [(210, 4200, 30, 54), (350, 4200, 40, 70), (280, 2800, 25, 44)]:
+        escalar = calcular_diseno_flexion(fc, fy, b, d, 0)
+        vector = calcular_diseno_flexion_vectorizado(fc, fy, b, d, escalar['phiMn'])
+        assert np.isclose(vector['rho'], escalar['rho'])
+        assert np.isclose(vector['beta1'], escalar['beta1'])
+        assert np.isclose(vector['rho_max'], escalar['rho_max'])
+        assert vector['verificacion']
+
+
+def test_mascaras():
+    """Momento pequeño usa cuantía mínima; momento excesivo no tiene solución"""
+    r = calcular_diseno_flexion_vectorizado(210, 4200, 30, 54, np.array([1e4, 2e6, 1e8]))
+    assert r['requiere_minimo'].tolist() == [True, False, False]
+    assert r['existe_solucion'].tolist() == [True, True, False]
+    assert r['verificacion'].tolist() == [True, True, False]
+
+
+def test_cien_mil_secciones():
+    """10⁵ secciones en una sola llamada"""
+    rng = np.random.default_rng(0)
+    n = 100_000
+    b = rng.choice([25.0, 30.0, 40.0], n)
+    d = rng.uniform(40, 80, n)
+    Mu = rng.uniform(1e5, 3e6, n)
+    inicio = time.time()
+    r = calcular_diseno_flexion_vectorizado(210, 4200, b, d, Mu)
+    duracion = time.time() - inicio
+    assert r['As'].shape == (n,)
+    assert np.all(r['phiMn'][r['verificacion']] >= Mu[r['verificacion']] * (1 - 1e-9))
+    print(f"✅ {n} secciones en {duracion * 1000:.1f} ms")
+
+
+def main():
+    """Ejecutar todas las pruebas"""
+    print("🧪 Pruebas del diseño por flexión vectorizado")
+    test_coincide_con_funcion_escalar()
+    print("✅ Coincide con calcular_diseno_flexion")
+    test_mascaras()
+    print("✅ Máscaras de verificación")
+    test_cien_mil_secciones()
+
+
+if __name__ == "__main__":
+    main()
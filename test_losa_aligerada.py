@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Script de prueba para el diseño de losas aligeradas
+"""
+
+import time
+
+import numpy as np
+
+from losa_aligerada import momentos_viga_continua, momentos_coeficientes, disenar_losa_aligerada
+
+
+def test_viga_continua_exacta():
+    """Dos tramos iguales con carga uniforme: M apoyo = wL²/8, reacción interior = 5wL/8 por lado"""
+    r = momentos_viga_continua([[5.0, 5.0]], 1000, 0, ancho_apoyo=0.0, factor_muerta=1.0, factor_viva=0.0)
+    assert np.isclose(r['M_neg'][0, 1], 1000 * 25 / 8)
+    assert np.isclose(r['V'][0, 0, 1], 5 * 1000 * 5 / 8)
+    assert np.isclose(r['M_pos'][0, 0], 9 * 1000 * 25 / 128)
+
+
+def test_coeficientes_y_alternancia():
+    """La alternancia de carga viva aumenta el momento positivo; la envolvente es simétrica"""
+    luces = [[4.5, 5.0, 4.5]]
+    sin_alternancia = momentos_viga_continua(luces, 200, 0, factor_muerta=1.0, factor_viva=0.0)
+    con_alternancia = momentos_viga_continua(luces, 100, 100, factor_muerta=1.0, factor_viva=1.0)
+    assert np.all(con_alternancia['M_pos'] > sin_alternancia['M_pos'])
+    assert np.allclose(con_alternancia['M_neg'], con_alternancia['M_neg'][:, ::-1])
+    coef = momentos_coeficientes(luces, 200)
+    assert coef['M_neg'][0, 1] > coef['M_neg'][0, 0]
+
+
+def test_losa_completa():
+    """Todas las franjas de un piso; ensanche cuando la carga es alta; peralte no comercial rechazado"""
+    r = disenar_losa_aligerada([4.5, 5.0, 4.5], [4.0, 5.0, 4.0], 100, 200, 210, 4200)
+    assert r['h'] == 20 and r['Mu_pos'].shape == (3, 3) and r['Mu_neg'].shape == (3, 4)
+    assert np.all(r['As_pos_colocado'] >= r['As_pos']) and r['verificacion'].all()
+    pesada = disenar_losa_aligerada([4.5, 5.0, 4.5], [4.0], 100, 1000, 210, 4200)
+    assert np.any(pesada['ensanche'] != 'ninguno')
+    try:
+        disenar_losa_aligerada([4.5, 5.0, 4.5], [4.0], 100, 200, 210, 4200, h=22)
+        assert False
+    except ValueError:
+        pass
+
+    inicio = time.perf_counter()
+    r = disenar_losa_aligerada(np.full(8, 5.0), np.full(400, 4.0), 100, 200, 210, 4200, metodo='viga_continua')
+    assert time.perf_counter() - inicio < 1.0
+    assert r['Mu_pos'].shape == (400, 8) and r['n_viguetas'].sum() == 4000
+
+
+def main():
+    """Ejecutar todas las pruebas"""
+    print("🧪 Pruebas de losa aligerada")
+    test_viga_continua_exacta()
+    print("✅ Viga continua de dos tramos")
+    test_coeficientes_y_alternancia()
+    print("✅ Coeficientes y alternancia de carga viva")
+    test_losa_completa()
+    print("✅ Losa completa")
+
+
+if __name__ == "__main__":
+    main()
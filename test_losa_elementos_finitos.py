@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Script de prueba para el análisis de losas por elementos finitos
+"""
+
+import numpy as np
+
+from losa_elementos_finitos import (_resolver_bloques, analizar_losa, crear_malla_losa,
+                                    verificar_punzonamiento_losa)
+
+
+def test_placa_simplemente_apoyada():
+    """Placa cuadrada apoyada en su contorno: flecha y momento de Navier (ν = 0.3)"""
+    malla = crear_malla_losa([6], [6], 20)
+    E, h, nu, q = 2.17e5, 15, 0.3, 1000
+    r = analizar_losa(malla, h, q, E=E, nu=nu, apoyo='ejes')
+    D = E * h**3 / (12 * (1 - nu**2))
+    assert np.isclose(r['w'].max(), 0.00406 * q / 1e4 * 600**4 / D, rtol=0.03)
+    assert np.isclose(np.nanmax(r['Mx']), 0.0479 * q / 1e4 * 600**2, rtol=0.03)
+    assert np.isclose(r['reacciones'].sum(), r['carga_total'])
+
+
+def test_losa_plana_y_punzonamiento():
+    """Losa sin vigas sobre columnas: equilibrio, simetría y punzonamiento por ubicación"""
+    malla = crear_malla_losa([6, 6, 6], [5, 5, 5], 8, aberturas=[(7.0, 6.0, 8.0, 7.0)])
+    r = analizar_losa(malla, 20, 1200, fc=280)
+    assert np.isclose(r['reacciones_columnas'].sum(), r['carga_total'])
+    simetrica = analizar_losa(crear_malla_losa([6, 6, 6], [5, 5, 5], 8), 20, 1200, fc=280)
+    R = simetrica['reacciones_columnas'].reshape(4, 4)
+    assert np.allclose(R, R[::-1, ::-1]) and R[1, 1] > R[0, 1] > R[0, 0]
+    p = verificar_punzonamiento_losa(malla, simetrica, 280, 16, 40, 40, 1200)
+    assert np.allclose(p['bo'].reshape(4, 4)[[0, 1, 1], [0, 0, 1]], [2 * 48, 2 * 48 + 56, 4 * 56])
+    # Columna rectangular: en los bordes y = 0 y y = máx el d/2 va en la dirección y
+    p = verificar_punzonamiento_losa(malla, simetrica, 280, 16, 60, 30, 1200)
+    bo = p['bo'].reshape(4, 4)
+    assert np.allclose(bo[[0, 3, 1, 1, 0, 1], [1, 2, 0, 3, 0, 1]],
+                       [76 + 2 * 38, 76 + 2 * 38, 2 * 68 + 46, 2 * 68 + 46, 68 + 38, 2 * (76 + 46)])
+    assert np.isnan(r['Mx']).sum() == (~malla['activo']).sum() == 2
+
+
+def test_platea_y_solver_por_bloques():
+    """Platea sobre balasto en equilibrio; el Cholesky por bloques coincide con la solución densa"""
+    malla = crear_malla_losa([6, 6], [6, 6], 6)
+    cargas = np.zeros(len(malla['coords']))
+    cargas[malla['columnas']] = 50000
+    r = analizar_losa(malla, 60, 0, apoyo='ninguno', cargas_nudos=cargas, modulo_balasto=3.0)
+    assert r['w'].max() > 0 and np.nanmin(r['Mx']) < 0
+
+    rng = np.random.default_rng(0)
+    tamanos = np.array([3, 4, 2, 4])
+    bloque = np.repeat(np.arange(4), tamanos)
+    n = len(bloque)
+    A = rng.normal(size=(n, n))
+    A = A @ A.T + n * np.eye(n)
+    A[np.abs(bloque[:, None] - bloque[None, :]) > 1] = 0.0
+    F = rng.normal(size=n)
+    filas, columnas = np.nonzero(A)
+    x = _resolver_bloques(bloque, filas, columnas, A[filas, columnas], F)
+    assert np.allclose(x, np.linalg.solve(A, F))
+
+
+def main():
+    """Ejecutar todas las pruebas"""
+    print("🧪 Pruebas de losas por elementos finitos")
+    test_placa_simplemente_apoyada()
+    test_losa_plana_y_punzonamiento()
+    test_platea_y_solver_por_bloques()
+    print("✅ Todas las pruebas pasaron")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Script de prueba para el metrado de cantidades y presupuesto
+"""
+
+import numpy as np
+
+from modelo_portico import COLUMNA, crear_portico_regular
+from metrado_cantidades import calcular_cantidades, calcular_presupuesto
+
+PRECIOS = {'concreto': 350.0, 'encofrado': 45.0, 'acero': 4.5}
+
+
+def test_portico_pequeno():
+    """Volúmenes a mano: columnas a ejes y vigas entre caras de columnas"""
+    portico = crear_portico_regular(3, 2, 6.0, 3.0, 30, 60, 40, 40, 210)
+    es_col = portico['tipo'] == COLUMNA
+    c = calcular_cantidades(portico, np.where(es_col, 8, 6), 2, np.where(es_col, 20, 35), 0)
+    assert np.isclose(c['totales']['concreto'], 9 * 0.4 * 0.4 * 3 + 6 * 0.3 * 0.6 * 5.6)
+    assert np.allclose(c['por_tipo_piso']['concreto'][COLUMNA], 1.44)
+    # Acero longitudinal: barras de 5/8" (1.552 kg/m) a lo largo de cada elemento
+    assert np.isclose(c['totales']['acero_longitudinal'], (9 * 8 * 3 + 6 * 6 * 6) * 1.552)
+
+
+def test_presupuesto():
+    """El presupuesto por partida suma el total y coincide por tipo y por piso"""
+    portico = crear_portico_regular(4, 3, 6.0, 3.0, 30, 60, 40, 40, 210)
+    c = calcular_cantidades(portico, 8, 2, 30, 0, espesor_losa=20)
+    p = calcular_presupuesto(c, PRECIOS)
+    assert np.isclose(sum(p['por_partida'].values()), p['total'])
+    assert np.isclose(sum(p['por_tipo'].values()), p['total'])
+    assert np.isclose(p['por_piso'].sum(), p['total'])
+    assert np.isclose(p['por_partida']['acero'], c['totales']['acero'] * 4.5)
+
+
+def test_alternativas():
+    """Decenas de alternativas de sección en una llamada, iguales a calcularlas una por una"""
+    portico = crear_portico_regular(20, 5, 6.0, 3.0, 30, 60, 40, 40, 210)
+    peraltes = portico['h'] + np.arange(0, 50, 5)[:, None]
+    c = calcular_cantidades(portico, 8, 2, 30, 0, h=peraltes)
+    p = calcular_presupuesto(c, PRECIOS)
+    assert p['total'].shape == (10,) and np.all(np.diff(p['total']) > 0)
+    una = calcular_presupuesto(calcular_cantidades(portico, 8, 2, 30, 0, h=peraltes[3]), PRECIOS)
+    assert np.isclose(una['total'], p['total'][3])
+
+
+def main():
+    """Ejecutar todas las pruebas"""
+    print("🧪 Pruebas de metrado de cantidades")
+    test_portico_pequeno()
+    print("✅ Pórtico pequeño")
+    test_presupuesto()
+    print("✅ Presupuesto")
+    test_alternativas()
+    print("✅ Alternativas")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Script de prueba para el metrado de cargas por áreas tributarias
+"""
+
+import numpy as np
+
+from metrado_cargas import calcular_areas_tributarias, calcular_metrado_cargas, predimensionar_columnas
+
+
+def test_areas_tributarias():
+    """La suma de áreas tributarias es el área de la planta y la clasificación es correcta"""
+    trib = calcular_areas_tributarias([6.0, 6.0, 5.0], [5.0, 5.0])
+    assert np.isclose(trib['area'].sum(), 17.0 * 10.0)
+    assert (trib['tipo'] == "esquina").sum() == 4
+    assert (trib['tipo'] == "interior").sum() == 2
+    assert np.isclose(trib['area'].max(), 6.0 * 5.0)
+
+
+def test_acumulacion_sin_reduccion():
+    """Sin reducción, la carga de la base es la suma de todas las cargas de piso"""
+    metrado = calcular_metrado_cargas([6.0] * 3, [5.0] * 2, 10, 500, 200, reduccion_cv=False)
+    assert metrado['P_servicio'].shape == (10, 12)
+    total = metrado['P_servicio'][0].sum()
+    assert np.isclose(total, 10 * (500 + 200) * 18.0 * 10.0)
+    assert np.all(np.diff(metrado['P_servicio'], axis=0) <= 0)
+
+
+def test_reduccion_carga_viva():
+    """La reducción respeta el mínimo de 0.4 y no aumenta la carga"""
+    metrado = calcular_metrado_cargas([8.0] * 4, [8.0] * 4, 30, 500, 250)
+    assert metrado['factor_reduccion'].min() >= 0.4
+    assert np.all(metrado['factor_reduccion'] <= 1.0)
+    sin_reduccion = calcular_metrado_cargas([8.0] * 4, [8.0] * 4, 30, 500, 250, reduccion_cv=False)
+    assert np.all(metrado['P_viva'] <= sin_reduccion['P_viva'] + 1e-6)
+
+    predim = predimensionar_columnas(metrado['P_servicio'], metrado['P_mayorada'], 280)
+    assert predim['lado_columna'].shape == (30, 25)
+
+
+def main():
+    """Ejecutar todas las pruebas"""
+    print("🧪 Pruebas del metrado de cargas")
+    test_areas_tributarias()
+    print("✅ Áreas tributarias")
+    test_acumulacion_sin_reduccion()
+    print("✅ Acumulación de cargas por piso")
+    test_reduccion_carga_viva()
+    print("✅ Reducción de carga viva")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Script de prueba para el análisis momento-curvatura por fibras
+"""
+
+import time
+
+import numpy as np
+
+from diagrama_interaccion import crear_seccion_rectangular, distribucion_perimetral
+from momento_curvatura import calcular_momento_curvatura, rotula_plastica
+
+
+def _columna():
+    x, y, As = distribucion_perimetral(40, 60, 3, 4, 2.85, 6)
+    return crear_seccion_rectangular(40, 60, x, y, As)
+
+
+def test_viga_simplemente_reforzada():
+    """Equilibrio axial en todos los pasos y Mn cercano al bloque rectangular equivalente"""
+    seccion = crear_seccion_rectangular(30, 60, [6, 24], [54, 54], [5.07, 5.07])
+    r = calcular_momento_curvatura(seccion, 210, 4200)
+    n_validos = r['valido'].sum()
+    assert n_validos > 100 and r['valido'][:n_validos].all()
+    assert np.allclose(r['N'][r['valido']], 0, atol=1.0)
+    As = 10.14
+    a = As * 4200 / (0.85 * 210 * 30)
+    Mn_bloque = As * 4200 * (54 - a / 2)
+    assert 0.95 * Mn_bloque <= r['Mn'] <= 1.15 * Mn_bloque
+    assert r['My_primera'] < r['Mn'] and r['phi_y'] < r['phi_u']
+    elastico = r['phi'] <= r['phi_y_primera']
+    assert np.all(np.diff(r['M'][elastico]) > 0)
+
+
+def test_carga_axial_y_confinamiento():
+    """La compresión reduce la ductilidad; estribos más cercanos la aumentan"""
+    seccion = _columna()
+    sin_carga = calcular_momento_curvatura(seccion, 280, 4200, P=0)
+    con_carga = calcular_momento_curvatura(seccion, 280, 4200, P=150000)
+    assert con_carga['Mn'] > sin_carga['Mn']
+    assert con_carga['ductilidad'] < sin_carga['ductilidad']
+    assert np.allclose(con_carga['N'][con_carga['valido']], 150000, rtol=1e-4)
+    separado = calcular_momento_curvatura(seccion, 280, 4200, P=150000, s_estribo=25)
+    assert separado['ductilidad'] < con_carga['ductilidad']
+
+
+def test_rapidez_y_rotula():
+    """200 fibras y 500 curvaturas en milisegundos; la rótula usa Mn y la curva M-φ"""
+    seccion = _columna()
+    calcular_momento_curvatura(seccion, 280, 4200, P=100000)
+    inicio = time.perf_counter()
+    r = calcular_momento_curvatura(seccion, 280, 4200, P=100000, n_fibras=200, n_puntos=500)
+    assert time.perf_counter() - inicio < 0.5
+    rotula = rotula_plastica(r, 300, 1.91, 4200)
+    assert rotula['Mp'] == r['Mn']
+    assert np.isclose(rotula['Lp'], 0.08 * 300 + 0.022 * 4200 * 0.0980665 * 1.91)
+    assert rotula['ductilidad_giro'] > 1
+
+
+def main():
+    """Ejecutar todas las pruebas"""
+    print("🧪 Pruebas de momento-curvatura")
+    test_viga_simplemente_reforzada()
+    test_carga_axial_y_confinamiento()
+    test_rapidez_y_rotula()
+    print("✅ Todas las pruebas pasaron")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Script de prueba para el motor de estabilidad de muros de contención
+"""
+
+import math
+import time
+
+import numpy as np
+
+from muro_contencion import (analizar_muro, calcular_diseno_fuste, coeficiente_coulomb, coeficiente_mononobe_okabe,
+                             coeficiente_sismico_zona, dimensionar_muro)
+
+CASO = dict(h1=2.8, Df=1.2, hm=1.2, gamma_relleno=1800, phi_relleno=30, gamma_cimentacion=1700,
+            phi_cimentacion=25, cohesion=1.0, qsc=1000, fc=210, fy=4200, sigma_adm=2.5, gamma_concreto=2400)
+
+
+def _calculo_app1(h1, Df, hm, gamma_relleno, phi_relleno, gamma_cimentacion, phi_cimentacion, cohesion, qsc,
+                  fc, fy, sigma_adm, gamma_concreto):
+    """Cálculo escalar original del botón de análisis completo de APP1.py"""
+    ka = math.tan(math.radians(45 - phi_relleno / 2))**2
+    hs = qsc / gamma_relleno
+    kc = 14.28
+    Bz = round((h1 + Df) * (1 + hs / (h1 + Df)) * math.sqrt(ka), 2)
+    hz = max(0.4, round(math.sqrt(((h1 + Df)**2 * (1 + hs / (h1 + Df))) / (9 * kc)) * 100) / 100)
+    b = max(0.35, round(math.sqrt(((h1 + hm)**2 * (1 + hs / (h1 + hm))) / (10 * kc)) * 100) / 100)
+    r = max(0.7, round((2 * Bz - 3 * b) / 6 * 100) / 100)
+    t = round((Bz - r - b) * 100) / 100
+    Ea_relleno = 0.5 * ka * (gamma_relleno / 1000) * h1**2
+    Ea_sobrecarga = ka * (qsc / 1000) * h1
+    kp = math.tan(math.radians(45 + phi_cimentacion / 2))**2
+    Ep = 0.5 * kp * (gamma_cimentacion / 1000) * Df**2
+    W_muro = b * h1 * (gamma_concreto / 1000)
+    W_zapata = Bz * hz * (gamma_concreto / 1000)
+    W_relleno = t * h1 * (gamma_relleno / 1000)
+    Mr = W_muro * (r + b / 2) + W_zapata * Bz / 2 + W_relleno * (r + b + t / 2)
+    M_volcador = Ea_relleno * h1 / 3 + Ea_sobrecarga * h1 / 2
+    W_total = W_muro + W_zapata + W_relleno
+    e = abs(Mr / W_total - Bz / 2)
+    return {'Bz': Bz, 'hz': hz, 'b': b, 'r': r, 't': t, 'Ea_total': Ea_relleno + Ea_sobrecarga, 'Ep': Ep,
+            'W_total': W_total, 'FS_volcamiento': (Mr + Ep * Df / 3) / M_volcador,
+            'FS_deslizamiento': (math.tan(math.radians(phi_cimentacion)) * W_total + Ep) / (Ea_relleno + Ea_sobrecarga),
+            'e': e, 'q_max_kg_cm2': W_total / Bz * (1 + 6 * e / Bz) * 0.1,
+            'q_min_kg_cm2': W_total / Bz * (1 - 6 * e / Bz) * 0.1}
+
+
+def test_coincide_con_app1():
+    """Un caso del motor reproduce el cálculo escalar del botón y el diseño del fuste"""
+    for cambios in ({}, {'h1': 4.5, 'qsc': 500}, {'phi_relleno': 34, 'Df': 0.8, 'hm': 0.6}):
+        caso = dict(CASO, **cambios)
+        r = analizar_muro(**caso)
+        for clave, valor in _calculo_app1(**caso).items():
+            assert np.isclose(r[clave][0], valor), clave
+        escalar = calcular_diseno_fuste({clave: float(r[clave][0]) for clave in ('ka', 'Bz', 'hz', 'b', 'r', 't')},
+                                        caso)
+        for clave, valor in escalar.items():
+            assert np.isclose(r['fuste'][clave][0], valor), clave
+
+
+def test_tramos_de_un_corte():
+    """Cientos de tramos con alturas variables en una llamada, iguales a evaluarlos uno por uno"""
+    h1 = np.linspace(1.5, 7.0, 400)
+    cohesion = np.where(np.arange(400) % 3 == 0, 0.5, 1.5)
+    r = analizar_muro(h1, 1.2, 1.0, 1800, 30, 1700, 25, cohesion, 1000)
+    assert r['FS_volcamiento'].shape == (400,) and r['fuste']['dreq'].shape == (400,)
+    for k in (0, 137, 399):
+        uno = analizar_muro(h1[k], 1.2, 1.0, 1800, 30, 1700, 25, cohesion[k], 1000)
+        for clave in ('Bz', 'FS_deslizamiento', 'q_max_kg_cm2', 'cumple'):
+            assert np.array_equal(uno[clave][0], r[clave][k])
+    cumple = (r['cumple_volcamiento'] & r['cumple_deslizamiento'] & r['cumple_presion'] & ~r['tension']
+              & r['cumple_excentricidad'] & r['cumple_peralte'] & r['cumple_acero'])
+    assert np.array_equal(r['cumple'], cumple)
+    assert r['q_max_kg_cm2'][-1] > r['q_max_kg_cm2'][0]
+
+    inicio = time.perf_counter()
+    analizar_muro(np.linspace(1.5, 7.0, 100000), 1.2, 1.0, 1800, 30, 1700, 25, 1.0, 1000)
+    assert time.perf_counter() - inicio < 1.0
+
+
+def test_proporciones_dadas():
+    """Con proporciones dadas se verifica esa geometría y las mallas se combinan por difusión"""
+    base = dimensionar_muro(3.0, 1.2, 1.0, 1800, 30, 1000)
+    Bz = np.array([1.5, 2.0, 3.0])[:, None]
+    r = analizar_muro(3.0, 1.2, 1.0, 1800, 30, 1700, 25, 1.0, 1000, Bz=Bz, r=np.array([0.5, 0.8]))
+    assert r['Bz'].shape == (3, 2) and np.allclose(r['hz'], base['hz'])
+    assert np.all(np.diff(r['FS_volcamiento'], axis=0) > 0)
+    assert np.all(r['t'] == base['t'])
+
+
+def _cuna_de_prueba(phi, kh, kv, delta, beta):
+    """KAE por equilibrio de cuñas de prueba tras un trasdós vertical de altura unitaria"""
+    phi, delta, beta = np.radians([phi, delta, beta])
+    alfa = np.linspace(beta + 1e-4, np.pi / 2 - 1e-4, 200001)
+    W = 0.5 / (np.tan(alfa) - np.tan(beta))
+    # Reacción del muro inclinada delta y del suelo inclinada phi respecto de la normal al plano de falla
+    Px, Py = np.cos(delta), np.sin(delta)
+    Rx, Ry = np.sin(phi - alfa), np.cos(phi - alfa)
+    P = W * (kh * Ry - (1 - kv) * Rx) / (Px * Ry - Py * Rx)
+    return 2 * P.max() / (1 - kv)
+
+
+def test_coeficientes_sismicos():
+    """Coulomb y Mononobe-Okabe coinciden con Rankine, la tabla de Coulomb y las cuñas de prueba"""
+    assert np.isclose(coeficiente_coulomb(30), 1 / 3)
+    assert np.isclose(coeficiente_coulomb(30, delta=20), 0.2973, atol=1e-4)
+    for caso in ((30, 0.2, 0.0, 0.0, 0.0), (35, 0.25, 0.1, 17.5, 10.0), (30, 0.15, -0.1, 15.0, 15.0)):
+        assert np.isclose(coeficiente_mononobe_okabe(*caso), _cuna_de_prueba(*caso), rtol=1e-8)
+    assert np.isnan(coeficiente_mononobe_okabe(30, 0.4, 0.0, 0.0, 15.0))
+    assert np.isclose(coeficiente_sismico_zona('Z4'), 0.175)
+
+
+def test_modo_sismico():
+    """Sin sismo se reproduce el caso estático; un barrido de kh y kv es una sola llamada"""
+    estatico = analizar_muro(**CASO)
+    sin_sismo = analizar_muro(**CASO, kh=0.0, kv=0.0)
+    for clave in ('FS_volcamiento', 'FS_deslizamiento', 'q_max_kg_cm2', 'e'):
+        assert np.allclose(sin_sismo[clave], estatico[clave])
+
+    kh = np.linspace(0.0, 0.35, 36)[:, None]
+    kv = np.array([0.0, 0.1])
+    r = analizar_muro(**CASO, kh=kh, kv=kv, delta=20.0)
+    assert r['FS_volcamiento'].shape == (36, 2) and r['fuste']['dreq'].shape == (36, 2)
+    assert np.all(np.diff(r['FS_volcamiento'], axis=0) < 0) and np.all(np.diff(r['FS_deslizamiento'], axis=0) < 0)
+    # Con kh bajo gobierna la combinación estática 1.4·(D + L)
+    assert np.all(np.diff(r['fuste']['dreq'], axis=0) >= 0) and np.all(r['fuste']['dreq'][-1] > r['fuste']['dreq'][0])
+
+    # Caso Z4 contra el cálculo a mano con el incremento dinámico a 0.6·h1
+    k = 18
+    caso = dict(CASO, kh=float(kh[k, 0]), kv=0.0, delta=20.0)
+    uno = analizar_muro(**caso)
+    ka = coeficiente_coulomb(30, 20)
+    kae = coeficiente_mononobe_okabe(30, caso['kh'], 0, 20)
+    h1, g, q = CASO['h1'], CASO['gamma_relleno'] / 1000, CASO['qsc'] / 1000
+    c = math.cos(math.radians(20))
+    M_volcador = ((ka * g * h1**3 / 6 + ka * q * h1**2 / 2 + (kae - ka) * g * h1**2 / 2 * 0.6 * h1
+                   + (kae - ka) * q * h1**2 / 2) * c
+                  + caso['kh'] * (uno['W_muro'][0] + uno['W_relleno'][0]) * h1 / 2
+                  + caso['kh'] * uno['W_zapata'][0] * uno['hz'][0] / 2)
+    assert np.isclose(uno['M_volcador'][0], M_volcador)
+
+    # Resultante con el momento volcador completo y la componente vertical del empuje en el talón
+    Bz, b, t, rp = uno['Bz'][0], uno['b'][0], uno['t'][0], uno['r'][0]
+    Ev = uno['Ea_total'][0] * math.tan(math.radians(20))
+    N = uno['W_total'][0] + Ev
+    Mr = (uno['W_muro'][0] * (rp + b / 2) + uno['W_zapata'][0] * Bz / 2 + uno['W_relleno'][0] * (rp + b + t / 2)
+          + Ev * Bz)
+    e = abs((Mr - M_volcador) / N - Bz / 2)
+    assert np.isclose(uno['e'][0], e)
+    assert np.isclose(uno['q_max_kg_cm2'][0], N / Bz * (1 + 6 * e / Bz) * 0.1)
+    assert np.isclose(uno['FS_volcamiento'][0], r['FS_volcamiento'][k, 0])
+
+    # Fuste: mismas componentes horizontales del empuje y sismo con factor 1.0 en 1.25·(D + L) + E
+    fuste = {clave: valor[0] for clave, valor in uno['fuste'].items()}
+    M_estatico = (ka * g * h1**3 / 6 + ka * q * h1**2 / 2) * c
+    assert np.isclose(fuste['Mvol_total'], uno['M_volcador'][0] - caso['kh'] * uno['W_relleno'][0] * h1 / 2
+                      - caso['kh'] * uno['W_zapata'][0] * uno['hz'][0] / 2)
+    Mu = fuste['dreq']**2 * 0.9 * 0.85 * CASO['fc'] * uno['b'][0] * 100 * 0.59 / 100000
+    assert np.isclose(Mu, max(1.4 * M_estatico, 1.25 * M_estatico + uno['M_sismico_fuste'][0]))
+    assert np.isclose(r['fuste']['Mvol_total'][0, 0], M_estatico)
+    assert not r['cumple'][-1].any()
+
+
+def main():
+    """Ejecutar todas las pruebas"""
+    print("🧪 Pruebas del motor de muros de contención")
+    test_coincide_con_app1()
+    test_tramos_de_un_corte()
+    test_proporciones_dadas()
+    test_coeficientes_sismicos()
+    test_modo_sismico()
+    print("✅ Todas las pruebas pasaron")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Script de prueba para el diseño de muros estructurales
+"""
+
+import numpy as np
+
+from muros_estructurales import (calcular_diagrama_muro, coeficiente_alfa_c, crear_muro,
+                                 propiedades_muro, verificar_muros)
+
+
+def test_diagrama_muro():
+    """Extremos exactos del diagrama, simetría del muro rectangular y ala en compresión"""
+    muro = crear_muro(400, 25, As_extremo=6 * 2.85)
+    d = calcular_diagrama_muro(muro, 280, 4200)
+    Ast = sum(muro['barras_As'])
+    assert np.isclose(d['P0'], 0.85 * 280 * (400 * 25 - Ast) + 4200 * Ast)
+    assert np.isclose(d['Pnt'], -4200 * Ast)
+    assert np.isclose(d['Mn'].max(), -d['Mn'].min())
+    assert calcular_diagrama_muro(crear_muro(400, 25, As_extremo=6 * 2.85), 280, 4200) is d
+
+    muro_T = crear_muro(400, 25, ala_inicio=(200, 25))
+    props = propiedades_muro(muro_T)
+    assert props['x_centroide'] < 200 and np.isclose(props['Ag'], 200 * 25 + 375 * 25)
+    d_T = calcular_diagrama_muro(muro_T, 280, 4200)
+    assert d_T['Mn'].max() > -d_T['Mn'].min()
+
+
+def test_elementos_de_borde():
+    """Criterios de desplazamientos y de esfuerzos con las expresiones de la norma"""
+    muro = crear_muro(400, 25, As_extremo=6 * 2.85)
+    Pu = np.array([50e3, 400e3, 400e3])
+    Mu = np.array([1e7, 4e7, -4e7])
+    r = verificar_muros([muro], 0, 280, 4200, Pu, Mu, 40e3, hw=3000, delta_u=30)
+    deriva = max(30 / 3000, 0.005)
+    assert np.array_equal(r['requiere_borde_desplazamiento'], r['c'] >= 400 / (600 * deriva))
+    sigma = Pu / 10000 + np.abs(Mu) * 200 / (25 * 400**3 / 12)
+    assert np.allclose(r['sigma_compresion'], sigma)
+    assert np.array_equal(r['requiere_borde_esfuerzo'], sigma > 0.2 * 280)
+    assert not r['requiere_borde'][0] and r['requiere_borde'][1]
+    assert np.isclose(r['c'][1], r['c'][2])
+    assert np.isclose(r['longitud_borde'][1], max(r['c'][1] - 40, r['c'][1] / 2))
+
+
+def test_cortante_y_lote():
+    """ρh cubre el Vu amplificado y el lote de pisos × combinaciones coincide caso a caso"""
+    muros = [crear_muro(400, 25, As_extremo=6 * 2.85), crear_muro(350, 20, ala_fin=(150, 20))]
+    rng = np.random.default_rng(3)
+    Pu = rng.uniform(0, 250e3, (12, 6))
+    Mu = rng.uniform(-2.5e7, 2.5e7, (12, 6))
+    Vu = rng.uniform(5e3, 60e3, (12, 6))
+    indice = (np.arange(12) % 2)[:, None]
+    r = verificar_muros(muros, indice, 280, 4200, Pu, Mu, Vu, hw=2800, delta_u=25)
+    assert r['Vu_diseno'].shape == (12, 6)
+    assert np.all(r['Vu_diseno'] >= Vu - 1e-9) and np.all(r['Vu_diseno'] <= 6 * Vu + 1e-9)
+    cumple = r['cumple_cortante']
+    assert np.all(r['phiVn'][cumple] >= r['Vu_diseno'][cumple] * (1 - 1e-9))
+    assert np.all(r['rho_h'] >= 0.002)
+    una = verificar_muros(muros, 1, 280, 4200, Pu[3, 2], Mu[3, 2], Vu[3, 2], hw=2800, delta_u=25)
+    for clave in ('razon_flexion', 'c', 'Vu_diseno', 'rho_h'):
+        assert np.isclose(una[clave], r[clave][3, 2])
+    assert np.isclose(coeficiente_alfa_c(1.75), (0.80 + 0.53) / 2)
+
+
+def main():
+    """Ejecutar todas las pruebas"""
+    print("🧪 Pruebas de muros estructurales")
+    test_diagrama_muro()
+    test_elementos_de_borde()
+    test_cortante_y_lote()
+    print("✅ Todas las pruebas pasaron")
+
+
+if __name__ == "__main__":
+    main()
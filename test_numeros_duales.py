@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Script de prueba para la diferenciación automática con números duales
+"""
+
+import numpy as np
+
+from calculos_estructurales import (calcular_analisis_sismico, calcular_diseno_cortante, calcular_diseno_flexion,
+                                    calcular_predimensionamiento)
+from muro_contencion import calcular_diseno_fuste
+from numeros_duales import Dual, derivar, minimizar, sensibilidades, sqrt
+
+RESULTADOS_MURO = {'ka': 0.333, 'Bz': 3.2, 'hz': 0.5, 'b': 0.3, 'r': 0.8, 't': 2.1}
+DATOS_MURO = {'h1': 4.5, 'gamma_relleno': 1800, 'phi_relleno': 30, 'cohesion': 0.5, 'Df': 1.2, 'fc': 210,
+              'fy': 4200, 'gamma_concreto': 2400, 'qsc': 500}
+
+
+def _diferencias_centrales(funcion, entradas, nombre, salida, h=1e-6):
+    """Derivada por diferencias centrales de una entrada (admite 'dict.clave')"""
+    valores = []
+    for signo in (1, -1):
+        copia = {clave: dict(valor) if isinstance(valor, dict) else valor for clave, valor in entradas.items()}
+        contenedor, clave = (copia[nombre.split('.')[0]], nombre.split('.')[1]) if '.' in nombre else (copia, nombre)
+        contenedor[clave] = contenedor[clave] * (1 + signo * h)
+        valores.append(funcion(**copia)[salida])
+    base = entradas[nombre.split('.')[0]][nombre.split('.')[1]] if '.' in nombre else entradas[nombre]
+    return (valores[0] - valores[1]) / (2 * h * base)
+
+
+def test_jacobiano_funciones_de_calculo():
+    """Una evaluación con duales da el jacobiano completo que confirman las diferencias finitas"""
+    entradas = {'fc': 350, 'fy': 4200, 'b': 30, 'd': 54, 'Mu': 2.5e6}
+    r = derivar(calcular_diseno_flexion, **entradas)
+    assert r['entradas'] == ['fc', 'fy', 'b', 'd', 'Mu']
+    assert r['valores']['As'] == calcular_diseno_flexion(**entradas)['As']
+    assert np.isclose(r['derivadas']['As']['b'], r['valores']['rho'] * 54)
+    assert r['derivadas']['Mn']['Mu'] == 0 and 'verificacion' not in r['derivadas']
+    for salida in ('beta1', 'rho_max', 'As', 'a', 'phiMn'):
+        for nombre in ('fc', 'fy', 'b', 'd'):
+            aproximada = _diferencias_centrales(calcular_diseno_flexion, entradas, nombre, salida)
+            assert np.isclose(r['derivadas'][salida][nombre], aproximada, rtol=1e-5, atol=1e-9)
+
+    cortante = derivar(calcular_diseno_cortante, fc=210, fy=4200, bw=30, d=54, Vu=30000)
+    assert np.isclose(cortante['derivadas']['Vc']['bw'], 0.53 * np.sqrt(210) * 54)
+    assert np.isclose(cortante['derivadas']['Vs_requerido']['Vu'], 1 / 0.75)
+    pre = derivar(calcular_predimensionamiento, L_viga=6, num_pisos=5, num_vanos=3, CM=0.5, CV=0.25, fc=210, fy=4200)
+    assert np.isclose(pre['derivadas']['lado_columna']['fc'], -pre['valores']['lado_columna'] / (2 * 210))
+    sismo = derivar(calcular_analisis_sismico, zona_sismica='Z4', tipo_suelo='S2', factor_importancia=1.0,
+                    peso_total=800)
+    assert np.isclose(sismo['derivadas']['V']['peso_total'], 0.35 * 2.5 / 7 * 1000)
+
+
+def test_fuste_del_muro():
+    """Las derivadas atraviesan el fuste del muro con entradas en diccionarios anidados"""
+    entradas = {'resultados': RESULTADOS_MURO, 'datos_entrada': DATOS_MURO}
+    r = derivar(calcular_diseno_fuste, **entradas)
+    directo = calcular_diseno_fuste(RESULTADOS_MURO, DATOS_MURO)
+    assert all(np.isclose(r['valores'][clave], directo[clave]) for clave in directo)
+    assert r['derivadas']['num_barras']['datos_entrada.h1'] == 0
+    for salida in ('FSv', 'FSd', 'e', 'dreq', 'As'):
+        for nombre in ('datos_entrada.h1', 'datos_entrada.phi_relleno', 'resultados.Bz', 'resultados.b'):
+            aproximada = _diferencias_centrales(calcular_diseno_fuste, entradas, nombre, salida)
+            assert np.isclose(r['derivadas'][salida][nombre], aproximada, rtol=1e-5, atol=1e-9)
+    s = sensibilidades(calcular_diseno_fuste, 'FSv', ['datos_entrada.h1', 'resultados.Bz'], **entradas)
+    assert s['elasticidades']['datos_entrada.h1'] < 0 < s['elasticidades']['resultados.Bz']
+
+    # Con el incremento sísmico de analizar_muro: la combinación 1.25·(D + L) + E gobierna o no
+    for M_sismico in (1.0, 12.0):
+        sismico = {'resultados': dict(RESULTADOS_MURO, Ea_sismico=1.5, M_sismico_fuste=M_sismico),
+                   'datos_entrada': DATOS_MURO}
+        r = derivar(calcular_diseno_fuste, **sismico)
+        for salida in ('FSd', 'dreq'):
+            for nombre in ('datos_entrada.h1', 'resultados.M_sismico_fuste', 'resultados.Ea_sismico'):
+                aproximada = _diferencias_centrales(calcular_diseno_fuste, sismico, nombre, salida)
+                assert np.isclose(r['derivadas'][salida][nombre], aproximada, rtol=1e-5, atol=1e-9)
+        assert (r['derivadas']['dreq']['resultados.M_sismico_fuste'] > 0) == (M_sismico == 12.0)
+
+
+def test_arreglos_y_minimizacion():
+    """Duales con valores en arreglo y minimización con gradiente exacto y límites"""
+    x = Dual(np.array([4.0, 9.0]), np.array([[1.0, 0.0], [0.0, 1.0]]))
+    y = 2 * sqrt(x) + x**2 / 3
+    assert np.allclose(y.valor, [4 + 16 / 3, 6 + 27])
+    assert np.allclose(y.derivadas, np.diag(1 / np.sqrt([4, 9]) + 2 * np.array([4, 9]) / 3))
+
+    def error_momento(d, Mu):
+        return (calcular_diseno_flexion(210, 4200, 30, d, Mu)['phiMn'] - Mu)**2
+
+    r = minimizar(error_momento, {'d': 80.0}, {'d': (20, 120)}, Mu=2.5e6)
+    rho = calcular_diseno_flexion(210, 4200, 30, 1, 0)['rho']
+    d_exacto = np.sqrt(2.5e6 / (0.9 * rho * 4200 * 30 * (1 - rho * 4200 / (1.7 * 210))))
+    assert np.isclose(r['x']['d'], d_exacto, rtol=1e-6)
+    acotado = minimizar(error_momento, {'d': 80.0}, {'d': (60, 120)}, Mu=2.5e6)
+    assert acotado['x']['d'] == 60
+
+
+def main():
+    """Ejecutar todas las pruebas"""
+    print("🧪 Pruebas de números duales")
+    test_jacobiano_funciones_de_calculo()
+    test_fuste_del_muro()
+    test_arreglos_y_minimizacion()
+    print("✅ Todas las pruebas pasaron")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Script de prueba para la optimización de grupos de vigas y columnas
+"""
+
+import itertools
+
+import numpy as np
+
+from modelo_portico import (actualizar_secciones, cargas_gravedad, cargas_laterales, crear_portico_regular,
+                            desplazamientos_piso, fuerzas_elementos, resolver_portico)
+from optimizacion_grupos import (_fuerzas_lote, _resolver_lote, evaluar_configuraciones, optimizar_grupos,
+                                 preparar_modelo)
+
+CATALOGO_VIGAS = np.array([[25, 50], [30, 50], [25, 60], [30, 60], [30, 70]], dtype=float)
+CATALOGO_COLUMNAS = np.repeat(np.arange(35, 65, 5, dtype=float)[:, None], 2, axis=1)
+
+
+def test_reanalisis_por_lotes():
+    """La factorización por bloques en lote coincide con el análisis directo del pórtico"""
+    portico = crear_portico_regular(8, 4, 6.0, 3.0, 30, 60, 60, 60, 210)
+    fuerzas = np.arange(1, 9) / 36 * 120000
+    modelo = preparar_modelo(portico, [3, 3, 2], 2000, 800, fuerzas)
+    rng = np.random.default_rng(0)
+    b_g, h_g = rng.uniform(30, 70, (3, 6)), rng.uniform(40, 80, (3, 6))
+    u = _resolver_lote(modelo, b_g * h_g, b_g * h_g**3 / 12)
+    for c in range(3):
+        b, h = b_g[c][modelo['grupo']], h_g[c][modelo['grupo']]
+        directo = actualizar_secciones(portico, b, h)
+        F, f_emp = cargas_gravedad(directo, 2000)
+        u_d = resolver_portico(directo, F)
+        assert np.allclose(u[c, :, 0], u_d, rtol=1e-9, atol=1e-12)
+        f = _fuerzas_lote(modelo, u[c:c + 1], (b * h)[None], (b * h**3 / 12)[None])
+        assert np.allclose(f[0, 0], fuerzas_elementos(directo, u_d, None, f_emp), atol=1e-4)
+        u_s = resolver_portico(directo, cargas_laterales(directo, fuerzas))
+        assert np.allclose(u[c, :, 2].reshape(8, -1)[:, 0::3].mean(axis=1), desplazamientos_piso(directo, u_s))
+
+
+def test_coincide_con_busqueda_exhaustiva():
+    """En un pórtico pequeño el descenso por lotes llega al mínimo de todas las combinaciones"""
+    portico = crear_portico_regular(4, 3, 6.0, 3.0, 30, 60, 50, 50, 210)
+    fuerzas = np.arange(1, 5) / 10 * 40000
+    r = optimizar_grupos(portico, 2, 2000, 800, fuerzas, 210, 4200, 350, 4.5, CATALOGO_VIGAS, CATALOGO_COLUMNAS)
+    modelo = preparar_modelo(portico, 2, 2000, 800, fuerzas)
+    todas = np.array(list(itertools.product(range(6), range(6), range(5), range(5))))
+    exhaustiva = evaluar_configuraciones(modelo, todas, CATALOGO_VIGAS, CATALOGO_COLUMNAS, 210, 4200, 350, 4.5)
+    assert r['cumple'] and np.isclose(r['costo'], exhaustiva['costo'].min())
+    assert r['configuraciones_evaluadas'] < len(todas) // 10
+    assert np.all(np.diff(r['historial_costo']) < 0)
+    assert np.all(r['deriva'] <= 0.007) and np.all(r['cuantia_columnas'] >= 0.01)
+    assert np.array_equal(r['portico']['h'][modelo['grupo'] == 2], np.full(6, r['h_vigas'][0]))
+
+
+def test_deriva_y_sin_solucion():
+    """Un sismo mayor encarece la estructura; si ni las secciones mayores cumplen, se informa"""
+    portico = crear_portico_regular(8, 4, 6.0, 3.0, 30, 60, 60, 60, 210)
+    fuerzas = np.arange(1, 9) / 36 * 100000
+    base = optimizar_grupos(portico, [3, 3, 2], 2000, 800, fuerzas, 210, 4200, 350, 4.5)
+    mayor = optimizar_grupos(portico, [3, 3, 2], 2000, 800, 1.2 * fuerzas, 210, 4200, 350, 4.5)
+    assert base['cumple'] and mayor['cumple'] and mayor['costo'] > base['costo']
+    assert np.all(mayor['h_columnas'] * mayor['b_columnas'] >= 30 * 30)
+    imposible = optimizar_grupos(portico, 4, 2000, 800, 10 * fuerzas, 210, 4200, 350, 4.5)
+    assert not imposible['cumple'] and imposible['iteraciones'] == 0
+    try:
+        preparar_modelo(portico, [3, 3], 2000, 800, fuerzas)
+        assert False
+    except ValueError:
+        pass
+
+
+def main():
+    """Ejecutar todas las pruebas"""
+    print("🧪 Pruebas de optimización de grupos")
+    test_reanalisis_por_lotes()
+    test_coincide_con_busqueda_exhaustiva()
+    test_deriva_y_sin_solucion()
+    print("✅ Todas las pruebas pasaron")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Script de prueba para el optimizador de proporciones de muros de contención
+"""
+
+import time
+
+import numpy as np
+
+from muro_contencion import analizar_muro
+from optimizacion_muro import optimizar_muro
+
+CASO = (4.0, 1.2, 1.0, 1800, 30, 1700, 25, 1.0, 1000)
+
+
+def test_coincide_con_fuerza_bruta():
+    """Las podas y la búsqueda por bloques no descartan el mínimo de la malla completa"""
+    mallas = dict(Bz_valores=np.arange(1.5, 4.01, 0.1), hz_valores=np.arange(0.4, 0.81, 0.05),
+                  b_valores=np.arange(0.25, 0.61, 0.05), r_valores=np.arange(0.0, 1.51, 0.1))
+    r = optimizar_muro(*CASO, tamano_bloque=500, **mallas)
+    Bz, hz, b, rr = np.meshgrid(*mallas.values(), indexing='ij')
+    todos = analizar_muro(*CASO, Bz=Bz, hz=hz, b=b, r=rr, t=Bz - rr - b)
+    volumen = np.where(todos['cumple'] & (todos['t'] >= 0), b * 4.0 + Bz * hz, np.inf)
+    assert r['cumple'] and np.isclose(r['volumen'], volumen.min())
+    assert r['candidatos_evaluados'] < r['candidatos_malla'] - r['candidatos_podados']
+    assert r['FS_volcamiento'] >= 2.0 and r['FS_deslizamiento'] >= 1.5 and r['e'] <= r['Bz'] / 6
+    assert r['fuste']['dreal'] >= r['fuste']['dreq']
+
+
+def test_millon_de_candidatos():
+    """Malla de más de un millón de candidatos en alrededor de un segundo, mejor que el empírico"""
+    inicio = time.perf_counter()
+    r = optimizar_muro(6.0, 1.5, 1.0, 1800, 32, 1800, 28, 1.0, 1000, sigma_adm=3.0)
+    assert time.perf_counter() - inicio < 2.0
+    assert r['candidatos_malla'] > 1e6 and r['cumple']
+    empirico = analizar_muro(6.0, 1.5, 1.0, 1800, 32, 1800, 28, 1.0, 1000, sigma_adm=3.0)
+    assert r['volumen'] <= empirico['b'][0] * 6.0 + empirico['Bz'][0] * empirico['hz'][0]
+    assert np.isclose(r['t'], r['Bz'] - r['r'] - r['b'])
+
+
+def test_sin_solucion():
+    """Con una capacidad portante muy baja ningún candidato cumple"""
+    r = optimizar_muro(*CASO, sigma_adm=0.2)
+    assert not r['cumple'] and 'Bz' not in r
+    assert r['candidatos_evaluados'] == r['candidatos_malla'] - r['candidatos_podados']
+
+
+def main():
+    """Ejecutar todas las pruebas"""
+    print("🧪 Pruebas del optimizador de muros")
+    test_coincide_con_fuerza_bruta()
+    test_millon_de_candidatos()
+    test_sin_solucion()
+    print("✅ Todas las pruebas pasaron")
+
+
+if __name__ == "__main__":
+    main()
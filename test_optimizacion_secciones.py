@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Script de prueba para el optimizador de secciones de vigas
+"""
+
+import time
+
+import numpy as np
+
+from optimizacion_secciones import optimizar_seccion_viga, costo_por_metro
+
+
+def _fuerza_bruta(Mu_pos, Mu_neg, Vu, L, fc, fy, precio_concreto, precio_acero):
+    """Recorre la malla completa con un doble bucle, sin podas"""
+    mejor = (np.inf, None, None)
+    for b in range(25, 61, 5):
+        for h in range(30, 121, 5):
+            d = h - 6.0
+            if b < 0.3 * h or h < L * 100 / 21 or Vu > 0.75 * 2.63 * np.sqrt(fc) * b * d:
+                continue
+            costo = costo_por_metro(float(b), float(h), Mu_pos, Mu_neg, Vu, fc, fy,
+                                    precio_concreto, precio_acero, 6.0, 1.42)[0]
+            if np.isfinite(costo) and costo < mejor[0]:
+                mejor = (costo, b, h)
+    return mejor
+
+
+def test_coincide_con_fuerza_bruta():
+    """La poda no descarta el óptimo"""
+    for Mu_pos, Mu_neg, Vu, L in ((20e5, 30e5, 25e3, 6.0), (8e5, 12e5, 9e3, 4.5), (60e5, 90e5, 50e3, 8.0)):
+        r = optimizar_seccion_viga(Mu_pos, Mu_neg, Vu, L, 210, 4200, 350, 4.5)
+        costo, b, h = _fuerza_bruta(Mu_pos, Mu_neg, Vu, L, 210, 4200, 350, 4.5)
+        assert np.isclose(r['costo_por_metro'][0], costo)
+        assert (r['b'][0], r['h'][0]) == (b, h)
+
+
+def test_sin_solucion():
+    """Un grupo sin sección factible queda marcado sin afectar a los demás"""
+    r = optimizar_seccion_viga([20e5, 1e9], [30e5, 1e9], [25e3, 1e7], [6.0, 6.0], 210, 4200, 350, 4.5)
+    assert r['cumple'].tolist() == [True, False]
+    assert np.isnan(r['b'][1])
+
+
+def test_muchos_grupos():
+    """Cientos de grupos en milisegundos, con la mayoría de la malla podada"""
+    rng = np.random.default_rng(0)
+    n = 200
+    inicio = time.perf_counter()
+    r = optimizar_seccion_viga(rng.uniform(5e5, 8e6, n), rng.uniform(5e5, 8e6, n),
+                               rng.uniform(5e3, 6e4, n), rng.uniform(4, 9, n), 210, 4200, 350, 4.5)
+    assert time.perf_counter() - inicio < 0.5
+    assert r['candidatos_evaluados'] < r['candidatos_malla']
+    assert np.all(r['b'][r['cumple']] >= 0.3 * r['h'][r['cumple']])
+
+
+def main():
+    """Ejecutar todas las pruebas"""
+    print("🧪 Pruebas del optimizador de secciones")
+    test_coincide_con_fuerza_bruta()
+    print("✅ Coincide con la búsqueda exhaustiva")
+    test_sin_solucion()
+    print("✅ Grupos sin solución")
+    test_muchos_grupos()
+    print("✅ Muchos grupos de vigas")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Script de prueba para el modelo de pórtico y el análisis pushover evento a evento
+"""
+
+import time
+import numpy as np
+
+from modelo_portico import crear_portico_regular, cargas_laterales, resolver_portico, desplazamientos_piso
+from analisis_pushover import calcular_pushover, analizar_pushover_portico
+
+
+def test_rigidez_portico():
+    """Deriva elástica de un pórtico con viga muy rígida ≈ V·h³/(24·E·I)"""
+    portico = crear_portico_regular(1, 1, 5.0, 3.0, 30, 300, 30, 30, 210)
+    u = resolver_portico(portico, cargas_laterales(portico, [1000.0]))
+    E = portico['E'][0]
+    esperado = 1000.0 * 300**3 / (24 * E * 30**4 / 12)
+    assert abs(desplazamientos_piso(portico, u)[0] / esperado - 1) < 0.02
+
+
+def test_mecanismo_portal():
+    """Carga de colapso de un portal con Mp uniforme: V = 4·Mp/h"""
+    portico = crear_portico_regular(1, 1, 5.0, 3.0, 40, 60, 40, 40, 210)
+    Mp = np.full(len(portico['tipo']), 1e6)
+    resultado = calcular_pushover(portico, Mp, [1.0])
+    assert resultado['mecanismo']
+    assert abs(resultado['V_max'] - 4e6 / 300) < 1e-6 * 4e6 / 300
+    assert len(resultado['secuencia']) == 4
+
+
+def test_pushover_20_pisos():
+    """Pórtico de 20 pisos: actualizaciones de rango uno = refactorización completa, en segundos"""
+    portico = crear_portico_regular(20, 4, 6.0, 3.0, 30, 60, 60, 60, 280)
+    pesos = np.full(20, 144000.0)
+    inicio = time.time()
+    rapido = analizar_pushover_portico(portico, 4200, 3000, pesos, "Z4", "S2", 1.0)
+    duracion = time.time() - inicio
+    completo = analizar_pushover_portico(portico, 4200, 3000, pesos, "Z4", "S2", 1.0, max_actualizaciones=1)
+
+    assert duracion < 5.0
+    assert len(rapido['secuencia']) == len(completo['secuencia'])
+    assert np.allclose(rapido['V'], completo['V'], rtol=1e-6)
+    assert rapido['desempeno']['desplazamiento_objetivo'] > 0
+    print(f"✅ Pushover 20 pisos: {len(rapido['secuencia'])} rótulas en {duracion:.2f} s")
+
+
+def main():
+    """Ejecutar todas las pruebas"""
+    print("🧪 Pruebas del análisis pushover")
+    test_rigidez_portico()
+    print("✅ Rigidez elástica del pórtico")
+    test_mecanismo_portal()
+    print("✅ Mecanismo de colapso del portal")
+    test_pushover_20_pisos()
+
+
+if __name__ == "__main__":
+    main()
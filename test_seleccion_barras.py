@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Script de prueba para el selector de barras de refuerzo
+"""
+
+import time
+import numpy as np
+
+from seleccion_barras import AREAS, DIAMETROS, construir_indice_combinaciones, seleccionar_barras
+
+
+def test_indice_ordenado_y_factible():
+    """El índice está ordenado por As y cada capa respeta el ancho libre"""
+    indice = construir_indice_combinaciones(25.0)
+    assert np.all(np.diff(indice['As']) >= 0)
+    una_capa = indice['capas'] == 1
+    n = indice['n1'][una_capa] + indice['n2'][una_capa]
+    ancho = (indice['n1'][una_capa] * DIAMETROS[indice['barra1'][una_capa]]
+             + indice['n2'][una_capa] * DIAMETROS[indice['barra2'][una_capa]] + (n - 1) * 2.5)
+    assert np.all(ancho <= 25.0 - 2 * (4.0 + 0.95) + 1e-9)
+
+
+def test_menor_exceso():
+    """La combinación elegida es la de menor As que cubre el requerido"""
+    indice = construir_indice_combinaciones(30.0)
+    requeridos = np.array([3.0, 7.9, 15.2, 22.0])
+    r = seleccionar_barras(requeridos, 30.0)
+    assert np.all(r['cumple'])
+    assert np.all(r['As_proporcionado'] >= requeridos)
+    for As_req, As_prop in zip(requeridos, r['As_proporcionado']):
+        assert not np.any((indice['As'] >= As_req) & (indice['As'] < As_prop))
+    assert np.isclose(seleccionar_barras(2 * AREAS[2], 30.0)['As_proporcionado'], 2 * AREAS[2])
+
+
+def test_fuera_de_rango():
+    """Un As imposible para el ancho se marca como NO CUMPLE"""
+    r = seleccionar_barras(500.0, 25.0)
+    assert not r['cumple']
+    assert r['descripcion'] == 'NO CUMPLE'
+
+
+def test_cien_mil_requerimientos():
+    """10⁵ requerimientos por segundo"""
+    rng = np.random.default_rng(1)
+    As = rng.uniform(2, 30, 100_000)
+    b = rng.choice([25.0, 30.0, 35.0, 40.0], 100_000)
+    inicio = time.time()
+    r = seleccionar_barras(As, b)
+    duracion = time.time() - inicio
+    assert duracion < 1.0
+    assert np.all(r['exceso'][r['cumple']] >= 0)
+    print(f"✅ 100000 requerimientos en {duracion * 1000:.0f} ms")
+
+
+def main():
+    """Ejecutar todas las pruebas"""
+    print("🧪 Pruebas del selector de barras")
+    test_indice_ordenado_y_factible()
+    print("✅ Índice ordenado y factible")
+    test_menor_exceso()
+    print("✅ Combinación de menor exceso")
+    test_fuera_de_rango()
+    print("✅ Requerimiento fuera de rango")
+    test_cien_mil_requerimientos()
+
+
+if __name__ == "__main__":
+    main()
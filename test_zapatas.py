@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Script de prueba para el diseño de zapatas aisladas y excéntricas
+"""
+
+import numpy as np
+
+from metrado_cargas import calcular_metrado_cargas
+from zapatas import CENTRADA, CONEXION, EXCENTRICA, cuadro_zapatas, disenar_zapatas, presion_neta
+
+
+def test_zapata_centrada():
+    """Zapata cuadrada mínima: la presión cumple y un paso menor ya no cumple"""
+    r = disenar_zapatas(60000, 25000, 210, 4200, 2.0, 40, 40)
+    sigma_n = presion_neta(2.0, 1.5)
+    assert r['cumple'][0] and r['Lx'][0] == r['By'][0]
+    assert np.isclose(r['sigma_max'][0], 85000 / (r['Lx'][0] * r['By'][0]))
+    assert r['sigma_max'][0] <= sigma_n
+    assert 85000 / (r['Lx'][0] - 10)**2 > sigma_n
+    # Peralte: el de la malla cumple punzonamiento y cortante; 10 cm menos no cumple
+    assert r['Vu_punzonamiento'][0] <= r['phiVc_punzonamiento'][0]
+    assert r['Vu_x'][0] <= r['phiVc_x'][0]
+    r = disenar_zapatas(250000, 100000, 280, 4200, 3.0, 60, 60)
+    assert r['cumple'][0] and r['hz'][0] > 50
+    menor = disenar_zapatas(250000, 100000, 280, 4200, 3.0, 60, 60, h_max=r['hz'][0] - 10)
+    assert not menor['cumple'][0]
+    assert r['As_x'][0] >= 0.0018 * r['By'][0] * r['hz'][0]
+
+
+def test_momento_y_lindero():
+    """El momento de servicio agranda la zapata; en lindero la viga de conexión toma la excentricidad"""
+    sin_momento = disenar_zapatas(60000, 25000, 210, 4200, 2.0, 40, 40)
+    con_momento = disenar_zapatas(60000, 25000, 210, 4200, 2.0, 40, 40, M_x=850000)
+    assert con_momento['Lx'][0] * con_momento['By'][0] > sin_momento['Lx'][0] * sin_momento['By'][0]
+
+    r = disenar_zapatas(60000, 25000, 210, 4200, 2.0, 40, 40, tipo=CONEXION, luz_conexion=600)
+    e = (r['Lx'][0] - 40) / 2
+    assert np.isclose(r['R_suelo'][0], 85000 * 600 / (600 - e))
+    assert np.isclose(r['reduccion_interior'][0], r['R_suelo'][0] - 85000)
+    assert np.isclose(r['sigma_max'][0], r['R_suelo'][0] / (r['Lx'][0] * r['By'][0]))
+    # Sin viga, la misma columna de lindero necesita mucha más área
+    sin_viga = disenar_zapatas(20000, 8000, 210, 4200, 2.0, 40, 40, tipo=EXCENTRICA, relacion_max=4)
+    con_viga = disenar_zapatas(20000, 8000, 210, 4200, 2.0, 40, 40, tipo=CONEXION, luz_conexion=600)
+    assert sin_viga['Lx'][0] * sin_viga['By'][0] > con_viga['Lx'][0] * con_viga['By'][0]
+
+
+def test_edificio_completo():
+    """Las zapatas de 110 columnas en una pasada coinciden con diseñarlas una por una"""
+    metrado = calcular_metrado_cargas([6] * 10, [5] * 9, 5, 600, 250)
+    PD, PL = metrado['P_muerta'][0], metrado['P_viva'][0]
+    tipo = np.where(metrado['tipo'] == 'interior', CENTRADA, CONEXION)
+    r = disenar_zapatas(PD, PL, 210, 4200, 2.0, 40, 40, tipo=tipo, luz_conexion=600)
+    assert r['Lx'].shape == (110,) and r['cumple'].all()
+    for k in (0, 5, 57):
+        una = disenar_zapatas(PD[k], PL[k], 210, 4200, 2.0, 40, 40, tipo=tipo[k], luz_conexion=600)
+        for clave in ('Lx', 'By', 'hz', 'As_x', 'As_y'):
+            assert np.isclose(una[clave][0], r[clave][k])
+    cuadro = cuadro_zapatas(r)
+    assert len(cuadro['Zapata']) == 110 and cuadro['Acero en x'][0].count('Ø') == 1
+
+
+def main():
+    """Ejecutar todas las pruebas"""
+    print("🧪 Pruebas de diseño de zapatas")
+    test_zapata_centrada()
+    test_momento_y_lindero()
+    test_edificio_completo()
+    print("✅ Todas las pruebas pasaron")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+"""
+Diseño de Zapatas Aisladas y Excéntricas - CONSORCIO DEJ
+Dimensiones en planta por presión admisible neta (con momentos de servicio), peralte
+por punzonamiento y cortante en una dirección, y acero por flexión en ambas direcciones
+(E.060 cap. 15 / ACI 318-2025 cap. 13), para todas las columnas en una sola pasada;
+incluye zapatas en lindero sin y con viga de conexión
+Unidades: kg, cm (presiones en kg/cm², momentos en kg·cm, Df en m)
+"""
+
+import numpy as np
+
+from diseno_estribos import PHI_CORTANTE
+from flexion_vectorizada import calcular_rho_requerido
+from seleccion_barras import AREAS, DESIGNACION, DIAMETROS
+
+CENTRADA = 0
+EXCENTRICA = 1  # Columna en lindero: la zapata solo se extiende hacia un lado en x
+CONEXION = 2  # Columna en lindero con viga de conexión a una columna interior
+
+TIPOS_ZAPATA = {CENTRADA: 'Centrada', EXCENTRICA: 'Excéntrica', CONEXION: 'Con viga de conexión'}
+CUANTIA_MINIMA_ZAPATA = 0.0018
+
+
+def presion_neta(sigma_adm, Df, gamma_promedio=2000.0, sobrecarga=0.0):
+    """σn = σadm - γprom·Df - s/c (kg/cm²), con γprom en kg/m³ y s/c en kg/m²"""
+    return sigma_adm - (gamma_promedio * Df + sobrecarga) / 1e4
+
+
+def resistencia_punzonamiento(fc, bo, d, beta, alfa_s):
+    """
+    φVc por punzonamiento (E.060 11.12.2.1): el menor de 0.53·(1 + 2/β), 0.27·(αs·d/bo + 2)
+    y 1.06, por √f'c·bo·d; αs = 40 interior, 30 borde, 20 esquina
+    """
+    vc = np.minimum(np.minimum(0.53 * (1 + 2 / beta), 0.27 * (alfa_s * d / bo + 2)), 1.06)
+    return PHI_CORTANTE * vc * np.sqrt(fc) * bo * d
+
+
+def _presion_maxima(P, Lx, By, ex, ey):
+    """
+    Presión máxima de servicio: trapecial dentro del núcleo central, triangular si la
+    excentricidad es solo en x y sale del núcleo; infinito si la zapata se levanta en
+    flexión biaxial o la resultante cae fuera de la zapata
+    """
+    k = 6 * ex / Lx + 6 * ey / By
+    trapecial = P / (Lx * By) * (1 + k)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        triangular = np.where(ex < Lx / 2, 2 * P / (3 * By * (Lx / 2 - ex)), np.inf)
+    return np.where(k <= 1, trapecial, np.where(ey == 0, triangular, np.inf))
+
+
+def disenar_zapatas(P_muerta, P_viva, fc, fy, sigma_adm, b_col, h_col, M_x=0.0, M_y=0.0, tipo=CENTRADA,
+                    luz_conexion=None, Df=1.5, gamma_promedio=2000.0, sobrecarga=0.0, barra=2,
+                    recubrimiento=7.5, volado_max=400.0, paso=5.0, relacion_max=2.0, h_min=50.0,
+                    h_max=200.0, s_max=30.0):
+    """
+    Diseño de las zapatas de todas las columnas a la vez
+
+    P_muerta, P_viva: Reacciones de servicio por columna (kg), p. ej. la fila 0 de
+    calcular_metrado_cargas; M_x, M_y: momentos de servicio (kg·cm) que excentrican en x e y
+    b_col, h_col: Dimensiones de la columna en y y en x (cm)
+    tipo: CENTRADA, EXCENTRICA o CONEXION por columna; luz_conexion: distancia entre ejes
+    de la columna de lindero y la interior (cm), requerida para CONEXION
+    barra: índice del catálogo de barras para las mallas inferiores
+    Las dimensiones se eligen de una malla de volados (paso cm) con la menor área en planta,
+    volados iguales si la zapata es centrada y sin momento, y lado mayor ≤ relacion_max·lado menor; el peralte, de una malla de 10 cm entre h_min y h_max
+    """
+    P_muerta, P_viva, b_col, h_col, M_x, M_y, tipo = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(v, dtype=float)) for v in (P_muerta, P_viva, b_col, h_col, M_x, M_y, tipo)))
+    tipo = tipo.astype(int)
+    n = len(P_muerta)
+    lindero = tipo != CENTRADA
+    conexion = tipo == CONEXION
+    if luz_conexion is None:
+        if np.any(conexion):
+            raise ValueError("luz_conexion es requerida para zapatas con viga de conexión")
+        luz_conexion = np.inf
+    luz = np.broadcast_to(np.asarray(luz_conexion, dtype=float), (n,))
+
+    P = P_muerta + P_viva
+    Pu = 1.2 * P_muerta + 1.6 * P_viva
+    sigma_n = presion_neta(sigma_adm, Df, gamma_promedio, sobrecarga)
+    ex0, ey0 = np.abs(M_x) / P, np.abs(M_y) / P
+
+    # 1. Malla de dimensiones en planta: en lindero la zapata crece solo hacia un lado
+    volado = np.arange(0.0, volado_max + paso / 2, paso)
+    vx = volado[None, :, None]
+    vy = volado[None, None, :]
+    col = (slice(None), None, None)
+    Lx = h_col[col] + np.where(lindero[col], 1, 2) * vx
+    By = b_col[col] + 2 * vy
+    e_lindero = np.where(lindero[col], (Lx - h_col[col]) / 2, 0.0)
+
+    # Sin viga, la excentricidad del lindero carga al suelo; con viga, la toma la viga y la
+    # reacción crece a R = P·ℓ/(ℓ - e)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        factor_R = np.where(conexion[col], luz[col] / (luz[col] - e_lindero), 1.0)
+    factor_R = np.where(factor_R > 0, factor_R, np.inf)
+    ex = ex0[col] + np.where(tipo[col] == EXCENTRICA, e_lindero, 0.0)
+    sigma = _presion_maxima(P[col] * factor_R, Lx, By, ex, ey0[col] * np.ones_like(By))
+    # Volados iguales en zapatas centradas sin momento; libres con momento o en lindero
+    forma_libre = lindero | (ex0 > 0) | (ey0 > 0)
+    forma = (vx == vy) | forma_libre[col]
+    forma = forma & (np.maximum(Lx, By) <= relacion_max * np.minimum(Lx, By))
+    area = np.where((sigma <= sigma_n) & forma, Lx * By, np.inf)
+
+    # Menor área; a igual área, el menor volado en x
+    mejor = np.argmin(area.reshape(n, -1), axis=1)
+    i, j = np.unravel_index(mejor, area.shape[1:])
+    filas = np.arange(n)
+    cumple_planta = np.isfinite(area.reshape(n, -1)[filas, mejor])
+    Lx, By = Lx[filas, i, 0], By[filas, 0, j]
+    sigma_max = sigma[filas, i, j]
+    factor_R = factor_R[filas, i, 0] * np.ones(n)
+    e_lindero = e_lindero[filas, i, 0] * np.ones(n)
+    R = P * factor_R
+
+    # 2. Presión última uniforme conservadora: σu = σmax·Pu/P
+    sigma_u = sigma_max * Pu / P
+    volado_x = np.where(lindero, Lx - h_col, (Lx - h_col) / 2)
+    volado_y = (By - b_col) / 2
+
+    # 3. Peralte por punzonamiento (3 caras en lindero) y cortante en una dirección
+    db = DIAMETROS[barra]
+    hz = np.arange(h_min, h_max + 5, 10.0)[None, :]
+    d = hz - recubrimiento - db
+    c = (slice(None), None)
+    lado_x = h_col[c] + np.where(lindero[c], d / 2, d)
+    lado_y = b_col[c] + d
+    bo = np.where(lindero[c], 2 * lado_x + lado_y, 2 * (lado_x + lado_y))
+    alfa_s = np.where(lindero[c], 30, 40)
+    beta = np.maximum(h_col, b_col) / np.minimum(h_col, b_col)
+    Vu_p = sigma_u[c] * np.maximum((Lx * By)[c] - lado_x * lado_y, 0)
+    phiVc_p = resistencia_punzonamiento(fc, bo, d, beta[c], alfa_s)
+    Vu_x = sigma_u[c] * By[c] * np.maximum(volado_x[c] - d, 0)
+    Vu_y = sigma_u[c] * Lx[c] * np.maximum(volado_y[c] - d, 0)
+    phiVc_x = PHI_CORTANTE * 0.53 * np.sqrt(fc) * By[c] * d
+    phiVc_y = PHI_CORTANTE * 0.53 * np.sqrt(fc) * Lx[c] * d
+    cumple_corte = (Vu_p <= phiVc_p) & (Vu_x <= phiVc_x) & (Vu_y <= phiVc_y)
+    k = np.where(cumple_corte.any(axis=1), np.argmax(cumple_corte, axis=1), hz.shape[1] - 1)
+    cumple_peralte = cumple_corte[filas, k]
+    hz, d = hz[0, k], d[0, k]
+
+    def elegido(valor):
+        return valor[filas, k]
+
+    # 4. Flexión en la cara de la columna en ambas direcciones (malla inferior)
+    Mu_x = sigma_u * By * volado_x**2 / 2
+    Mu_y = sigma_u * Lx * volado_y**2 / 2
+    resultado_acero = {}
+    for eje, Mu, ancho in (('x', Mu_x, By), ('y', Mu_y, Lx)):
+        rho, existe = calcular_rho_requerido(fc, fy, ancho, d, Mu)
+        As = np.maximum(np.where(existe, rho, np.nan) * ancho * d, CUANTIA_MINIMA_ZAPATA * ancho * hz)
+        libre = ancho - 2 * recubrimiento - db
+        n_barras = np.maximum(np.ceil(As / AREAS[barra]), np.ceil(libre / s_max) + 1)
+        n_barras = np.where(np.isfinite(n_barras), n_barras, 0).astype(int)
+        resultado_acero[eje] = {
+            'Mu': Mu, 'As': As, 'n_barras': n_barras,
+            's': np.where(n_barras > 1, libre / np.maximum(n_barras - 1, 1), np.nan),
+            'cumple': existe,
+        }
+
+    # 5. Viga de conexión: Mu = Ru·e en la columna de lindero y alivio de la columna interior
+    M_viga = np.where(conexion, Pu * factor_R * e_lindero, 0.0)
+
+    return {
+        'tipo': tipo,
+        'Lx': Lx,
+        'By': By,
+        'hz': hz,
+        'd': d,
+        'sigma_neta': sigma_n * np.ones(n),
+        'sigma_max': sigma_max,
+        'sigma_u': sigma_u,
+        'R_suelo': R,
+        'excentricidad_lindero': e_lindero,
+        'Vu_punzonamiento': elegido(Vu_p),
+        'phiVc_punzonamiento': elegido(phiVc_p),
+        'Vu_x': elegido(Vu_x),
+        'phiVc_x': elegido(phiVc_x),
+        'Vu_y': elegido(Vu_y),
+        'phiVc_y': elegido(phiVc_y),
+        'Mu_x': Mu_x,
+        'As_x': resultado_acero['x']['As'],
+        'n_barras_x': resultado_acero['x']['n_barras'],
+        's_x': resultado_acero['x']['s'],
+        'Mu_y': Mu_y,
+        'As_y': resultado_acero['y']['As'],
+        'n_barras_y': resultado_acero['y']['n_barras'],
+        's_y': resultado_acero['y']['s'],
+        'M_viga_conexion': M_viga,
+        'reduccion_interior': np.where(conexion, R - P, 0.0),
+        'barra': np.full(n, barra),
+        'cumple': cumple_planta & cumple_peralte & resultado_acero['x']['cumple'] & resultado_acero['y']['cumple'],
+    }
+
+
+def cuadro_zapatas(resultado, etiquetas=None):
+    """
+    Cuadro de zapatas como diccionario de columnas (listo para pd.DataFrame):
+    dimensiones en m y mallas en la forma "n Ø 5/8\" @ s cm"
+    """
+    n = len(resultado['Lx'])
+    etiquetas = [f"Z-{k + 1}" for k in range(n)] if etiquetas is None else list(etiquetas)
+    designacion = np.char.add(DESIGNACION[resultado['barra']], '"').astype(object)
+
+    def malla(eje):
+        return (resultado[f'n_barras_{eje}'].astype(str).astype(object) + ' Ø ' + designacion + ' @ '
+                + np.char.mod('%.1f', resultado[f's_{eje}']).astype(object) + ' cm')
+
+    return {
+        'Zapata': etiquetas,
+        'Tipo': [TIPOS_ZAPATA[t] for t in resultado['tipo']],
+        'Lx (m)': np.round(resultado['Lx'] / 100, 2),
+        'By (m)': np.round(resultado['By'] / 100, 2),
+        'hz (m)': np.round(resultado['hz'] / 100, 2),
+        'Acero en x': malla('x'),
+        'Acero en y': malla('y'),
+        'Estado': np.where(resultado['cumple'], 'CUMPLE', 'NO CUMPLE'),
+    }